@@ -0,0 +1,241 @@
+# backend/backend/metrics.py
+"""
+A small in-process metrics registry with counters and histograms, served
+in the Prometheus text format at /metrics.
+
+Each process keeps its metrics in memory, so recording a value is a dict
+update under a lock. When METRICS_MULTIPROCESS_DIR is set (any deployment
+with more than one worker process), each process also writes a snapshot of
+its metrics to a file in that directory, at most every
+METRICS_FLUSH_INTERVAL seconds, and /metrics adds up the snapshots of every
+process. Snapshots of exited workers are kept so counters never go down;
+empty the directory when the service is (re)started.
+"""
+import atexit
+import glob
+import json
+import math
+import os
+import tempfile
+import threading
+import time
+from bisect import bisect_left
+from django.conf import settings
+from django.http import HttpResponse
+from django.utils.crypto import constant_time_compare
+
+# Upper bounds, in seconds, of the default latency histogram buckets
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+
+class Registry:
+    def __init__(self):
+        self.metrics = {}
+        self.lock = threading.Lock()
+        self.last_flush = 0.0
+
+    def register(self, metric):
+        if metric.name in self.metrics:
+            raise ValueError(f"Metric {metric.name} is already registered.")
+        self.metrics[metric.name] = metric
+
+    def snapshot(self):
+        """
+        Returns every metric as a JSON-serialisable dict, keyed by name.
+        """
+        with self.lock:
+            return {name: metric.snapshot() for name, metric in self.metrics.items()}
+
+    def maybe_flush(self):
+        directory = getattr(settings, 'METRICS_MULTIPROCESS_DIR', None)
+        interval = getattr(settings, 'METRICS_FLUSH_INTERVAL', 5)
+        if directory and time.monotonic() - self.last_flush >= interval:
+            self.flush(directory)
+
+    def flush(self, directory):
+        """
+        Atomically replaces this process's snapshot file in `directory`.
+        """
+        self.last_flush = time.monotonic()
+        data = self.snapshot()
+        fd, temp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        with os.fdopen(fd, 'w') as file:
+            json.dump(data, file)
+        os.replace(temp_path, os.path.join(directory, f'metrics_{os.getpid()}.json'))
+
+
+registry = Registry()
+
+
+@atexit.register
+def flush_on_exit():
+    directory = getattr(settings, 'METRICS_MULTIPROCESS_DIR', None)
+    if directory and registry.metrics:
+        registry.flush(directory)
+
+
+class Metric:
+    kind = None
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.values = {}  # Tuple of label values -> value
+        registry.register(self)
+
+    def key(self, labels):
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def snapshot(self):
+        return {
+            'kind': self.kind,
+            'help': self.documentation,
+            'labelnames': self.labelnames,
+            'samples': [[list(key), value] for key, value in self.values.items()],
+        }
+
+
+class Counter(Metric):
+    kind = 'counter'
+
+    def inc(self, amount=1, **labels):
+        key = self.key(labels)
+        with registry.lock:
+            self.values[key] = self.values.get(key, 0) + amount
+        registry.maybe_flush()
+
+
+class Histogram(Metric):
+    """
+    Stores, per label set, [bucket counts, sum, count]. The bucket counts
+    are not cumulative and end with the +Inf bucket.
+    """
+    kind = 'histogram'
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        super().__init__(name, documentation, labelnames)
+
+    def observe(self, value, **labels):
+        key = self.key(labels)
+        index = bisect_left(self.buckets, value)
+        with registry.lock:
+            state = self.values.get(key)
+            if state is None:
+                state = self.values[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            state[0][index] += 1
+            state[1] += value
+            state[2] += 1
+        registry.maybe_flush()
+
+    def snapshot(self):
+        data = super().snapshot()
+        # Copy the mutable state so the snapshot does not change after the lock is released
+        data['samples'] = [[labels, [list(counts), total, count]] for labels, (counts, total, count) in data['samples']]
+        data['buckets'] = self.buckets
+        return data
+
+
+def merge(snapshots):
+    """
+    Adds up the snapshots of several processes. Samples are keyed by the
+    tuple of their label values in the result.
+    """
+    merged = {}
+    for snapshot in snapshots:
+        for name, data in snapshot.items():
+            target = merged.setdefault(name, {**data, 'samples': {}})
+            for labels, value in data['samples']:
+                key = tuple(labels)
+                current = target['samples'].get(key)
+                if current is None:
+                    target['samples'][key] = value
+                elif data['kind'] == 'counter':
+                    target['samples'][key] = current + value
+                else:
+                    counts, total, count = current
+                    target['samples'][key] = [[a + b for a, b in zip(counts, value[0])], total + value[1], count + value[2]]
+    return merged
+
+
+def collect():
+    """
+    Returns the merged metrics of this process, or of every process in
+    multiprocess mode.
+    """
+    directory = getattr(settings, 'METRICS_MULTIPROCESS_DIR', None)
+    if not directory:
+        return merge([registry.snapshot()])
+    registry.flush(directory)
+    snapshots = []
+    for path in glob.glob(os.path.join(directory, 'metrics_*.json')):
+        try:
+            with open(path) as file:
+                snapshots.append(json.load(file))
+        except (OSError, ValueError):
+            continue  # Replaced or removed while we were reading it
+    return merge(snapshots)
+
+
+def escape(value):
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def format_labels(pairs):
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{name}="{escape(value)}"' for name, value in pairs) + '}'
+
+
+def format_bound(bound):
+    return '+Inf' if bound == math.inf else repr(float(bound))
+
+
+def render(metrics):
+    """
+    Formats merged metrics in the Prometheus text exposition format.
+    """
+    lines = []
+    for name in sorted(metrics):
+        data = metrics[name]
+        lines.append(f"# HELP {name} {data['help']}")
+        lines.append(f"# TYPE {name} {data['kind']}")
+        for key, value in sorted(data['samples'].items()):
+            labels = list(zip(data['labelnames'], key))
+            if data['kind'] == 'counter':
+                lines.append(f'{name}{format_labels(labels)} {value}')
+                continue
+            counts, total, count = value
+            cumulative = 0
+            for bound, bucket_count in zip([*data['buckets'], math.inf], counts):
+                cumulative += bucket_count
+                lines.append(f"{name}_bucket{format_labels(labels + [('le', format_bound(bound))])} {cumulative}")
+            lines.append(f'{name}_sum{format_labels(labels)} {total}')
+            lines.append(f'{name}_count{format_labels(labels)} {count}')
+    return '\n'.join(lines) + '\n'
+
+
+def metrics_view(request):
+    """
+    Serves the metrics to a Prometheus scraper, which must send
+    METRICS_AUTH_TOKEN as a bearer token. Without a token the endpoint is
+    only open when DEBUG is on.
+    """
+    token = getattr(settings, 'METRICS_AUTH_TOKEN', None)
+    if not token:
+        if not settings.DEBUG:
+            return HttpResponse(status=403)
+    elif not constant_time_compare(request.headers.get('Authorization', ''), f'Bearer {token}'):
+        return HttpResponse(status=401)
+    return HttpResponse(render(collect()), content_type='text/plain; version=0.0.4; charset=utf-8')
+
+
+# Request metrics, recorded by backend.profiling.ProfilingMiddleware
+REQUESTS = Counter('http_requests_total', 'Requests handled, by URL name, method and status code.', ['view', 'method', 'status'])
+REQUEST_LATENCY = Histogram('http_request_duration_seconds', 'Time spent handling a request, by URL name.', ['view', 'method'])
+REQUEST_DB_QUERIES = Histogram(
+    'http_request_db_queries', 'Database queries run per request, by URL name.', ['view'],
+    buckets=(0, 1, 2, 5, 10, 20, 50, 100, 200, 500),
+)
+REQUEST_DB_LATENCY = Histogram('http_request_db_duration_seconds', 'Time spent in database queries per request, by URL name.', ['view'])
@@ -0,0 +1,164 @@
+# backend/backend/profiling.py
+"""
+Per-request profiling: wall time, database query count and database time
+for every request, recorded in the request metrics (backend/metrics.py).
+Sampled requests are also logged as one JSON line to the
+'backend.profiling' logger when they are slow or repeat the same query many
+times (the N+1 pattern).
+
+Queries are traced by an execute wrapper installed on every database
+connection. It reports to the profile stored in a context variable, which
+asgiref carries into sync_to_async threads, so the async chatbot views
+are covered as well.
+
+Clients can send `X-Profile: 1` to get a Server-Timing header back, when
+PROFILING_SERVER_TIMING is enabled.
+"""
+import json
+import logging
+import random
+import time
+from collections import Counter
+from contextvars import ContextVar
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+from . import metrics
+
+logger = logging.getLogger('backend.profiling')
+
+# The profile of the request being handled, if it is sampled
+current_profile = ContextVar('current_profile', default=None)
+
+# How many duplicate-query patterns a log record lists at most
+MAX_REPORTED_DUPLICATES = 5
+
+
+class RequestProfile:
+    def __init__(self, sampled=True):
+        self.started = time.perf_counter()
+        self.sampled = sampled  # Only sampled requests keep the SQL of each query
+        self.queries = Counter()  # SQL (with placeholders) -> times run
+        self.query_count = 0
+        self.db_seconds = 0.0
+
+    def record_query(self, sql, seconds):
+        if self.sampled:
+            self.queries[sql] += 1
+        self.query_count += 1
+        self.db_seconds += seconds
+
+    def duplicates(self, threshold):
+        """
+        Returns [(sql, count)] for statements run at least `threshold` times,
+        most repeated first.
+        """
+        return [(sql, count) for sql, count in self.queries.most_common(MAX_REPORTED_DUPLICATES) if count >= threshold]
+
+
+def trace_query(execute, sql, params, many, context):
+    profile = current_profile.get()
+    if profile is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        profile.record_query(sql, time.perf_counter() - started)
+
+
+def install_query_tracer(connection, **kwargs):
+    if trace_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(trace_query)
+
+
+connection_created.connect(install_query_tracer)
+
+
+class ProfilingMiddleware:
+    """
+    Records the request metrics for every request, and profiles in detail a
+    PROFILING_SAMPLE_RATE share of requests, plus every request that asks for
+    Server-Timing.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.sample_rate = getattr(settings, 'PROFILING_SAMPLE_RATE', 1.0)
+        self.slow_ms = getattr(settings, 'PROFILING_SLOW_REQUEST_MS', 500)
+        self.duplicate_threshold = getattr(settings, 'PROFILING_DUPLICATE_QUERY_THRESHOLD', 5)
+        self.server_timing = getattr(settings, 'PROFILING_SERVER_TIMING', False)
+        # Connections opened before this middleware was loaded missed the signal
+        for connection in connections.all(initialized_only=True):
+            install_query_tracer(connection)
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        profile = self.start(request)
+        token = current_profile.set(profile)
+        try:
+            response = self.get_response(request)
+        finally:
+            current_profile.reset(token)
+        self.finish(request, response, profile)
+        return response
+
+    async def __acall__(self, request):
+        profile = self.start(request)
+        token = current_profile.set(profile)
+        try:
+            response = await self.get_response(request)
+        finally:
+            current_profile.reset(token)
+        self.finish(request, response, profile)
+        return response
+
+    def wants_server_timing(self, request):
+        return self.server_timing and request.headers.get('X-Profile') == '1'
+
+    def start(self, request):
+        return RequestProfile(sampled=self.wants_server_timing(request) or random.random() < self.sample_rate)
+
+    def finish(self, request, response, profile):
+        # For streaming responses this covers the time until the body starts
+        total_seconds = time.perf_counter() - profile.started
+        match = getattr(request, 'resolver_match', None)
+        view = match.view_name if match else 'unmatched'
+        metrics.REQUESTS.inc(view=view, method=request.method, status=response.status_code)
+        metrics.REQUEST_LATENCY.observe(total_seconds, view=view, method=request.method)
+        metrics.REQUEST_DB_QUERIES.observe(profile.query_count, view=view)
+        metrics.REQUEST_DB_LATENCY.observe(profile.db_seconds, view=view)
+        if not profile.sampled:
+            return
+
+        total_ms = total_seconds * 1000
+        db_ms = profile.db_seconds * 1000
+        duplicates = profile.duplicates(self.duplicate_threshold)
+
+        if self.wants_server_timing(request):
+            response['Server-Timing'] = (
+                f'app;dur={total_ms - db_ms:.1f}, '
+                f'db;dur={db_ms:.1f};desc="{profile.query_count} queries", '
+                f'total;dur={total_ms:.1f}'
+            )
+
+        if total_ms < self.slow_ms and not duplicates:
+            return
+        record = {
+            'event': 'slow_request' if total_ms >= self.slow_ms else 'duplicate_queries',
+            'method': request.method,
+            'path': request.path,
+            'view': view,
+            'status': response.status_code,
+            'duration_ms': round(total_ms, 1),
+            'db_queries': profile.query_count,
+            'db_ms': round(db_ms, 1),
+            'duplicate_queries': [{'sql': sql, 'count': count} for sql, count in duplicates],
+        }
+        logger.warning(json.dumps(record))
@@ -0,0 +1,131 @@
+# backend/backend/response_cache.py
+"""
+Cache for the serialized GET responses of read-mostly endpoints, kept in
+the 'responses' cache alias (see CACHES in settings).
+
+Entries are keyed by the request URL and query parameters plus the current
+version of every scope the response depends on: 'institutions', 'events',
+'jobs', or 'user:<pk>' for one user. The model signals bump the version of
+a scope when its data changes, so later requests miss the stale entries,
+which then expire on their own. Each entry carries an ETag, so a client
+sending a matching If-None-Match gets a 304 without a body.
+"""
+import hashlib
+import json
+import time
+from django.core.cache import caches
+from django.db import transaction
+from django.utils.http import parse_etags
+from rest_framework import status
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+
+CACHE_ALIAS = 'responses'
+
+
+def user_scope(pk):
+    return f'user:{pk}'
+
+
+def version_key(scope):
+    return f'version:{scope}'
+
+
+def get_versions(scopes):
+    """
+    Returns the current version of each scope. A scope without a version
+    (never changed, or evicted) starts at the current time, so it can never
+    go back to a version that old entries were stored under.
+    """
+    cache = caches[CACHE_ALIAS]
+    keys = [version_key(scope) for scope in scopes]
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            cache.add(key, time.time_ns(), timeout=None)
+            versions[key] = cache.get(key)
+    return [versions[key] for key in keys]
+
+
+def bump_versions(scopes):
+    cache = caches[CACHE_ALIAS]
+    for scope in scopes:
+        try:
+            cache.incr(version_key(scope))
+        except ValueError:
+            pass  # No version, so nothing is cached under the current one
+
+
+def invalidate(*scopes):
+    """
+    Makes every cached response that depends on one of the scopes stale.
+    Inside a transaction the versions are bumped again on commit, since a
+    response built in between would still have read the old data.
+    """
+    bump_versions(scopes)
+    transaction.on_commit(lambda: bump_versions(scopes))
+
+
+def response_key(request, scopes):
+    query = sorted(request.query_params.lists())
+    identity = [request.build_absolute_uri(request.path), query, list(scopes), get_versions(scopes)]
+    digest = hashlib.sha256(json.dumps(identity, separators=(',', ':')).encode()).hexdigest()
+    return f'response:{digest}'
+
+
+def make_etag(data):
+    return '"%s"' % hashlib.md5(JSONRenderer().render(data), usedforsecurity=False).hexdigest()
+
+
+def etag_matches(request, etag):
+    sent = parse_etags(request.headers.get('If-None-Match', ''))
+    # If-None-Match uses weak comparison
+    return '*' in sent or any(value.removeprefix('W/') == etag for value in sent)
+
+
+def conditional_response(request, etag, make_response):
+    """
+    Returns a 304 if the request's If-None-Match matches `etag`, otherwise
+    the Response from make_response(), which is only called then.
+    """
+    if etag_matches(request, etag):
+        response = Response(status=status.HTTP_304_NOT_MODIFIED)
+    else:
+        response = make_response()
+    response['ETag'] = etag
+    # Browsers keep the body but revalidate it on every use
+    response['Cache-Control'] = 'private, no-cache'
+    return response
+
+
+class CachedResponseMixin:
+    """
+    Caches the GET response of a DRF view whose data is the same for every
+    user allowed to see it. Authentication and permissions still run on
+    every request. Set `cache_scopes`, or override get_cache_scopes() when
+    the scopes depend on the URL, and override get_response_etag() when
+    the view has a cheaper version stamp than hashing the data.
+    """
+    cache_scopes = ()
+
+    def get_cache_scopes(self):
+        return self.cache_scopes
+
+    def get_response_etag(self, data):
+        return make_etag(data)
+
+    def get(self, request, *args, **kwargs):
+        cache = caches[CACHE_ALIAS]
+        # Versions are read before the database, so a write made while the
+        # response is built bumps them past the key it is stored under
+        key = response_key(request, self.get_cache_scopes())
+        entry = cache.get(key)
+        if entry is None:
+            response = super().get(request, *args, **kwargs)
+            if response.status_code != status.HTTP_200_OK:
+                return response
+            entry = (self.get_response_etag(response.data), response.data)
+            cache.set(key, entry)
+
+        etag, data = entry
+        return conditional_response(request, etag, lambda: Response(data))
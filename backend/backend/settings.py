@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
+import os
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -45,6 +46,7 @@ INSTALLED_APPS = [
     'chatbot',
     'mentorship',
     'institutions',
+    'benchmarks',
 
     # Third-party apps
     'rest_framework',
@@ -52,6 +54,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'backend.profiling.ProfilingMiddleware',  # First, so it times everything below
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'corsheaders.middleware.CorsMiddleware',  # <-- ADD THIS LINE
@@ -85,11 +88,86 @@ WSGI_APPLICATION = 'backend.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 
-DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
+# SQLite is the default for development. Set DB_ENGINE=postgresql (and the
+# POSTGRES_* variables) in production, where concurrent writes would
+# otherwise queue behind SQLite's single writer lock.
+
+DB_ENGINE = os.environ.get('DB_ENGINE', 'sqlite3')
+
+if DB_ENGINE == 'postgresql':
+    # DB_POOL_MAX_SIZE > 0 uses psycopg's connection pool (needs psycopg[pool]);
+    # otherwise connections are kept open for DB_CONN_MAX_AGE seconds.
+    DB_POOL_MAX_SIZE = int(os.environ.get('DB_POOL_MAX_SIZE', '0'))
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.postgresql',
+            'NAME': os.environ.get('POSTGRES_DB', 'alumni_connect'),
+            'USER': os.environ.get('POSTGRES_USER', 'postgres'),
+            'PASSWORD': os.environ.get('POSTGRES_PASSWORD', ''),
+            'HOST': os.environ.get('POSTGRES_HOST', 'localhost'),
+            'PORT': os.environ.get('POSTGRES_PORT', '5432'),
+            # Pooled connections are returned to the pool after each request instead
+            'CONN_MAX_AGE': 0 if DB_POOL_MAX_SIZE else int(os.environ.get('DB_CONN_MAX_AGE', '60')),
+            'CONN_HEALTH_CHECKS': True,
+            'OPTIONS': {
+                'pool': {
+                    'min_size': int(os.environ.get('DB_POOL_MIN_SIZE', '2')),
+                    'max_size': DB_POOL_MAX_SIZE,
+                    'timeout': int(os.environ.get('DB_POOL_TIMEOUT', '10')),
+                },
+            } if DB_POOL_MAX_SIZE else {},
+        }
     }
+else:
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': BASE_DIR / 'db.sqlite3',
+            'OPTIONS': {
+                # WAL lets reads continue while a write is in progress
+                'init_command': 'PRAGMA journal_mode=WAL; PRAGMA synchronous=NORMAL;',
+                # Seconds a writer waits for the lock before "database is locked"
+                'timeout': 20,
+                # Take the write lock when the transaction starts, so two
+                # transactions cannot deadlock upgrading from read to write
+                'transaction_mode': 'IMMEDIATE',
+            },
+        }
+    }
+
+
+# Caches
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+# Local memory by default: each process has its own caches, and
+# LocMemCache evicts least-recently-used entries once MAX_ENTRIES is reached.
+# With more than one worker process, point CACHE_BACKEND and CACHE_LOCATION
+# at a shared cache (e.g. django.core.cache.backends.redis.RedisCache and
+# redis://host:6379/0); otherwise one worker's response cache invalidation
+# does not reach the others.
+
+CACHE_BACKEND = os.environ.get('CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache')
+CACHE_LOCATION = os.environ.get('CACHE_LOCATION', '')
+
+
+def cache_alias(name, timeout=300, max_entries=None):
+    if CACHE_BACKEND.endswith('LocMemCache'):
+        options = {'MAX_ENTRIES': max_entries} if max_entries else {}
+        return {'BACKEND': CACHE_BACKEND, 'LOCATION': name, 'TIMEOUT': timeout, 'OPTIONS': options}
+    # The aliases share one server, so keep their keys apart
+    return {'BACKEND': CACHE_BACKEND, 'LOCATION': CACHE_LOCATION, 'TIMEOUT': timeout, 'KEY_PREFIX': name}
+
+
+CACHES = {
+    'default': cache_alias('default'),
+    # Chatbot intents and answers, keyed by the normalized conversation
+    'chatbot': cache_alias('chatbot', timeout=15 * 60, max_entries=5000),
+    # Serialized responses of read-mostly endpoints (backend/response_cache.py).
+    # Entries are invalidated by signals; the timeout only bounds how long
+    # time-dependent lists (upcoming events) can lag behind the clock.
+    'responses': cache_alias('responses', timeout=60, max_entries=10000),
+    # Users resolved from JWTs (users/authentication.py); kept briefly, since
+    # with local memory a save in one worker does not evict it in the others
+    'auth': cache_alias('auth', timeout=60, max_entries=10000),
 }
 
 
@@ -111,6 +189,26 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# Set-password links for new accounts (users/invitations.py) are valid this long
+PASSWORD_RESET_TIMEOUT = 7 * 24 * 60 * 60
+
+
+# Email
+# https://docs.djangoproject.com/en/5.2/topics/email/
+# Printed to the console unless EMAIL_BACKEND is set, e.g. to
+# django.core.mail.backends.smtp.EmailBackend with the EMAIL_* variables.
+
+EMAIL_BACKEND = os.environ.get('EMAIL_BACKEND', 'django.core.mail.backends.console.EmailBackend')
+EMAIL_HOST = os.environ.get('EMAIL_HOST', 'localhost')
+EMAIL_PORT = int(os.environ.get('EMAIL_PORT', '587'))
+EMAIL_HOST_USER = os.environ.get('EMAIL_HOST_USER', '')
+EMAIL_HOST_PASSWORD = os.environ.get('EMAIL_HOST_PASSWORD', '')
+EMAIL_USE_TLS = os.environ.get('EMAIL_USE_TLS', '1') == '1'
+DEFAULT_FROM_EMAIL = os.environ.get('DEFAULT_FROM_EMAIL', 'no-reply@punjab-alumni-connect.in')
+
+# Base URL of the Next.js frontend, for links in emails
+FRONTEND_URL = os.environ.get('FRONTEND_URL', 'http://localhost:3000')
+
 
 # Internationalization
 # https://docs.djangoproject.com/en/5.2/topics/i18n/
@@ -139,7 +237,7 @@ AUTH_USER_MODEL = 'users.User'
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'users.authentication.CachedJWTAuthentication',
     )
 }
 
@@ -150,3 +248,43 @@ CORS_ALLOWED_ORIGINS = [
 
 # GOOGLE AI CONFIGURATION
 GOOGLE_API_KEY = "YOUR_GOOGLE_API_KEY" # <-- PASTE YOUR KEY HERE
+# Per-process cap on concurrent Gemini calls, and the timeout (seconds) for each wait
+CHATBOT_LLM_MAX_CONCURRENCY = 32
+CHATBOT_LLM_TIMEOUT = 30
+# Conversation history sent to the LLM: at most this many recent messages,
+# plus a running summary, within this many (estimated) tokens
+CHATBOT_HISTORY_WINDOW = 10
+CHATBOT_HISTORY_TOKEN_BUDGET = 1500
+# Seconds the summary of older messages may take before it falls back to truncation
+CHATBOT_SUMMARY_TIMEOUT = 5
+
+# REQUEST PROFILING (backend/profiling.py)
+# Share of requests profiled; slow or N+1-looking ones are logged as JSON
+PROFILING_SAMPLE_RATE = float(os.environ.get('PROFILING_SAMPLE_RATE', '1.0' if DEBUG else '0.1'))
+PROFILING_SLOW_REQUEST_MS = int(os.environ.get('PROFILING_SLOW_REQUEST_MS', '500'))
+# The same SQL statement run this many times in one request is flagged
+PROFILING_DUPLICATE_QUERY_THRESHOLD = 5
+# Lets clients request a Server-Timing header with "X-Profile: 1"
+PROFILING_SERVER_TIMING = DEBUG or os.environ.get('PROFILING_SERVER_TIMING') == '1'
+
+# METRICS (backend/metrics.py)
+# Set METRICS_MULTIPROCESS_DIR to a directory shared by the worker processes
+# whenever more than one runs; /metrics then reports all of them.
+METRICS_MULTIPROCESS_DIR = os.environ.get('METRICS_MULTIPROCESS_DIR') or None
+METRICS_FLUSH_INTERVAL = 5  # Seconds between a worker's snapshot writes
+# Bearer token the scraper sends; without one /metrics is refused unless DEBUG is on
+METRICS_AUTH_TOKEN = os.environ.get('METRICS_AUTH_TOKEN') or None
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'formatters': {
+        'plain': {'format': '%(asctime)s %(levelname)s %(name)s %(message)s'},
+    },
+    'handlers': {
+        'console': {'class': 'logging.StreamHandler', 'formatter': 'plain'},
+    },
+    'loggers': {
+        'backend.profiling': {'handlers': ['console'], 'level': 'INFO', 'propagate': False},
+    },
+}
@@ -0,0 +1,74 @@
+import json
+import tempfile
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+from backend import metrics
+from users.models import User
+
+
+@override_settings(PROFILING_SAMPLE_RATE=1.0, PROFILING_SERVER_TIMING=True, PROFILING_SLOW_REQUEST_MS=60000)
+class ProfilingMiddlewareTests(TestCase):
+    url = '/api/users/me/'
+
+    def setUp(self):
+        self.client = APIClient()
+        user = User.objects.create_user('alumnus', role='alumni', is_approved=True)
+        self.client.force_authenticate(User.objects.get(pk=user.pk))  # Profile not cached
+
+    def test_server_timing_on_request(self):
+        self.assertNotIn('Server-Timing', self.client.get(self.url))
+        response = self.client.get(self.url, HTTP_X_PROFILE='1')
+        self.assertRegex(response['Server-Timing'], r'^app;dur=[\d.]+, db;dur=[\d.]+;desc="\d+ queries", total;dur=[\d.]+$')
+
+    @override_settings(PROFILING_DUPLICATE_QUERY_THRESHOLD=1)
+    def test_logs_repeated_queries(self):
+        with self.assertLogs('backend.profiling', 'WARNING') as logs:
+            self.client.get(self.url)
+        record = json.loads(logs.records[0].getMessage())
+        self.assertEqual(record['event'], 'duplicate_queries')
+        self.assertEqual(record['view'], 'auth_me')
+        self.assertTrue(record['duplicate_queries'])
+
+
+@override_settings(METRICS_AUTH_TOKEN='secret')
+class MetricsTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(User.objects.create_user('alumnus', role='alumni', is_approved=True))
+
+    def scrape(self):
+        response = self.client.get('/metrics', HTTP_AUTHORIZATION='Bearer secret')
+        self.assertEqual(response['Content-Type'], 'text/plain; version=0.0.4; charset=utf-8')
+        return response.content.decode()
+
+    def sample(self, text, line_start):
+        return next(float(line.rsplit(' ', 1)[1]) for line in text.splitlines() if line.startswith(line_start))
+
+    def test_records_requests_per_url_name(self):
+        before = self.scrape()
+        self.client.get('/api/users/me/')
+        after = self.scrape()
+        name = 'http_requests_total{view="auth_me",method="GET",status="200"}'
+        self.assertEqual(self.sample(after, name) - (self.sample(before, name) if name in before else 0), 1)
+        self.assertIn('# TYPE http_request_duration_seconds histogram', after)
+        self.assertIn('http_request_db_queries_bucket{view="auth_me",le="+Inf"}', after)
+
+    def test_multiprocess_mode_adds_up_every_process(self):
+        with tempfile.TemporaryDirectory() as directory, override_settings(METRICS_MULTIPROCESS_DIR=directory):
+            self.client.get('/api/users/me/')
+            own = self.sample(self.scrape(), 'http_requests_total{view="auth_me"')
+            # Another worker's snapshot
+            other = {'http_requests_total': {**metrics.REQUESTS.snapshot(), 'samples': [[['auth_me', 'GET', '200'], 3]]}}
+            with open(f'{directory}/metrics_0.json', 'w') as file:
+                json.dump(other, file)
+            self.assertEqual(self.sample(self.scrape(), 'http_requests_total{view="auth_me"'), own + 3)
+
+    def test_auth_token(self):
+        self.assertEqual(self.client.get('/metrics').status_code, 401)
+        self.assertEqual(self.client.get('/metrics', HTTP_AUTHORIZATION='Bearer secret').status_code, 200)
+
+    @override_settings(METRICS_AUTH_TOKEN=None)
+    def test_refused_without_a_token_unless_debug(self):
+        self.assertEqual(self.client.get('/metrics').status_code, 403)
+        with override_settings(DEBUG=True):
+            self.assertEqual(self.client.get('/metrics').status_code, 200)
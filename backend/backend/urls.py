@@ -17,6 +17,7 @@ Including another URLconf
 # backend/backend/urls.py
 from django.contrib import admin
 from django.urls import path, include
+from backend.metrics import metrics_view
 from rest_framework_simplejwt.views import (
     TokenObtainPairView,
     TokenRefreshView,
@@ -37,4 +38,6 @@ urlpatterns = [
     path('api/token/', TokenObtainPairView.as_view(), name='token_obtain_pair'),
     # This URL is to get a new access token using a refresh token
     path('api/token/refresh/', TokenRefreshView.as_view(), name='token_refresh'),
+    # Prometheus scrape endpoint (backend/metrics.py)
+    path('metrics', metrics_view, name='metrics'),
 ]
@@ -0,0 +1,316 @@
+# backend/benchmarks/management/commands/benchmark_api.py
+import json
+import statistics
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone as dt_timezone
+from typing import Callable
+from asgiref.sync import async_to_sync
+from django.core.cache import caches
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext, setup_test_environment, teardown_test_environment
+from django.urls import URLPattern, URLResolver, get_resolver, resolve, reverse
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+from backend import response_cache
+from benchmarks.seed import Scale, SEED_PASSWORD, seed_dataset
+from events.models import Event
+from institutions.models import Institution
+from jobs.models import Job
+from mentorship.models import ConnectionInfo, MentorshipRequest
+from users.models import User
+
+
+@dataclass
+class Endpoint:
+    """
+    One benchmarked request. `kwargs` and `data` are built from the seeded
+    fixtures; `user` is the fixture account the request is sent as.
+    """
+    name: str
+    method: str = 'get'
+    user: str = 'student'
+    kwargs: Callable = field(default=lambda fx: {})
+    data: Callable = field(default=lambda fx: None)
+    query: str = ''
+    format: str = 'json'
+
+
+ENDPOINTS = [
+    # users
+    Endpoint('auth_register', 'post', user=None, data=lambda fx: {
+        'username': 'bench_new_user', 'email': 'new@example.com', 'password': SEED_PASSWORD, 'role': 'student',
+        'profile': {'skills': 'python, django'},
+    }),
+    Endpoint('set_password', 'post', user=None, data=lambda fx: {'uid': 'MQ', 'token': 'expired', 'password': SEED_PASSWORD}),
+    Endpoint('auth_me'),
+    Endpoint('auth_me', 'patch', data=lambda fx: {'first_name': 'Bench'}),
+    Endpoint('alumni_list'),
+    Endpoint('alumni_list', query='?skills=python&company=Infosys'),
+    Endpoint('mentor_recommend'),
+    Endpoint('pending_users', user='super_admin'),
+    Endpoint('institution_pending_users', user='institution_admin'),
+    Endpoint('institution_roster_export', user='institution_admin', query='?role=all'),
+    Endpoint('approve_user', 'post', user='institution_admin', kwargs=lambda fx: {'pk': fx['pending_user'].pk}),
+    Endpoint('institution_bulk_review', 'post', user='institution_admin', data=lambda fx: {'action': 'approve', 'filter': {}}),
+    Endpoint('institution_alumni_import', 'post', user='institution_admin', format='multipart', data=lambda fx: {
+        # A fresh file each iteration; the rows are rolled back afterwards
+        'file': SimpleUploadedFile('alumni.csv', b'email,company\n' + b''.join(b'import%d@example.com,Infosys\n' % i for i in range(100))),
+    }),
+    Endpoint('user_detail', kwargs=lambda fx: {'pk': fx['alumni'].pk}),
+    # events
+    Endpoint('event-list-create'),
+    Endpoint('event-list-create', query='?when=past&start_after=2020-01-01'),
+    Endpoint('event-list-create', 'post', user='alumni', data=lambda fx: {
+        'title': 'Bench Event', 'description': 'x', 'location': 'Mohali',
+        'start_time': '2030-01-01T10:00:00Z', 'end_time': '2030-01-01T12:00:00Z',
+    }),
+    Endpoint('event-detail', kwargs=lambda fx: {'pk': fx['event'].pk}),
+    # jobs
+    Endpoint('job-list-create'),
+    Endpoint('job-list-create', query='?search=python+engineer&job_type=Full-Time'),
+    Endpoint('job-list-create', 'post', user='alumni', data=lambda fx: {
+        'title': 'Bench Job', 'company': 'Infosys', 'location': 'Mohali', 'description': 'x', 'job_type': 'Full-Time',
+    }),
+    Endpoint('job-detail', kwargs=lambda fx: {'pk': fx['job'].pk}),
+    # chatbot (count questions are answered locally, without the LLM)
+    Endpoint('chatbot-query', 'post', data=lambda fx: {'query': 'How many alumni are there?'}),
+    Endpoint('chatbot-query-stream', 'post', data=lambda fx: {'query': 'How many students are there?'}),
+    # mentorship
+    Endpoint('mentorship-requests', user='alumni', query='?view=incoming'),
+    Endpoint('mentorship-requests', query='?view=outgoing&status=pending'),
+    Endpoint('mentorship-requests', 'post', data=lambda fx: {'mentor_id': fx['free_mentor'].pk, 'initial_message': 'Hi'}),
+    Endpoint('respond-to-request', 'post', user='alumni', kwargs=lambda fx: {'pk': fx['pending_request'].pk},
+             data=lambda fx: {'status': 'accepted', 'shared_contact_info': 'alumni@example.com'}),
+    Endpoint('mentorship-connections', user='alumni'),
+    # institutions
+    Endpoint('institution-apply', 'post', user=None, data=lambda fx: {
+        'name': 'Bench College', 'address': 'Patiala', 'contact_person': 'Bench',
+        'contact_email': 'bench@college.edu.in', 'contact_phone': '9800000000',
+    }),
+    Endpoint('pending-institutions', user='super_admin'),
+    Endpoint('approved-institutions', user='super_admin'),
+    Endpoint('platform-analytics', user='super_admin'),
+    Endpoint('institution-analytics', user='institution_admin'),
+    Endpoint('institution-analytics-export', user='institution_admin'),
+    Endpoint('institutions-report', user='super_admin'),
+    Endpoint('institutions-report', user='super_admin', query='?bucket=month'),
+    Endpoint('institution-detail', user='super_admin', kwargs=lambda fx: {'pk': fx['institution'].pk}),
+    Endpoint('approve-institution', 'post', user='super_admin', kwargs=lambda fx: {'pk': fx['pending_institution'].pk}),
+    Endpoint('reject-institution', 'post', user='super_admin', kwargs=lambda fx: {'pk': fx['pending_institution'].pk}),
+    # tokens
+    Endpoint('token_obtain_pair', 'post', user=None, data=lambda fx: {'username': fx['student'].username, 'password': SEED_PASSWORD}),
+    Endpoint('token_refresh', 'post', user=None, data=lambda fx: {'refresh': str(RefreshToken.for_user(fx['student']))}),
+    Endpoint('metrics', user=None),
+]
+
+
+def read_body(response):
+    """
+    Returns the full body, draining sync and async streaming responses.
+    """
+    if not response.streaming:
+        return response.content
+    if response.is_async:
+        async def drain():
+            return b''.join([chunk async for chunk in response.streaming_content])
+        return async_to_sync(drain)()
+    return b''.join(response.streaming_content)
+
+
+def percentiles(timings):
+    timings = sorted(timings)
+    return {
+        'p50_ms': round(statistics.median(timings), 3),
+        'p95_ms': round(timings[min(len(timings) - 1, int(len(timings) * 0.95))], 3),
+    }
+
+
+def named_api_routes(patterns=None, prefix=''):
+    """
+    Yields the name of every named route under /api/ in the URLconf.
+    """
+    for pattern in patterns if patterns is not None else get_resolver().url_patterns:
+        route = prefix + str(pattern.pattern)
+        if isinstance(pattern, URLResolver):
+            yield from named_api_routes(pattern.url_patterns, route)
+        elif isinstance(pattern, URLPattern) and pattern.name and route.startswith('api/'):
+            yield pattern.name
+
+
+class Command(BaseCommand):
+    help = (
+        "Seeds a synthetic dataset in a throwaway test database, calls every API route and records "
+        "query counts, p50/p95 latency and response size per endpoint as JSON."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--institutions', type=int, default=Scale.institutions)
+        parser.add_argument('--alumni', type=int, default=Scale.alumni)
+        parser.add_argument('--students', type=int, default=Scale.students)
+        parser.add_argument('--jobs', type=int, default=Scale.jobs)
+        parser.add_argument('--events', type=int, default=Scale.events)
+        parser.add_argument('--mentorship-requests', type=int, default=Scale.mentorship_requests)
+        parser.add_argument('--iterations', type=int, default=20, help="Timed requests per endpoint.")
+        parser.add_argument('--only', help="Comma-separated URL names to run.")
+        parser.add_argument('--output', default='benchmark-results.json')
+        parser.add_argument('--compare', help="Earlier results file; regressions make the command fail.")
+        parser.add_argument('--max-slowdown', type=float, default=1.5, help="Allowed p95 ratio against --compare.")
+
+    def handle(self, *args, **options):
+        scale = Scale(
+            institutions=options['institutions'], alumni=options['alumni'], students=options['students'],
+            jobs=options['jobs'], events=options['events'], mentorship_requests=options['mentorship_requests'],
+        )
+        if min(scale.institutions, scale.alumni, scale.students, scale.jobs, scale.events) < 2:
+            raise CommandError("Every scale option must be at least 2.")
+
+        endpoints = ENDPOINTS
+        if options['only']:
+            wanted = set(options['only'].split(','))
+            endpoints = [endpoint for endpoint in ENDPOINTS if endpoint.name in wanted]
+        else:
+            missing = set(named_api_routes()) - {endpoint.name for endpoint in ENDPOINTS}
+            if missing:
+                self.stderr.write(f"Routes without a benchmark: {', '.join(sorted(missing))}")
+
+        # Everything runs in a separate test database that is dropped afterwards
+        setup_test_environment()
+        old_name = connection.settings_dict['NAME']
+        connection.creation.create_test_db(verbosity=0, autoclobber=True)
+        try:
+            self.stdout.write(f"Seeding {scale} ...")
+            fixtures = self.build_fixtures(scale)
+            results = {
+                f"{endpoint.method.upper()} {endpoint.name}{endpoint.query}": self.measure(endpoint, fixtures, options['iterations'])
+                for endpoint in endpoints
+            }
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+            teardown_test_environment()
+
+        report = {
+            'meta': {
+                'created_at': datetime.now(dt_timezone.utc).isoformat(),
+                'scale': scale.__dict__,
+                'iterations': options['iterations'],
+                'database': connection.vendor,
+            },
+            'endpoints': results,
+        }
+        with open(options['output'], 'w') as f:
+            json.dump(report, f, indent=2)
+
+        self.print_table(results)
+        self.stdout.write(self.style.SUCCESS(f"Results written to {options['output']}"))
+        if options['compare']:
+            self.compare(options['compare'], results, options['max_slowdown'])
+
+    def build_fixtures(self, scale):
+        fixtures = seed_dataset(scale)
+        student, alumni = fixtures['student'], fixtures['alumni']
+        # Objects the detail and action endpoints operate on
+        fixtures['event'] = Event.objects.first()
+        fixtures['job'] = Job.objects.first()
+        fixtures['institution'] = Institution.objects.filter(status='approved').first()
+        fixtures['pending_institution'] = Institution.objects.filter(status='pending').first() or Institution.objects.create(
+            name='Pending College', address='Patiala', contact_person='x', contact_email='pending@college.edu.in', contact_phone='1',
+        )
+        fixtures['pending_user'] = User.objects.filter(is_approved=False).first()
+        MentorshipRequest.objects.filter(requester=student, mentor=alumni).delete()
+        fixtures['pending_request'] = MentorshipRequest.objects.create(requester=student, mentor=alumni, initial_message='Hi')
+        fixtures['free_mentor'] = User.objects.filter(role='alumni').exclude(received_requests__requester=student).first()
+        accepted = MentorshipRequest.objects.filter(mentor=alumni, status='pending').exclude(pk=fixtures['pending_request'].pk)[:5]
+        for request in accepted:
+            request.status = 'accepted'
+            request.save()
+            ConnectionInfo.objects.create(request=request, shared_contact_info='alumni@example.com')
+        return fixtures
+
+    def measure(self, endpoint, fixtures, iterations):
+        client = APIClient()
+        if endpoint.user:
+            token = RefreshToken.for_user(fixtures[endpoint.user]).access_token
+            client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+        path = reverse(endpoint.name, kwargs=endpoint.kwargs(fixtures))
+        url = path + endpoint.query
+        view_class = getattr(resolve(path).func, 'view_class', object)
+        cached = endpoint.method == 'get' and issubclass(view_class, response_cache.CachedResponseMixin)
+
+        timings, query_counts, sizes, statuses = [], [], [], set()
+        hit_timings, hit_query_counts = [], []
+        # One untimed warm-up request, then the timed ones
+        for i in range(iterations + 1):
+            # Every measured request misses the response cache, so the
+            # numbers show the work the view does; hits are reported apart
+            caches[response_cache.CACHE_ALIAS].clear()
+            elapsed, queries, response, body = self.timed_request(client, endpoint, fixtures, url)
+            if i:
+                timings.append(elapsed)
+                query_counts.append(queries)
+                sizes.append(len(body))
+                statuses.add(response.status_code)
+            if cached:
+                elapsed, queries, *_ = self.timed_request(client, endpoint, fixtures, url)
+                if i:
+                    hit_timings.append(elapsed)
+                    hit_query_counts.append(queries)
+
+        return {
+            'status': sorted(statuses),
+            'queries': max(query_counts),
+            **percentiles(timings),
+            'bytes': max(sizes),
+            'cache_hit': {'queries': max(hit_query_counts), **percentiles(hit_timings)} if cached else None,
+        }
+
+    def timed_request(self, client, endpoint, fixtures, url):
+        """
+        Sends one request and returns its time in ms, query count, response
+        and body.
+        """
+        # Writes are rolled back so every request sees the same data
+        data = endpoint.data(fixtures)
+        with transaction.atomic():
+            with CaptureQueriesContext(connection) as queries:
+                started = time.perf_counter()
+                response = getattr(client, endpoint.method)(url, data, format=endpoint.format)
+                body = read_body(response)
+                elapsed = (time.perf_counter() - started) * 1000
+            transaction.set_rollback(True)
+        return elapsed, len(queries), response, body
+
+    def print_table(self, results):
+        self.stdout.write(
+            f"{'endpoint':60} {'status':>8} {'queries':>8} {'p50 ms':>9} {'p95 ms':>9} {'bytes':>9} {'hit p50':>9}"
+        )
+        for name, result in results.items():
+            status = ','.join(map(str, result['status']))
+            hit = result.get('cache_hit')
+            hit_p50 = f"{hit['p50_ms']:.2f}" if hit else '-'
+            self.stdout.write(
+                f"{name:60} {status:>8} {result['queries']:>8} {result['p50_ms']:>9.2f} {result['p95_ms']:>9.2f} {result['bytes']:>9} {hit_p50:>9}"
+            )
+
+    def compare(self, path, results, max_slowdown):
+        try:
+            with open(path) as f:
+                baseline = json.load(f)['endpoints']
+        except (OSError, ValueError, KeyError) as e:
+            raise CommandError(f"Could not read {path}: {e}")
+
+        regressions = []
+        for name, result in results.items():
+            before = baseline.get(name)
+            if not before:
+                continue
+            if result['queries'] > before['queries']:
+                regressions.append(f"{name}: queries {before['queries']} -> {result['queries']}")
+            if before['p95_ms'] and result['p95_ms'] > before['p95_ms'] * max_slowdown:
+                regressions.append(f"{name}: p95 {before['p95_ms']:.2f} ms -> {result['p95_ms']:.2f} ms")
+
+        if regressions:
+            raise CommandError("Performance regressions:\n  " + "\n  ".join(regressions))
+        self.stdout.write(self.style.SUCCESS(f"No regressions against {path}."))
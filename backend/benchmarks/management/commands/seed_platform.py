@@ -0,0 +1,46 @@
+# backend/benchmarks/management/commands/seed_platform.py
+import random
+import time
+from django.core.management.base import BaseCommand, CommandError
+from benchmarks.seed import PlatformSeeder, Scale, SEED_PASSWORD
+from users.models import User
+
+
+class Command(BaseCommand):
+    help = (
+        "Bulk-loads a synthetic platform (institutions, users with profiles, jobs, events, "
+        "mentorship requests and connections) for load testing."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--institutions', type=int, default=300)
+        parser.add_argument('--alumni', type=int, default=200_000)
+        parser.add_argument('--students', type=int, default=100_000)
+        parser.add_argument('--jobs', type=int, default=50_000)
+        parser.add_argument('--events', type=int, default=20_000)
+        parser.add_argument('--mentorship-requests', type=int, default=100_000)
+        parser.add_argument('--batch-size', type=int, default=5000)
+        parser.add_argument('--prefix', default='seed', help="Namespace for generated usernames and emails.")
+        parser.add_argument('--random-seed', type=int, default=42)
+
+    def handle(self, *args, **options):
+        scale = Scale(
+            institutions=options['institutions'], alumni=options['alumni'], students=options['students'],
+            jobs=options['jobs'], events=options['events'], mentorship_requests=options['mentorship_requests'],
+        )
+        if min(scale.institutions, scale.alumni, scale.students) < 1:
+            raise CommandError("At least one institution, alumnus and student is needed.")
+        if User.objects.filter(username__startswith=f"{options['prefix']}_").exists():
+            raise CommandError(f"Users with prefix '{options['prefix']}' already exist; pass a different --prefix.")
+
+        started = time.monotonic()
+        seeder = PlatformSeeder(
+            scale, batch_size=options['batch_size'], prefix=options['prefix'],
+            rng=random.Random(options['random_seed']), log=self.stdout.write,
+        )
+        accounts = seeder.run()
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Seeded {scale} in {time.monotonic() - started:.1f}s. "
+            f"Every account's password is '{SEED_PASSWORD}', e.g. {accounts['super_admin'].username}."
+        ))
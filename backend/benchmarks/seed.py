@@ -0,0 +1,252 @@
+# backend/benchmarks/seed.py
+"""
+Synthetic data for benchmarks and load tests.
+
+Rows are generated lazily and written with bulk_create in fixed-size batches,
+one transaction per batch, so memory stays flat at any scale. bulk_create
+does not send model signals: the Profile that users.signals.create_user_profile
+would create is inserted alongside each batch of users instead, and the
+signal-maintained tables (skill index, analytics counters, chatbot search
+index) are rebuilt once at the end.
+"""
+import io
+import itertools
+import random
+from dataclasses import dataclass
+from datetime import timedelta
+from django.contrib.auth.hashers import make_password
+from django.core.management import call_command
+from django.db import transaction
+from django.utils import timezone
+from backend import response_cache
+from users.models import User, Profile, rebuild_skill_index
+from institutions.models import Institution
+from institutions import counters
+from jobs.models import Job
+from events.models import Event
+from mentorship.models import MentorshipRequest, ConnectionInfo
+
+SEED_PASSWORD = 'benchmark-pass'
+
+# Ordered from most to least common; sampled with Zipf-like weights
+SKILLS = [
+    'python', 'java', 'sql', 'javascript', 'c++', 'react', 'machine learning', 'data science',
+    'django', 'aws', 'android', 'node.js', 'autocad', 'matlab', 'docker', 'spring', 'postgresql',
+    'cloud computing', 'deep learning', 'project management', 'embedded systems', 'kubernetes',
+    'devops', 'flutter', 'cyber security', 'vlsi', 'marketing', 'finance', 'solidworks', 'tableau',
+    'power bi', 'excel', 'go', 'rust', 'figma', 'iot', 'blockchain', 'nlp', 'computer vision', 'sap',
+]
+SKILL_WEIGHTS = list(itertools.accumulate(1 / (rank + 1) ** 0.9 for rank in range(len(SKILLS))))
+COMPANIES = ['Infosys', 'TCS', 'Wipro', 'Google', 'Microsoft', 'Amazon', 'HCL', 'Tata Motors', 'Mahindra', 'Accenture',
+             'Hero Cycles', 'Trident Group', 'Sonalika', 'Vardhman Textiles', 'Quark', 'Punjab National Bank']
+DEPARTMENTS = ['Computer Science', 'Electronics', 'Mechanical', 'Civil', 'Electrical', 'Information Technology',
+               'Management', 'Pharmacy']
+CITIES = ['Ludhiana', 'Amritsar', 'Jalandhar', 'Patiala', 'Mohali', 'Chandigarh', 'Bathinda', 'Pathankot', 'Hoshiarpur']
+JOB_TITLES = ['Software Engineer', 'Data Analyst', 'Backend Developer', 'Frontend Developer', 'Design Engineer',
+              'Intern', 'Site Engineer', 'Product Manager', 'QA Engineer', 'Business Analyst']
+FIRST_NAMES = ['Gurpreet', 'Harpreet', 'Simran', 'Manpreet', 'Amandeep', 'Jaspreet', 'Navjot', 'Rahul', 'Priya', 'Arjun',
+               'Kiran', 'Ankit', 'Neha', 'Rohan', 'Sukhdeep', 'Baljit', 'Karan', 'Mehak', 'Ishaan', 'Tanvi']
+MENTORSHIP_STATUSES = ['pending'] * 6 + ['accepted'] * 3 + ['declined']
+
+
+@dataclass
+class Scale:
+    institutions: int = 5
+    alumni: int = 200
+    students: int = 200
+    jobs: int = 100
+    events: int = 100
+    mentorship_requests: int = 200
+
+
+def batched(iterable, size):
+    iterator = iter(iterable)
+    while batch := list(itertools.islice(iterator, size)):
+        yield batch
+
+
+class PlatformSeeder:
+    """
+    Bulk-loads a synthetic platform. `prefix` namespaces usernames and emails
+    so several datasets can live in one database.
+    """
+
+    def __init__(self, scale, batch_size=5000, prefix='seed', rng=None, log=None):
+        self.scale = scale
+        self.batch_size = batch_size
+        self.prefix = prefix
+        self.rng = rng or random.Random(42)
+        self.log = log or (lambda message: None)
+        self.now = timezone.now()
+        self.password = make_password(SEED_PASSWORD)  # Hash once, reuse for every row
+
+    def run(self):
+        """
+        Seeds everything and returns the well-known accounts
+        (super_admin, institution_admin, alumni, student).
+        """
+        institution_ids = self.seed_institutions()
+        accounts = self.seed_accounts(institution_ids)
+        alumni_ids, student_ids = self.seed_members(institution_ids)
+        self.seed_jobs(alumni_ids)
+        self.seed_events(alumni_ids)
+        self.seed_mentorship(student_ids, alumni_ids)
+        self.log("Rebuilding skill index, counters and search index ...")
+        rebuild_derived_data()
+
+        accounts['alumni'] = User.objects.get(pk=alumni_ids[0])
+        accounts['student'] = User.objects.get(pk=student_ids[0])
+        return accounts
+
+    def insert(self, label, model, rows):
+        """
+        Inserts generated rows in batches and returns the saved objects' ids.
+        """
+        ids, total = [], 0
+        for batch in batched(rows, self.batch_size):
+            with transaction.atomic():
+                ids.extend(obj.pk for obj in model.objects.bulk_create(batch))
+            total += len(batch)
+            self.log(f"  {label}: {total}")
+        return ids
+
+    def seed_institutions(self):
+        rng = self.rng
+        return self.insert('institutions', Institution, (
+            Institution(
+                name=f'{rng.choice(["Government", "Guru Nanak", "Baba Farid", "Punjab"])} College {i}',
+                address=f'{rng.choice(CITIES)}, Punjab', contact_person=f'Principal {i}',
+                contact_email=f'{self.prefix}.admin{i}@college{i}.edu.in', contact_phone='9800000000',
+                # Mostly approved, with a few applications still waiting
+                status='approved' if i % 10 else 'pending',
+            )
+            for i in range(self.scale.institutions)
+        ))
+
+    def seed_accounts(self, institution_ids):
+        admin_institution = Institution.objects.get(pk=institution_ids[1 % len(institution_ids)])
+        users = [
+            User(username=f'{self.prefix}_super', email=f'{self.prefix}.super@example.com',
+                 role='super_admin', is_approved=True, password=self.password),
+            User(username=f'{self.prefix}_institution_admin', email=admin_institution.contact_email,
+                 role='institution_admin', is_approved=True, password=self.password),
+        ]
+        with transaction.atomic():
+            users = User.objects.bulk_create(users)
+            Profile.objects.bulk_create([Profile(user=user) for user in users])
+        return {'super_admin': users[0], 'institution_admin': users[1]}
+
+    def seed_members(self, institution_ids):
+        """
+        Inserts alumni and students with their profiles, batch by batch.
+        Returns (alumni_ids, student_ids).
+        """
+        ids = {'alumni': [], 'student': []}
+        members = itertools.chain(
+            (('alumni', i) for i in range(self.scale.alumni)),
+            (('student', i) for i in range(self.scale.students)),
+        )
+        total = 0
+        for batch in batched(members, self.batch_size):
+            users = [self.make_user(role, i) for role, i in batch]
+            with transaction.atomic():
+                users = User.objects.bulk_create(users)
+                # Stands in for the post_save signal, which bulk_create skips
+                Profile.objects.bulk_create([self.make_profile(user, institution_ids) for user in users])
+            for user in users:
+                ids[user.role].append(user.pk)
+            total += len(users)
+            self.log(f"  users: {total}")
+        return ids['alumni'], ids['student']
+
+    def make_user(self, role, i):
+        rng = self.rng
+        return User(
+            username=f'{self.prefix}_{role}{i}', email=f'{self.prefix}.{role}{i}@example.com',
+            first_name=rng.choice(FIRST_NAMES), last_name=f'{role.title()} {i}',
+            role=role, is_approved=i == 0 or rng.random() < 0.9, password=self.password,
+            date_joined=self.now - timedelta(days=rng.randint(0, 3 * 365), seconds=rng.randint(0, 86400)),
+        )
+
+    def make_profile(self, user, institution_ids):
+        rng = self.rng
+        skills = dict.fromkeys(rng.choices(SKILLS, cum_weights=SKILL_WEIGHTS, k=rng.randint(1, 7)))
+        is_alumni = user.role == 'alumni'
+        company = rng.choice(COMPANIES) if is_alumni else ''
+        return Profile(
+            user=user,
+            institution_id=rng.choice(institution_ids),
+            headline=f'{rng.choice(JOB_TITLES)} at {company}' if is_alumni else f'{rng.choice(DEPARTMENTS)} student',
+            location=rng.choice(CITIES),
+            skills=', '.join(skills),
+            department=rng.choice(DEPARTMENTS),
+            graduation_year=rng.randint(1995, 2025) if is_alumni else rng.randint(2025, 2030),
+            company=company,
+        )
+
+    def seed_jobs(self, alumni_ids):
+        rng = self.rng
+        self.insert('jobs', Job, (
+            Job(
+                title=rng.choice(JOB_TITLES), company=rng.choice(COMPANIES), location=rng.choice(CITIES),
+                description=f'Looking for skills in {", ".join(rng.sample(SKILLS, 3))}.',
+                job_type=rng.choice(Job.JOB_TYPE_CHOICES)[0], posted_by_id=rng.choice(alumni_ids),
+            )
+            for _ in range(self.scale.jobs)
+        ))
+
+    def seed_events(self, alumni_ids):
+        rng = self.rng
+
+        def make_event(i):
+            start = self.now + timedelta(days=rng.randint(-3 * 365, 180), hours=rng.randint(8, 20))
+            return Event(
+                title=f'{rng.choice(SKILLS).title()} Meetup {i}', description='An alumni networking event.',
+                start_time=start, end_time=start + timedelta(hours=rng.randint(1, 8)), location=rng.choice(CITIES),
+                organizer_id=rng.choice(alumni_ids),
+            )
+        self.insert('events', Event, (make_event(i) for i in range(self.scale.events)))
+
+    def seed_mentorship(self, student_ids, alumni_ids):
+        """
+        Inserts requests between distinct (student, alumnus) pairs; accepted
+        ones get their ConnectionInfo in the same batch.
+        """
+        rng = self.rng
+        wanted = min(self.scale.mentorship_requests, len(student_ids) * len(alumni_ids))
+        pairs = set()
+        while len(pairs) < wanted:
+            pairs.add((rng.choice(student_ids), rng.choice(alumni_ids)))
+
+        total = 0
+        for batch in batched(pairs, self.batch_size):
+            requests = [
+                MentorshipRequest(requester_id=requester_id, mentor_id=mentor_id,
+                                  initial_message='Could you mentor me?', status=rng.choice(MENTORSHIP_STATUSES))
+                for requester_id, mentor_id in batch
+            ]
+            with transaction.atomic():
+                requests = MentorshipRequest.objects.bulk_create(requests)
+                ConnectionInfo.objects.bulk_create([
+                    ConnectionInfo(request=request, shared_contact_info=f'mentor{request.mentor_id}@example.com')
+                    for request in requests if request.status == 'accepted'
+                ])
+            total += len(requests)
+            self.log(f"  mentorship requests: {total}")
+
+
+def seed_dataset(scale, rng=None, batch_size=500, prefix='bench'):
+    """
+    Seeds a small dataset for the benchmarks and returns its well-known accounts.
+    """
+    return PlatformSeeder(scale, batch_size=batch_size, prefix=prefix, rng=rng).run()
+
+
+def rebuild_derived_data():
+    """
+    Rebuilds the tables normally kept in sync by signals.
+    """
+    rebuild_skill_index()
+    counters.rebuild()
+    call_command('rebuild_search_index', stdout=io.StringIO())
+    response_cache.invalidate('institutions', 'events', 'jobs')
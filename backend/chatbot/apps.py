@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class ChatbotConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'chatbot'
+
+    # Keep the chatbot's search index in sync with the models it covers
+    def ready(self):
+        from . import signals
@@ -0,0 +1,38 @@
+# backend/chatbot/cache.py
+"""
+Response cache for the chatbot. Entries live in the 'chatbot' cache alias
+(see CACHES in settings), which is size-bounded with LRU eviction and a TTL,
+and are keyed by a hash of the normalized query and conversation transcript.
+"""
+import hashlib
+import json
+import re
+from django.core.cache import caches
+
+CACHE_ALIAS = 'chatbot'
+
+
+def normalize_text(text):
+    """
+    Lowercases the text and collapses punctuation and whitespace, so trivially
+    different phrasings of the same question share a cache entry.
+    """
+    return ' '.join(re.sub(r'[^\w\s]', ' ', str(text or '').lower()).split())
+
+
+def conversation_key(kind, query, transcript):
+    """
+    Builds the cache key for one stage ('intent' or 'response') of a
+    conversation, from the query and the bounded history transcript.
+    """
+    normalized = {'query': normalize_text(query), 'transcript': normalize_text(transcript)}
+    digest = hashlib.sha256(json.dumps(normalized, separators=(',', ':')).encode()).hexdigest()
+    return f'chatbot:{kind}:{digest}'
+
+
+async def aget_cached(kind, query, transcript):
+    return await caches[CACHE_ALIAS].aget(conversation_key(kind, query, transcript))
+
+
+async def aset_cached(kind, query, transcript, value):
+    await caches[CACHE_ALIAS].aset(conversation_key(kind, query, transcript), value)
@@ -0,0 +1,168 @@
+# backend/chatbot/conversation.py
+"""
+Server-side chat sessions with a bounded prompt history.
+
+The transcript sent to the LLM is the running summary plus a sliding window
+of the most recent messages, trimmed to HISTORY_TOKEN_BUDGET. Messages that
+slide out of the window are folded into the summary in batches, so prompt
+size (and LLM latency and cost) stays flat as a conversation grows.
+
+A new conversation is only saved with its first answered turn, so queries
+that fail (400, 503) leave no empty conversations behind.
+"""
+import asyncio
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import transaction
+from . import llm
+from .models import Conversation, ConversationMessage
+
+# Rough upper bound on the tokens the history may take up in one prompt
+HISTORY_TOKEN_BUDGET = getattr(settings, 'CHATBOT_HISTORY_TOKEN_BUDGET', 1500)
+# Most recent messages considered for the prompt verbatim
+HISTORY_WINDOW = getattr(settings, 'CHATBOT_HISTORY_WINDOW', 10)
+# Share of the budget the running summary may use
+SUMMARY_TOKEN_LIMIT = HISTORY_TOKEN_BUDGET // 4
+# Fold old messages into the summary once this many have left the window
+SUMMARIZE_BATCH = 6
+# Seconds a summary may take before the text is truncated instead; it is
+# made while the user waits for their answer
+SUMMARY_TIMEOUT = getattr(settings, 'CHATBOT_SUMMARY_TIMEOUT', 5)
+
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text):
+    """
+    Cheap token estimate (about four characters per token for English text).
+    """
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+def truncate_to_tokens(text, tokens, keep='start'):
+    limit = tokens * CHARS_PER_TOKEN
+    if len(text) <= limit:
+        return text
+    return text[:limit] + '...' if keep == 'start' else '...' + text[-limit:]
+
+
+def format_message(role, text):
+    speaker = "User" if role == 'user' else "Assistant"
+    return f"{speaker}: {text}"
+
+
+async def start_or_resume(user, conversation_id=None, seed_history=()):
+    """
+    Returns the user's conversation with the given id, or starts a new one.
+    A new conversation is seeded with the tail of any client-side history,
+    so older clients that still send `history` keep their context; it and
+    its seed stay unsaved until add_turn() stores the first turn.
+    Returns None if the id does not belong to this user.
+    """
+    if conversation_id:
+        conversation = await Conversation.objects.filter(pk=conversation_id, user=user).afirst()
+        if conversation is not None:
+            conversation.seed = []
+        return conversation
+
+    conversation = Conversation(user=user)
+    conversation.seed = [
+        ConversationMessage(role='user' if message.get('type') == 'user' else 'bot', text=str(message.get('text') or ''))
+        for message in list(seed_history)[-HISTORY_WINDOW:]
+    ]
+    return conversation
+
+
+async def add_turn(conversation, user_text, bot_text):
+    """
+    Stores a finished turn, and a new conversation with its seed. Nothing is
+    stored for a query that got no answer, so a client retrying it does not
+    record it twice.
+    """
+    await sync_to_async(_store_turn)(conversation, user_text, bot_text)
+
+
+def _store_turn(conversation, user_text, bot_text):
+    with transaction.atomic():
+        if conversation.pk is None:
+            conversation.save()
+        messages = conversation.seed + [
+            ConversationMessage(role='user', text=user_text),
+            ConversationMessage(role='bot', text=bot_text),
+        ]
+        for message in messages:
+            message.conversation = conversation
+        ConversationMessage.objects.bulk_create(messages)
+    conversation.seed = []
+
+
+async def build_transcript(conversation, user_query):
+    """
+    Returns the history text for the next prompt: the running summary plus as
+    many recent messages as fit in the token budget, ending with the user's
+    new (not yet stored) query. Summarizes messages that have left the
+    window when enough of them have piled up.
+    """
+    if conversation.pk is None:
+        # Only the in-memory seed: at most HISTORY_WINDOW messages, nothing to summarize yet
+        stored = conversation.seed[::-1][:HISTORY_WINDOW - 1]
+    else:
+        stored = [
+            message async for message in conversation.messages
+            .filter(pk__gt=conversation.summarized_up_to)
+            .order_by('-pk')[:HISTORY_WINDOW - 1]
+        ]
+    recent = [ConversationMessage(role='user', text=user_query)] + stored
+
+    # The summary's share is always reserved, since it may grow below
+    budget = HISTORY_TOKEN_BUDGET - SUMMARY_TOKEN_LIMIT
+    kept = []
+    for message in recent:
+        # The newest message (the user's query) is always kept, if need be truncated
+        text = message.text if kept else truncate_to_tokens(message.text, budget - 5)
+        line = format_message(message.role, text)
+        cost = estimate_tokens(line)
+        if kept and cost > budget:
+            break
+        kept.append((message, line))
+        budget -= cost
+
+    if kept and conversation.pk is not None:
+        dropped = conversation.messages.filter(pk__gt=conversation.summarized_up_to)
+        oldest_kept = kept[-1][0]
+        if oldest_kept.pk is not None:
+            dropped = dropped.filter(pk__lt=oldest_kept.pk)
+        if await dropped.acount() >= SUMMARIZE_BATCH:
+            await summarize(conversation, [message async for message in dropped.order_by('pk')])
+
+    lines = [line for _, line in reversed(kept)]
+    if conversation.summary:
+        lines.insert(0, f"(Summary of the earlier conversation: {conversation.summary})")
+    return "\n".join(lines) + "\n"
+
+
+async def summarize(conversation, messages):
+    """
+    Folds `messages` into the conversation's running summary. Falls back to
+    keeping the tail of the text if the LLM is unavailable or slower than
+    SUMMARY_TIMEOUT, so the summary stays bounded either way.
+    """
+    old_turns = "\n".join(format_message(message.role, message.text) for message in messages)
+    old_turns = truncate_to_tokens(old_turns, HISTORY_TOKEN_BUDGET, keep='end')
+    prompt = (
+        f"Update the running summary of a chat between a user and Alumni Assist. "
+        f"Keep names, companies, skills and open questions. Reply with the summary only, "
+        f"under {SUMMARY_TOKEN_LIMIT * 3 // 4} words.\n\n"
+        f"Current summary:\n{conversation.summary or '(none)'}\n\nNew turns:\n{old_turns}"
+    )
+    try:
+        summary = (await asyncio.wait_for(llm.generate(prompt), SUMMARY_TIMEOUT)).strip() if llm.is_configured() else None
+    except (llm.LLMError, asyncio.TimeoutError) as e:
+        print(f"Error while summarizing conversation history: {str(e) or e.__class__.__name__}")
+        summary = None
+    if not summary:
+        summary = f"{conversation.summary} {old_turns}".strip()
+
+    conversation.summary = truncate_to_tokens(summary, SUMMARY_TOKEN_LIMIT, keep='end')
+    conversation.summarized_up_to = messages[-1].pk
+    await conversation.asave(update_fields=['summary', 'summarized_up_to', 'updated_at'])
@@ -0,0 +1,147 @@
+# backend/chatbot/intent.py
+"""
+Local intent classifier for the chatbot's "Department Head" step.
+
+Two stages run in-process, with no network calls:
+1. Regex rules catch unambiguous count questions with full confidence.
+2. A small TF-IDF nearest-centroid model, trained on TRAINING_EXAMPLES when
+   the module is imported, scores everything else.
+
+The counts are platform-wide, so a count question that narrows its subject
+("how many alumni work at google") is not a count intent. It is returned
+as keyword_search with zero confidence, which leaves the decision to the LLM.
+
+classify_intent() returns the label and a confidence in [0, 1]. The view only
+falls back to the LLM when the confidence is below CONFIDENCE_THRESHOLD.
+"""
+import math
+import re
+from collections import Counter, defaultdict
+
+INTENTS = ('alumni_count', 'student_count', 'keyword_search', 'general_question')
+
+# Below this, the caller should ask the LLM instead
+CONFIDENCE_THRESHOLD = 0.3
+
+RULES = (
+    ('alumni_count', re.compile(r'\b(how many|number of|count of|total)\b.*\balumn(i|us|ae|a)\b')),
+    ('student_count', re.compile(r'\b(how many|number of|count of|total)\b.*\bstudents?\b')),
+)
+
+COUNT_INTENTS = ('alumni_count', 'student_count')
+
+# The words a platform-wide count question may use besides its subject;
+# any other word narrows the question
+COUNT_FILLER = frozenset('''
+    a all an and any are count currently do does exist give have how in is many me now number of on overall please
+    right s registered signed so far the there this total up use using what whats
+    account accounts app platform portal site punjab connect
+    alum alumni alumnus alumnae alumna student students
+'''.split())
+
+TRAINING_EXAMPLES = (
+    ('alumni_count', 'how many alumni are registered'),
+    ('alumni_count', 'total number of alumni on the platform'),
+    ('alumni_count', 'count the alumni'),
+    ('alumni_count', 'alumni count'),
+    ('student_count', 'how many students are registered'),
+    ('student_count', 'total number of students on the platform'),
+    ('student_count', 'count the students'),
+    ('student_count', 'student count'),
+    ('keyword_search', 'find alumni working at google'),
+    ('keyword_search', 'who works at infosys'),
+    ('keyword_search', 'show me alumni with python skills'),
+    ('keyword_search', 'are there any job openings for data scientists'),
+    ('keyword_search', 'list internships in mohali'),
+    ('keyword_search', 'any full time jobs for software engineers'),
+    ('keyword_search', 'upcoming events in chandigarh'),
+    ('keyword_search', 'is there a workshop or meetup this month'),
+    ('keyword_search', 'search for mentors in machine learning'),
+    ('keyword_search', 'alumni from the computer science department'),
+    ('keyword_search', 'which companies are hiring'),
+    ('keyword_search', 'find someone who knows react'),
+    ('general_question', 'hello'),
+    ('general_question', 'hi there how are you'),
+    ('general_question', 'thanks for your help'),
+    ('general_question', 'what is this platform about'),
+    ('general_question', 'how do i request a mentor'),
+    ('general_question', 'how can i update my profile'),
+    ('general_question', 'give me tips for a job interview'),
+    ('general_question', 'how should i prepare my resume'),
+    ('general_question', 'what can you do'),
+    ('general_question', 'explain what mentorship means'),
+)
+
+
+def tokenize(text):
+    words = re.findall(r'[a-z0-9]+', text.lower())
+    # Unigrams plus bigrams, so "how many" and "job openings" carry weight
+    return words + [f'{a} {b}' for a, b in zip(words, words[1:])]
+
+
+class TfidfCentroidClassifier:
+    """
+    A tiny TF-IDF model: one L2-normalized centroid per label, scored by
+    cosine similarity against the query vector.
+    """
+
+    def __init__(self, examples):
+        documents = [(label, Counter(tokenize(text))) for label, text in examples]
+        document_frequency = Counter(term for _, counts in documents for term in counts)
+        total = len(documents)
+        self.idf = {term: math.log((1 + total) / (1 + df)) + 1 for term, df in document_frequency.items()}
+
+        sums = defaultdict(Counter)
+        for label, counts in documents:
+            for term, weight in self._normalize(self._weigh(counts)).items():
+                sums[label][term] += weight
+        self.centroids = {label: self._normalize(vector) for label, vector in sums.items()}
+
+    def _weigh(self, counts):
+        return {term: count * self.idf[term] for term, count in counts.items() if term in self.idf}
+
+    @staticmethod
+    def _normalize(vector):
+        norm = math.sqrt(sum(value * value for value in vector.values()))
+        return {term: value / norm for term, value in vector.items()} if norm else {}
+
+    def scores(self, text):
+        vector = self._normalize(self._weigh(Counter(tokenize(text))))
+        return {
+            label: sum(weight * centroid.get(term, 0.0) for term, weight in vector.items())
+            for label, centroid in self.centroids.items()
+        }
+
+
+_classifier = TfidfCentroidClassifier(TRAINING_EXAMPLES)
+
+
+def is_qualified(text):
+    """
+    True if the query has words beyond those of a platform-wide count.
+    """
+    return any(word not in COUNT_FILLER for word in re.findall(r'[a-z0-9]+', text))
+
+
+def classify_intent(query):
+    """
+    Returns (intent, confidence) for the user's latest query.
+    """
+    text = query.lower()
+    for intent, pattern in RULES:
+        if pattern.search(text):
+            if is_qualified(text):
+                return 'keyword_search', 0.0
+            return intent, 1.0
+
+    ranked = sorted(_classifier.scores(text).items(), key=lambda item: item[1], reverse=True)
+    (best, best_score), (_, runner_up_score) = ranked[0], ranked[1]
+    if best_score <= 0:
+        return 'general_question', 0.0
+    if best in COUNT_INTENTS and is_qualified(text):
+        return 'keyword_search', 0.0
+
+    # Confidence blends how well the query matches and how clearly it wins
+    margin = (best_score - runner_up_score) / best_score
+    confidence = (min(best_score, 1.0) + margin) / 2
+    return best, round(confidence, 3)
@@ -0,0 +1,94 @@
+# backend/chatbot/llm.py
+"""
+Async access to Gemini for the chatbot views.
+
+Every call goes through a per-event-loop semaphore, so one process never has
+more than CHATBOT_LLM_MAX_CONCURRENCY requests in flight, and every wait is
+bounded by CHATBOT_LLM_TIMEOUT seconds. Callers see LLMError on any failure.
+Call latency and errors are recorded in the metrics served at /metrics.
+"""
+import asyncio
+import time
+import weakref
+import google.generativeai as genai
+from django.conf import settings
+from backend import metrics
+
+MAX_CONCURRENCY = getattr(settings, 'CHATBOT_LLM_MAX_CONCURRENCY', 32)
+TIMEOUT = getattr(settings, 'CHATBOT_LLM_TIMEOUT', 30)
+
+# Configure the Gemini AI Model
+try:
+    genai.configure(api_key=settings.GOOGLE_API_KEY)
+    model = genai.GenerativeModel('gemini-1.5-flash-latest')
+except Exception as e:
+    print(f"CRITICAL ERROR: Could not configure Google AI. Check your GOOGLE_API_KEY. Error: {e}")
+    model = None
+
+# asyncio primitives belong to one event loop, so keep one semaphore per loop
+_semaphores = weakref.WeakKeyDictionary()
+
+
+GEMINI_LATENCY = metrics.Histogram(
+    'gemini_request_duration_seconds', 'Duration of Gemini calls, including the wait for a free slot.', ['method'],
+)
+GEMINI_ERRORS = metrics.Counter('gemini_errors_total', 'Failed Gemini calls, by method and error type.', ['method', 'error'])
+
+
+class LLMError(Exception):
+    pass
+
+
+def record_error(method, error):
+    GEMINI_ERRORS.inc(method=method, error='timeout' if isinstance(error, asyncio.TimeoutError) else 'api_error')
+
+
+def is_configured():
+    return model is not None
+
+
+def _limiter():
+    loop = asyncio.get_running_loop()
+    if loop not in _semaphores:
+        _semaphores[loop] = asyncio.Semaphore(MAX_CONCURRENCY)
+    return _semaphores[loop]
+
+
+async def generate(prompt):
+    """
+    Returns the full text Gemini generates for the prompt.
+    """
+    started = time.perf_counter()
+    async with _limiter():
+        try:
+            response = await asyncio.wait_for(model.generate_content_async(prompt), TIMEOUT)
+            return response.text
+        except Exception as e:
+            record_error('generate', e)
+            raise LLMError(str(e) or e.__class__.__name__) from e
+        finally:
+            GEMINI_LATENCY.observe(time.perf_counter() - started, method='generate')
+
+
+async def stream(prompt):
+    """
+    Yields the text Gemini generates for the prompt, chunk by chunk. The
+    timeout applies to the initial call and to the wait for each chunk; the
+    recorded latency runs until the last chunk.
+    """
+    started = time.perf_counter()
+    async with _limiter():
+        try:
+            response = await asyncio.wait_for(model.generate_content_async(prompt, stream=True), TIMEOUT)
+            chunks = aiter(response)
+            while True:
+                try:
+                    chunk = await asyncio.wait_for(anext(chunks), TIMEOUT)
+                except StopAsyncIteration:
+                    return
+                yield chunk.text
+        except Exception as e:
+            record_error('stream', e)
+            raise LLMError(str(e) or e.__class__.__name__) from e
+        finally:
+            GEMINI_LATENCY.observe(time.perf_counter() - started, method='stream')
@@ -0,0 +1,59 @@
+# backend/chatbot/management/commands/benchmark_intents.py
+import json
+import statistics
+import time
+from pathlib import Path
+from asgiref.sync import async_to_sync
+from django.core.management.base import BaseCommand, CommandError
+from chatbot.intent import classify_intent, CONFIDENCE_THRESHOLD
+
+DEFAULT_BENCHMARK = Path(__file__).resolve().parents[2] / 'data' / 'intent_benchmark.json'
+
+
+class Command(BaseCommand):
+    help = "Compares the local intent classifier against the Gemini classifier on a labeled benchmark set."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--file', default=str(DEFAULT_BENCHMARK), help="JSON list of {query, intent} objects.")
+        parser.add_argument('--llm', action='store_true', help="Also run every query through Gemini (slow, uses quota).")
+
+    def handle(self, *args, **options):
+        try:
+            examples = json.loads(Path(options['file']).read_text())
+        except (OSError, ValueError) as e:
+            raise CommandError(f"Could not read benchmark file: {e}")
+
+        self.report('local', examples, lambda query: classify_intent(query)[0])
+
+        # The production path: local when confident, LLM otherwise
+        confident = [example for example in examples if classify_intent(example['query'])[1] >= CONFIDENCE_THRESHOLD]
+        self.stdout.write(f"  answered locally at threshold {CONFIDENCE_THRESHOLD}: {len(confident)}/{len(examples)}")
+        if confident:
+            self.report('local (confident only)', confident, lambda query: classify_intent(query)[0])
+
+        if options['llm']:
+            from chatbot import llm
+            from chatbot.views import classify_with_llm
+            if not llm.is_configured():
+                raise CommandError("AI model not configured.")
+            classify = async_to_sync(classify_with_llm)
+            self.report('llm', examples, lambda query: classify(f"User: {query}\n"))
+
+    def report(self, name, examples, classify):
+        correct = 0
+        timings = []
+        for example in examples:
+            started = time.perf_counter()
+            predicted = classify(example['query'])
+            timings.append((time.perf_counter() - started) * 1000)
+            if example['intent'] in predicted:
+                correct += 1
+            else:
+                self.stdout.write(f"  [{name}] miss: {example['query']!r} -> {predicted} (expected {example['intent']})")
+
+        timings.sort()
+        p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+        self.stdout.write(self.style.SUCCESS(
+            f"{name}: accuracy {correct}/{len(examples)} ({correct / len(examples):.1%}), "
+            f"p50 {statistics.median(timings):.3f} ms, p95 {p95:.3f} ms"
+        ))
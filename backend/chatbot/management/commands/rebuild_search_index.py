@@ -0,0 +1,41 @@
+# backend/chatbot/management/commands/rebuild_search_index.py
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from users.models import User
+from jobs.models import Job
+from events.models import Event
+from chatbot.models import SearchDocument
+from chatbot import search
+
+
+class Command(BaseCommand):
+    help = "Rebuilds the chatbot's full-text search index from alumni, jobs and events."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        sources = [
+            (User.objects.filter(role='alumni', is_approved=True).select_related('profile'), search.build_alumni_document),
+            (Job.objects.all(), search.build_job_document),
+            (Event.objects.all(), search.build_event_document),
+        ]
+
+        with transaction.atomic():
+            SearchDocument.objects.all().delete()
+            total = 0
+            for queryset, build in sources:
+                batch = []
+                for obj in queryset.iterator(chunk_size=batch_size):
+                    document = build(obj)
+                    if document is not None:
+                        batch.append(document)
+                    if len(batch) >= batch_size:
+                        SearchDocument.objects.bulk_create(batch)
+                        total += len(batch)
+                        batch = []
+                SearchDocument.objects.bulk_create(batch)
+                total += len(batch)
+
+        self.stdout.write(self.style.SUCCESS(f"Indexed {total} documents."))
@@ -0,0 +1,72 @@
+from django.db import migrations
+
+BATCH_SIZE = 1000
+
+
+# Frozen copies of the document builders in chatbot.search, so this
+# migration keeps working when those change
+def alumni_document(user):
+    profile = user.profile
+    content = ' '.join(filter(None, [
+        user.first_name, user.last_name, user.username, profile.headline,
+        profile.company, profile.skills, profile.department, profile.location,
+    ]))
+    summary = f"Alumnus '{user.first_name or user.username}' works at '{profile.company}' with skills in '{profile.skills}'."
+    return 'alumni', user.pk, content, summary
+
+
+def job_document(job):
+    content = ' '.join([job.title, job.company, job.location, job.job_type, job.description])
+    summary = f"There is a '{job.job_type}' opening for a '{job.title}' at '{job.company}' in '{job.location}'."
+    return 'job', job.pk, content, summary
+
+
+def event_document(event):
+    content = ' '.join([event.title, event.location, event.description])
+    summary = (
+        f"There is an event '{event.title}' at '{event.location}' "
+        f"from {event.start_time:%d %b %Y %H:%M} to {event.end_time:%d %b %Y %H:%M}."
+    )
+    return 'event', event.pk, content, summary
+
+
+def build_search_index(apps, schema_editor):
+    """
+    Indexes the alumni, jobs and events that existed before the index did.
+    The FTS5 triggers (SQLite) pick the rows up as they are inserted.
+    """
+    SearchDocument = apps.get_model('chatbot', 'SearchDocument')
+    User = apps.get_model('users', 'User')
+    Job = apps.get_model('jobs', 'Job')
+    Event = apps.get_model('events', 'Event')
+
+    sources = [
+        (User.objects.filter(role='alumni', is_approved=True, profile__isnull=False).select_related('profile'), alumni_document),
+        (Job.objects.all(), job_document),
+        (Event.objects.all(), event_document),
+    ]
+    indexed = set(SearchDocument.objects.values_list('kind', 'object_id'))
+    for queryset, build in sources:
+        batch = []
+        for obj in queryset.iterator(chunk_size=BATCH_SIZE):
+            kind, object_id, content, summary = build(obj)
+            if (kind, object_id) not in indexed:
+                batch.append(SearchDocument(kind=kind, object_id=object_id, content=content, summary=summary))
+            if len(batch) >= BATCH_SIZE:
+                SearchDocument.objects.bulk_create(batch)
+                batch = []
+        SearchDocument.objects.bulk_create(batch)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('chatbot', '0003_conversations'),
+        ('events', '0003_event_end_time_index'),
+        ('jobs', '0003_job_filter_indexes'),
+        ('users', '0012_version_stamps'),
+    ]
+
+    operations = [
+        migrations.RunPython(build_search_index, migrations.RunPython.noop),
+    ]
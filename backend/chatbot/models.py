@@ -1,3 +1,60 @@
 from django.db import models
+from users.models import User
 
-# Create your models here.
+
+class SearchDocument(models.Model):
+    """
+    One searchable record (an alumnus, a job or an event) in the chatbot's
+    full-text index. `content` is what gets matched, `summary` is the sentence
+    handed to the LLM as context.
+    """
+    KIND_CHOICES = (
+        ('alumni', 'Alumni'),
+        ('job', 'Job'),
+        ('event', 'Event'),
+    )
+
+    kind = models.CharField(max_length=10, choices=KIND_CHOICES)
+    object_id = models.PositiveBigIntegerField()
+    content = models.TextField()
+    summary = models.TextField()
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['kind', 'object_id'], name='unique_search_document'),
+        ]
+
+    def __str__(self):
+        return f"{self.kind} #{self.object_id}"
+
+
+class Conversation(models.Model):
+    """
+    A server-side chat session. Old turns are folded into `summary` so the
+    prompt stays within the history token budget however long the chat runs.
+    """
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='chatbot_conversations')
+    summary = models.TextField(blank=True)
+    # Id of the newest message already folded into the summary
+    summarized_up_to = models.PositiveBigIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Conversation #{self.pk} with {self.user_id}"
+
+
+class ConversationMessage(models.Model):
+    ROLE_CHOICES = (
+        ('user', 'User'),
+        ('bot', 'Assistant'),
+    )
+
+    conversation = models.ForeignKey(Conversation, on_delete=models.CASCADE, related_name='messages')
+    role = models.CharField(max_length=10, choices=ROLE_CHOICES)
+    text = models.TextField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"{self.role} message in conversation #{self.conversation_id}"
@@ -0,0 +1,187 @@
+# backend/chatbot/search.py
+"""
+The chatbot's "librarian": a persistent full-text index over alumni, jobs and
+events. Documents are kept current by the signals in `chatbot.signals` and
+queried with SQLite FTS5 or PostgreSQL full-text search, ranked by relevance.
+"""
+import re
+from asgiref.sync import sync_to_async
+from django.db import connection
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
+from .models import SearchDocument
+
+FTS_TABLE = 'chatbot_searchdocument_fts'
+
+# How many documents are handed to the LLM as context for one query
+SEARCH_RESULT_LIMIT = 10
+
+# Filler words that would otherwise match almost every document
+STOP_WORDS = {
+    'a', 'about', 'an', 'and', 'any', 'are', 'at', 'can', 'do', 'does', 'for', 'from', 'has',
+    'have', 'how', 'i', 'in', 'is', 'it', 'me', 'my', 'of', 'on', 'or', 'show', 'tell', 'the',
+    'there', 'to', 'what', 'when', 'where', 'which', 'who', 'with',
+}
+
+
+# --- Building documents ---
+
+def build_alumni_document(user):
+    """
+    Returns an unsaved SearchDocument for an approved alumnus, or None if the
+    user should not be searchable.
+    """
+    profile = getattr(user, 'profile', None)
+    if user.role != 'alumni' or not user.is_approved or profile is None:
+        return None
+    content = ' '.join(filter(None, [
+        user.first_name, user.last_name, user.username, profile.headline,
+        profile.company, profile.skills, profile.department, profile.location,
+    ]))
+    summary = f"Alumnus '{user.first_name or user.username}' works at '{profile.company}' with skills in '{profile.skills}'."
+    return SearchDocument(kind='alumni', object_id=user.pk, content=content, summary=summary)
+
+
+def build_job_document(job):
+    content = ' '.join([job.title, job.company, job.location, job.job_type, job.description])
+    summary = f"There is a '{job.job_type}' opening for a '{job.title}' at '{job.company}' in '{job.location}'."
+    return SearchDocument(kind='job', object_id=job.pk, content=content, summary=summary)
+
+
+def build_event_document(event):
+    content = ' '.join([event.title, event.location, event.description])
+    summary = (
+        f"There is an event '{event.title}' at '{event.location}' "
+        f"from {event.start_time:%d %b %Y %H:%M} to {event.end_time:%d %b %Y %H:%M}."
+    )
+    return SearchDocument(kind='event', object_id=event.pk, content=content, summary=summary)
+
+
+# --- Keeping the index current ---
+
+def store_document(kind, object_id, document):
+    """
+    Inserts or replaces the indexed document for one object. Passing None
+    removes it from the index instead.
+    """
+    if document is None:
+        remove_document(kind, object_id)
+        return
+    SearchDocument.objects.update_or_create(
+        kind=kind, object_id=object_id,
+        defaults={'content': document.content, 'summary': document.summary},
+    )
+
+
+def remove_document(kind, object_id):
+    SearchDocument.objects.filter(kind=kind, object_id=object_id).delete()
+
+
+def store_alumni_documents(users):
+    """
+    Re-indexes many users at once. Used after bulk updates, which bypass the
+    signals; the users should come with select_related('profile').
+    """
+    users = list(users)
+    SearchDocument.objects.filter(kind='alumni', object_id__in=[user.pk for user in users]).delete()
+    SearchDocument.objects.bulk_create([document for document in map(build_alumni_document, users) if document])
+
+
+# --- Querying ---
+
+def query_terms(query):
+    """
+    Breaks a free-text query into lowercase search terms, dropping filler words.
+    """
+    words = re.findall(r'\w+', query.lower())
+    return [word for word in dict.fromkeys(words) if word not in STOP_WORDS and len(word) > 1]
+
+
+def ranked_search_sql(vendor, terms, limit):
+    """
+    Returns (sql, params) selecting the ids of the documents matching any of
+    the terms (as a prefix), best match first, or None if the database
+    `vendor` has no full-text search.
+    """
+    if vendor == 'sqlite':
+        # Quoted prefix terms, so "develop" also finds "developer"
+        match = ' OR '.join(f'"{term}"*' for term in terms)
+        return f"SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s ORDER BY rank LIMIT %s", [match, limit]
+    if vendor == 'postgresql':
+        tsquery = ' | '.join(f'{term}:*' for term in terms)
+        sql = (
+            "SELECT id FROM chatbot_searchdocument "
+            "WHERE to_tsvector('english', content) @@ to_tsquery('english', %s) "
+            "ORDER BY ts_rank(to_tsvector('english', content), to_tsquery('english', %s)) DESC LIMIT %s"
+        )
+        return sql, [tsquery, tsquery, limit]
+    return None
+
+
+def matching_ids_sql(vendor, terms):
+    """
+    Returns (sql, params) selecting the ids of the documents containing every
+    term (as a prefix), or None if the database `vendor` has no full-text
+    search.
+    """
+    if vendor == 'sqlite':
+        match = ' AND '.join(f'"{term}"*' for term in terms)
+        return f"SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s", [match]
+    if vendor == 'postgresql':
+        tsquery = ' & '.join(f'{term}:*' for term in terms)
+        sql = "SELECT id FROM chatbot_searchdocument WHERE to_tsvector('english', content) @@ to_tsquery('english', %s)"
+        return sql, [tsquery]
+    return None
+
+
+def search(query, limit=SEARCH_RESULT_LIMIT):
+    """
+    Returns up to `limit` SearchDocuments matching any term of the query,
+    best match first.
+    """
+    terms = query_terms(query)
+    if not terms:
+        return []
+
+    full_text = ranked_search_sql(connection.vendor, terms, limit)
+    if full_text is None:
+        # No full-text support on this backend; fall back to an unranked scan
+        condition = Q()
+        for term in terms:
+            condition |= Q(content__icontains=term)
+        return list(SearchDocument.objects.filter(condition)[:limit])
+
+    with connection.cursor() as cursor:
+        cursor.execute(*full_text)
+        ids = [row[0] for row in cursor.fetchall()]
+
+    documents = SearchDocument.objects.in_bulk(ids)
+    return [documents[pk] for pk in ids if pk in documents]
+
+
+def matching_object_ids(kind, query):
+    """
+    Returns a subquery of the ids of `kind` objects whose document contains
+    every term of the query (as a prefix), for filtering those objects' own
+    queryset. Returns None when the query has no searchable terms.
+    """
+    terms = query_terms(query)
+    if not terms:
+        return None
+
+    documents = SearchDocument.objects.filter(kind=kind)
+    full_text = matching_ids_sql(connection.vendor, terms)
+    if full_text is not None:
+        documents = documents.filter(id__in=RawSQL(*full_text))
+    else:
+        for term in terms:
+            documents = documents.filter(content__icontains=term)
+    return documents.values('object_id')
+
+
+async def asearch(query, limit=SEARCH_RESULT_LIMIT):
+    """
+    Async version of search(). Django has no async API for raw cursors yet,
+    so the query runs in the ORM's worker thread.
+    """
+    return await sync_to_async(search)(query, limit)
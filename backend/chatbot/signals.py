@@ -0,0 +1,49 @@
+# backend/chatbot/signals.py
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from users.models import User, Profile
+from jobs.models import Job
+from events.models import Event
+from . import search
+
+
+# --- Alumni: a user is searchable only while they are an approved alumnus ---
+
+@receiver(post_save, sender=User)
+def index_user(sender, instance, **kwargs):
+    search.store_document('alumni', instance.pk, search.build_alumni_document(instance))
+
+
+@receiver(post_save, sender=Profile)
+def index_profile(sender, instance, **kwargs):
+    user = instance.user
+    search.store_document('alumni', user.pk, search.build_alumni_document(user))
+
+
+@receiver(post_delete, sender=User)
+def unindex_user(sender, instance, **kwargs):
+    search.remove_document('alumni', instance.pk)
+
+
+# --- Jobs ---
+
+@receiver(post_save, sender=Job)
+def index_job(sender, instance, **kwargs):
+    search.store_document('job', instance.pk, search.build_job_document(instance))
+
+
+@receiver(post_delete, sender=Job)
+def unindex_job(sender, instance, **kwargs):
+    search.remove_document('job', instance.pk)
+
+
+# --- Events ---
+
+@receiver(post_save, sender=Event)
+def index_event(sender, instance, **kwargs):
+    search.store_document('event', instance.pk, search.build_event_document(instance))
+
+
+@receiver(post_delete, sender=Event)
+def unindex_event(sender, instance, **kwargs):
+    search.remove_document('event', instance.pk)
@@ -1,3 +1,211 @@
-from django.test import TestCase
+import asyncio
+import importlib
+from datetime import datetime, timezone
+from unittest import mock
+from asgiref.sync import async_to_sync
+from django.apps import apps
+from django.core.cache import caches
+from django.test import SimpleTestCase, TestCase
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+from events.models import Event
+from jobs.models import Job
+from users.models import User
+from . import conversation as conversations, llm, search
+from .intent import CONFIDENCE_THRESHOLD, classify_intent
+from .models import Conversation, ConversationMessage, SearchDocument
 
-# Create your tests here.
+
+@mock.patch.object(llm, 'model', None)  # No Gemini: only count questions get an answer
+class ChatTurnTests(TestCase):
+    def setUp(self):
+        caches['chatbot'].clear()
+        self.user = User.objects.create_user('student', role='student', is_approved=True)
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {RefreshToken.for_user(self.user).access_token}')
+
+    def test_unanswered_query_is_not_stored(self):
+        response = self.client.post('/api/chatbot/query/stream/', {'query': 'Tell me about placements'}, format='json')
+        self.assertEqual(response.status_code, 503)
+        self.assertFalse(Conversation.objects.exists())
+        self.assertFalse(ConversationMessage.objects.exists())
+
+    def test_answered_turn_is_stored_once(self):
+        # The widget's retry after a failed stream
+        self.client.post('/api/chatbot/query/stream/', {'query': 'Tell me about placements'}, format='json')
+        response = self.client.post('/api/chatbot/query/', {'query': 'How many alumni are there?'}, format='json')
+        self.assertEqual(response.status_code, 200)
+        messages = ConversationMessage.objects.filter(conversation=response.json()['conversation_id']).order_by('pk')
+        self.assertEqual([message.role for message in messages], ['user', 'bot'])
+        self.assertEqual(messages[0].text, 'How many alumni are there?')
+
+    def test_malformed_body_is_rejected(self):
+        for body in ([1, 2], {'query': 'Hi', 'history': 'abc'}, {'query': 'Hi', 'history': [1]}, {'query': 5}):
+            with self.subTest(body=body):
+                response = self.client.post('/api/chatbot/query/', body, format='json')
+                self.assertEqual(response.status_code, 400)
+        self.assertFalse(Conversation.objects.exists())
+
+    def test_new_conversation_is_saved_with_its_seed_and_first_turn(self):
+        history = [{'type': 'user', 'text': 'Hi'}, {'type': 'bot', 'text': 'Hello!'}, {'type': 'user', 'text': 'How many alumni are there?'}]
+        response = self.client.post('/api/chatbot/query/', {'query': 'How many alumni are there?', 'history': history}, format='json')
+        conversation = Conversation.objects.get()
+        self.assertEqual(response.json()['conversation_id'], conversation.pk)
+        self.assertEqual(
+            list(conversation.messages.order_by('pk').values_list('role', 'text')),
+            [('user', 'Hi'), ('bot', 'Hello!'), ('user', 'How many alumni are there?'), ('bot', response.json()['response'])],
+        )
+
+
+class SummaryTests(TestCase):
+    def setUp(self):
+        user = User.objects.create_user('student', role='student', is_approved=True)
+        self.conversation = Conversation.objects.create(user=user)
+        self.messages = ConversationMessage.objects.bulk_create([
+            ConversationMessage(conversation=self.conversation, role='user', text='I know Django'),
+            ConversationMessage(conversation=self.conversation, role='bot', text='Great!'),
+        ])
+
+    @mock.patch.object(conversations, 'SUMMARY_TIMEOUT', 0.01)
+    @mock.patch.object(llm, 'is_configured', lambda: True)
+    def test_slow_summary_falls_back_to_the_text(self):
+        async def slow_generate(prompt):
+            await asyncio.sleep(1)
+            return 'too late'
+
+        with mock.patch.object(llm, 'generate', slow_generate):
+            async_to_sync(conversations.summarize)(self.conversation, self.messages)
+        self.conversation.refresh_from_db()
+        self.assertEqual(self.conversation.summary, 'User: I know Django\nAssistant: Great!')
+        self.assertEqual(self.conversation.summarized_up_to, self.messages[-1].pk)
+
+
+class SearchIndexTests(TestCase):
+    def setUp(self):
+        self.poster = User.objects.create_user('poster', role='alumni', is_approved=False)
+
+    def add_alumnus(self, username, is_approved=True, **profile):
+        user = User.objects.create_user(username, role='alumni', is_approved=is_approved)
+        for field, value in profile.items():
+            setattr(user.profile, field, value)
+        user.profile.save()
+        return user
+
+    def add_job(self, title, description='Great team.'):
+        return Job.objects.create(
+            title=title, company='Infosys', location='Mohali', job_type='Full-Time',
+            description=description, posted_by=self.poster,
+        )
+
+    def add_event(self, title):
+        start = datetime(2026, 11, 1, 10, tzinfo=timezone.utc)
+        return Event.objects.create(
+            title=title, description='Open to all.', start_time=start,
+            end_time=start.replace(hour=12), location='Main Hall', organizer=self.poster,
+        )
+
+    def document(self, kind, object_id):
+        return SearchDocument.objects.filter(kind=kind, object_id=object_id).first()
+
+    def test_only_approved_alumni_are_indexed(self):
+        user = self.add_alumnus('asha', company='Infosys', skills='Django')
+        self.assertIn('Infosys', self.document('alumni', user.pk).content)
+        self.assertIsNone(self.document('alumni', self.poster.pk))
+
+        # A profile edit re-indexes the alumnus
+        user.profile.company = 'Zomato'
+        user.profile.save()
+        self.assertIn('Zomato', self.document('alumni', user.pk).content)
+
+        user.is_approved = False
+        user.save()
+        self.assertIsNone(self.document('alumni', user.pk))
+
+    def test_deleted_user_is_unindexed(self):
+        user = self.add_alumnus('asha')
+        user.delete()
+        self.assertIsNone(self.document('alumni', user.pk))
+
+    def test_jobs_and_events_follow_their_rows(self):
+        job = self.add_job('Backend Developer')
+        event = self.add_event('Alumni Meet')
+        self.assertIn('Backend Developer', self.document('job', job.pk).content)
+        self.assertIn('01 Nov 2026 10:00', self.document('event', event.pk).summary)
+
+        job.title = 'Data Analyst'
+        job.save()
+        self.assertIn('Data Analyst', self.document('job', job.pk).content)
+
+        job_pk, event_pk = job.pk, event.pk
+        job.delete()
+        event.delete()
+        self.assertIsNone(self.document('job', job_pk))
+        self.assertIsNone(self.document('event', event_pk))
+
+    def test_search_ranks_by_relevance_and_matches_prefixes(self):
+        frontend = self.add_job('Frontend Developer', description='React.')
+        django = self.add_job('Django Developer', description='Django, Django REST framework and Celery.')
+        self.add_job('Accountant', description='Tally.')
+        results = search.search('django develop')
+        self.assertEqual([document.object_id for document in results], [django.pk, frontend.pk])
+        self.assertEqual(search.search('the and of'), [])
+
+    def test_matching_object_ids_needs_every_term(self):
+        backend = self.add_job('Backend Developer', description='Django.')
+        self.add_job('Frontend Developer', description='React.')
+        self.add_event('Django Meetup')
+        ids = search.matching_object_ids('job', 'develop django')
+        self.assertEqual(list(ids.values_list('object_id', flat=True)), [backend.pk])
+        self.assertIsNone(search.matching_object_ids('job', 'of the'))
+
+    def test_migration_backfills_existing_rows(self):
+        user = self.add_alumnus('asha')
+        job = self.add_job('Backend Developer')
+        SearchDocument.objects.filter(kind='job').delete()
+
+        migration = importlib.import_module('chatbot.migrations.0004_backfill_search_index')
+        migration.build_search_index(apps, None)
+        self.assertIsNotNone(self.document('job', job.pk))
+        self.assertEqual(SearchDocument.objects.filter(kind='alumni', object_id=user.pk).count(), 1)
+        self.assertEqual(search.search('backend')[0].object_id, job.pk)
+
+
+class FullTextSQLTests(SimpleTestCase):
+    def test_postgresql_queries(self):
+        sql, params = search.ranked_search_sql('postgresql', ['django', 'develop'], 10)
+        self.assertIn("ORDER BY ts_rank(", sql)
+        self.assertEqual(params, ['django:* | develop:*', 'django:* | develop:*', 10])
+        sql, params = search.matching_ids_sql('postgresql', ['django', 'develop'])
+        self.assertIn("@@ to_tsquery('english', %s)", sql)
+        self.assertEqual(params, ['django:* & develop:*'])
+
+    def test_sqlite_queries(self):
+        self.assertEqual(search.ranked_search_sql('sqlite', ['django', 'develop'], 5)[1], ['"django"* OR "develop"*', 5])
+        self.assertEqual(search.matching_ids_sql('sqlite', ['django', 'develop'])[1], ['"django"* AND "develop"*'])
+
+    def test_other_backends_have_no_full_text(self):
+        self.assertIsNone(search.ranked_search_sql('mysql', ['django'], 5))
+        self.assertIsNone(search.matching_ids_sql('mysql', ['django']))
+
+
+class IntentTests(SimpleTestCase):
+    def test_platform_wide_counts_are_answered_locally(self):
+        for query, intent in (
+            ('How many alumni are there?', 'alumni_count'),
+            ("What's the total number of alumni registered?", 'alumni_count'),
+            ('how many student accounts exist', 'student_count'),
+        ):
+            with self.subTest(query=query):
+                self.assertEqual(classify_intent(query), (intent, 1.0))
+
+    def test_qualified_counts_are_left_to_the_llm(self):
+        for query in (
+            'how many alumni work at google',
+            'total alumni from CSE department',
+            'number of alumni who know python',
+            'how many students attended the hackathon event',
+        ):
+            with self.subTest(query=query):
+                intent, confidence = classify_intent(query)
+                self.assertEqual(intent, 'keyword_search')
+                self.assertLess(confidence, CONFIDENCE_THRESHOLD)
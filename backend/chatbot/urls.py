@@ -1,7 +1,8 @@
 # backend/chatbot/urls.py
 from django.urls import path
-from .views import ChatbotQueryView
+from .views import ChatbotQueryView, ChatbotStreamView
 
 urlpatterns = [
     path('query/', ChatbotQueryView.as_view(), name='chatbot-query'),
+    path('query/stream/', ChatbotStreamView.as_view(), name='chatbot-query-stream'),
 ]
\ No newline at end of file
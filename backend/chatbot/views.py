@@ -1,126 +1,276 @@
-import google.generativeai as genai
-from django.conf import settings
-from rest_framework.views import APIView
-from rest_framework.response import Response
-from rest_framework.permissions import IsAuthenticated
+# backend/chatbot/views.py
+"""
+The chatbot endpoints are native async views. Under the ASGI application
+(backend/asgi.py) a request waiting on Gemini does not hold a thread, so one
+process can serve many concurrent chat sessions.
+"""
+import json
+from asgiref.sync import sync_to_async
+from backend import metrics
+from django.http import JsonResponse, StreamingHttpResponse
+from django.utils.decorators import method_decorator
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
 from rest_framework import status
-import re # Import the regular expression module for cleaning text
+from rest_framework.exceptions import AuthenticationFailed
 
-# Import our database models to search them
+# Import our database models and the full-text index
 from users.models import User
-from events.models import Event
-from jobs.models import Job
+from users.authentication import CachedJWTAuthentication
+from . import conversation as conversations, llm
+from .search import asearch
+from .cache import aget_cached, aset_cached
+from .intent import classify_intent, CONFIDENCE_THRESHOLD, INTENTS
 
-# Configure the Gemini AI Model
-try:
-    genai.configure(api_key=settings.GOOGLE_API_KEY)
-    model = genai.GenerativeModel('gemini-1.5-flash-latest')
-except Exception as e:
-    print(f"CRITICAL ERROR: Could not configure Google AI. Check your GOOGLE_API_KEY. Error: {e}")
-    model = None
+CHATBOT_INTENTS = metrics.Counter(
+    'chatbot_intents_total', 'Chatbot queries by intent and by what classified them (local, llm, cache or fallback).', ['intent', 'source'],
+)
 
 
-def search_platform_data(query):
+async def search_platform_data(query):
     """
-    Performs a robust keyword search across our database models to find relevant context.
+    Looks up the most relevant alumni, jobs and events for the query in the
+    full-text index and returns them as context lines for the LLM.
     This acts as our "librarian".
     """
-    context_parts = []
-    # Clean the query and break it into a set of unique keywords for searching
-    query_words = set(re.sub(r'[^\w\s]', '', query.lower()).split())
-
-    # --- Search Alumni ---
-    alumni = User.objects.filter(role='alumni', is_approved=True).prefetch_related('profile')
-    for person in alumni:
-        # Create a single string of searchable text for each alumnus
-        searchable_text = f"{person.first_name or ''} {person.username} {person.profile.company or ''} {person.profile.skills or ''}".lower()
-        # Check if any of the query words appear in the user's info
-        if any(word in searchable_text for word in query_words):
-            context_parts.append(f"Alumnus '{person.first_name or person.username}' works at '{person.profile.company}' with skills in '{person.profile.skills}'.")
-
-    # --- Search Jobs ---
-    jobs = Job.objects.all()
-    for job in jobs:
-        # Create a single string of searchable text for each job
-        searchable_text = f"{job.title} {job.company} {job.description}".lower()
-        # Check if any of the query words appear in the job's info
-        if any(word in searchable_text for word in query_words):
-            context_parts.append(f"There is a '{job.job_type}' opening for a '{job.title}' at '{job.company}'.")
-
-    # This can be expanded to search events in the future
-    
-    return "\n".join(context_parts)
-
-
-class ChatbotQueryView(APIView):
-    permission_classes = [IsAuthenticated]
-
-    def post(self, request, *args, **kwargs):
-        if not model:
-            return Response({"error": "AI model not configured."}, status=status.HTTP_503_SERVICE_UNAVAILABLE)
-
-        user_query = request.data.get('query', '')
-        history = request.data.get('history', [])
-        if not user_query:
-            return Response({"error": "Query is empty."}, status=status.HTTP_400_BAD_REQUEST)
-        history_transcript = ""
-        for message in history:
-            role = "User" if message.get('type') == 'user' else "Assistant"
-            history_transcript += f"{role}: {message.get('text')}\n"
-
-
-        
-        # --- AI BRAIN 1: The "Department Head" for Intent Classification ---
-        classification_prompt = f"""
-        Given the following conversation history, classify the user's LATEST query into one of the categories:
-        'alumni_count', 'student_count', 'keyword_search', 'general_question'.
-        Respond with ONLY the category name.
-
-        History:
-        {history_transcript}
+    return "\n".join(document.summary for document in await asearch(query))
+
+
+async def classify_with_llm(history_transcript):
+    """
+    Asks Gemini to pick the intent of the latest query. Only used when the
+    local classifier is not confident enough.
+    """
+    classification_prompt = f"""
+    Given the following conversation history, classify the user's LATEST query into one of the categories:
+    'alumni_count', 'student_count', 'keyword_search', 'general_question'.
+    Respond with ONLY the category name.
+
+    History:
+    {history_transcript}
+    """
+    intent = await llm.generate(classification_prompt)
+    return intent.strip().lower().replace("'", "").replace('"', '')
+
+
+class ChatbotError(Exception):
+    """
+    A failure that should be reported to the client with the given status.
+    """
+    def __init__(self, message, status_code=status.HTTP_500_INTERNAL_SERVER_ERROR):
+        super().__init__(message)
+        self.message = message
+        self.status_code = status_code
+
+
+async def prepare_answer(user_query, history_transcript):
+    """
+    Runs every step before the final answer generation, given the bounded
+    history transcript (which ends with the user's latest query).
+    Returns (answer, prompt): `answer` is set when the question could be
+    answered without the LLM (counts, cached answers), otherwise `prompt` is
+    what should be sent to Gemini. Raises ChatbotError on failure.
+    """
+    # --- AI BRAIN 1: The "Department Head" for Intent Classification ---
+    # The local classifier runs first; count questions it is sure about
+    # are answered straight from the database, no LLM needed.
+    intent, confidence = classify_intent(user_query)
+    source = 'local'
+    is_local_count = confidence >= CONFIDENCE_THRESHOLD and intent in ('alumni_count', 'student_count')
+
+    if not is_local_count:
+        # A repeated conversation gets the answer we generated last time
+        cached_response = await aget_cached('response', user_query, history_transcript)
+        if cached_response is not None:
+            return cached_response, None
+
+        if not llm.is_configured():
+            raise ChatbotError("AI model not configured.", status.HTTP_503_SERVICE_UNAVAILABLE)
+
+    # Low confidence: fall back to the LLM, reusing an earlier classification
+    if confidence < CONFIDENCE_THRESHOLD:
+        cached_intent = await aget_cached('intent', user_query, history_transcript)
+        if cached_intent is not None:
+            intent, source = cached_intent, 'cache'
+        else:
+            try:
+                intent, source = await classify_with_llm(history_transcript), 'llm'
+                await aset_cached('intent', user_query, history_transcript, intent)
+            except llm.LLMError as e:
+                print(f"Error during intent classification: {e}")
+                intent, source = 'general_question', 'fallback'
+
+    # The LLM's answer is free text, so count it under the intent it is handled as
+    handled_as = next((name for name in INTENTS if name in intent), 'general_question')
+    CHATBOT_INTENTS.inc(intent=handled_as, source=source)
+
+    # --- AI BRAIN 2: The "Delegation" Logic ---
+
+    # Task: Get Alumni Count
+    if 'alumni_count' in intent:
+        try:
+            count = await User.objects.filter(role='alumni', is_approved=True).acount()
+        except Exception:
+            raise ChatbotError("Could not query the alumni count.")
+        return f"There are currently {count} approved alumni registered on the Punjab Alumni Connect platform.", None
+
+    # Task: Get Student Count
+    elif 'student_count' in intent:
+        try:
+            count = await User.objects.filter(role='student', is_approved=True).acount()
+        except Exception:
+            raise ChatbotError("Could not query the student count.")
+        return f"There are currently {count} approved students registered on the platform.", None
+
+    # Task: Search the Database (The "Librarian")
+    elif 'keyword_search' in intent:
+        context = await search_platform_data(user_query)
+        if context:
+            prompt = f"You are Alumni Assist. Given the conversation history, use ONLY the provided information to answer the user's latest query.\n\nHistory:\n{history_transcript}\nInformation:\n{context}"
+        else:
+            prompt = f"You are Alumni Assist. You searched the database for the user's latest query but found no results. Given the conversation history, inform the user of this, then try to answer generally.\n\nHistory:\n{history_transcript}"
+    else: # general_question
+        # The prompt now includes the history
+        prompt = f"You are Alumni Assist. Continue the following conversation naturally.\n\nHistory:\n{history_transcript}"
+
+    return None, prompt
+
+
+def authenticate_jwt(request):
+    """
+    Resolves the user from the Authorization header the same way DRF does for
+    the other endpoints. Returns None when no token was sent.
+    """
+    result = CachedJWTAuthentication().authenticate(request)
+    return result[0] if result else None
+
+
+class ChatbotBaseView(View):
+    """
+    Shared request handling for the async chatbot views: JWT authentication,
+    parsing of the {query, conversation_id} JSON body and loading the
+    server-side conversation.
+    """
+
+    async def start_turn(self, request):
+        """
+        Returns (conversation, user_query, history_transcript), or raises
+        ChatbotError. The query is only stored with its answer (see
+        conversations.add_turn).
         """
         try:
-            intent_response = model.generate_content(classification_prompt)
-            intent = intent_response.text.strip().lower().replace("'", "").replace('"', '')
-        except Exception as e:
-            print(f"Error during intent classification: {e}")
-            intent = 'general_question'
-
-        # --- AI BRAIN 2: The "Delegation" Logic ---
-        
-        # Task: Get Alumni Count
-        if 'alumni_count' in intent:
-            try:
-                count = User.objects.filter(role='alumni', is_approved=True).count()
-                response_text = f"There are currently {count} approved alumni registered on the Punjab Alumni Connect platform."
-                return Response({"response": response_text})
-            except Exception:
-                return Response({"error": "Could not query the alumni count."}, status=500)
-
-        # Task: Get Student Count
-        elif 'student_count' in intent:
-            try:
-                count = User.objects.filter(role='student', is_approved=True).count()
-                response_text = f"There are currently {count} approved students registered on the platform."
-                return Response({"response": response_text})
-            except Exception:
-                return Response({"error": "Could not query the student count."}, status=500)
-
-        # Task: Search the Database (The "Librarian")
-        elif 'keyword_search' in intent:
-            context = search_platform_data(user_query)
-            if context:
-                prompt = f"You are Alumni Assist. Given the conversation history, use ONLY the provided information to answer the user's latest query.\n\nHistory:\n{history_transcript}\nInformation:\n{context}"
-            else:
-                prompt = f"You are Alumni Assist. You searched the database for the user's latest query but found no results. Given the conversation history, inform the user of this, then try to answer generally.\n\nHistory:\n{history_transcript}"
-        else: # general_question
-            # The prompt now includes the history
-            prompt = f"You are Alumni Assist. Continue the following conversation naturally.\n\nHistory:\n{history_transcript}"
+            user = await sync_to_async(authenticate_jwt)(request)
+        except AuthenticationFailed as e:
+            raise ChatbotError(str(e.detail), status.HTTP_401_UNAUTHORIZED)
+        if user is None:
+            raise ChatbotError("Authentication credentials were not provided.", status.HTTP_401_UNAUTHORIZED)
+
+        try:
+            data = json.loads(request.body or b'{}')
+        except ValueError:
+            raise ChatbotError("Invalid JSON body.", status.HTTP_400_BAD_REQUEST)
+        if not isinstance(data, dict):
+            raise ChatbotError("The JSON body must be an object.", status.HTTP_400_BAD_REQUEST)
+        user_query = data.get('query', '')
+        if not isinstance(user_query, str):
+            raise ChatbotError("Query must be a string.", status.HTTP_400_BAD_REQUEST)
+        if not user_query:
+            raise ChatbotError("Query is empty.", status.HTTP_400_BAD_REQUEST)
+
+        # `history` is only read to seed a new conversation for older clients;
+        # its last entry is the query itself.
+        history = data.get('history', [])
+        if not isinstance(history, list) or not all(isinstance(message, dict) for message in history):
+            raise ChatbotError("History must be a list of messages.", status.HTTP_400_BAD_REQUEST)
+        seed_history = history[:-1]
+        conversation_id = data.get('conversation_id')
+        if conversation_id is not None and not str(conversation_id).isdigit():
+            raise ChatbotError("Invalid conversation id.", status.HTTP_400_BAD_REQUEST)
+        conversation = await conversations.start_or_resume(user, conversation_id, seed_history)
+        if conversation is None:
+            raise ChatbotError("Conversation not found.", status.HTTP_404_NOT_FOUND)
+
+        history_transcript = await conversations.build_transcript(conversation, user_query)
+        return conversation, user_query, history_transcript
+
+
+@method_decorator(csrf_exempt, name='dispatch')
+class ChatbotQueryView(ChatbotBaseView):
+
+    async def post(self, request, *args, **kwargs):
+        try:
+            conversation, user_query, history_transcript = await self.start_turn(request)
+            answer, prompt = await prepare_answer(user_query, history_transcript)
+        except ChatbotError as e:
+            return JsonResponse({"error": e.message}, status=e.status_code)
 
         # --- Final Answer Generation ---
+        if answer is None:
+            try:
+                answer = await llm.generate(prompt)
+            except llm.LLMError as e:
+                print(f"ERROR during final Gemini API call: {e}")
+                return JsonResponse({"error": "An error occurred while generating the AI response."}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+            await aset_cached('response', user_query, history_transcript, answer)
+
+        await conversations.add_turn(conversation, user_query, answer)
+        return JsonResponse({"response": answer, "conversation_id": conversation.pk})
+
+
+def sse_event(data, event=None):
+    """
+    Formats one Server-Sent Events message carrying a JSON payload.
+    """
+    prefix = f"event: {event}\n" if event else ""
+    return f"{prefix}data: {json.dumps(data)}\n\n"
+
+
+async def stream_answer(conversation, user_query, history_transcript, answer, prompt):
+    """
+    Yields the answer as SSE messages: one 'data' message per text chunk,
+    then a final 'done' event carrying the conversation id (or an 'error'
+    event if generation fails).
+    """
+    if answer is not None:
+        yield sse_event({"text": answer})
+        await conversations.add_turn(conversation, user_query, answer)
+        yield sse_event({"conversation_id": conversation.pk}, event="done")
+        return
+
+    chunks = []
+    try:
+        async for text in llm.stream(prompt):
+            chunks.append(text)
+            yield sse_event({"text": text})
+    except llm.LLMError as e:
+        print(f"ERROR during streaming Gemini API call: {e}")
+        yield sse_event({"error": "An error occurred while generating the AI response."}, event="error")
+        return
+
+    answer = "".join(chunks)
+    await aset_cached('response', user_query, history_transcript, answer)
+    await conversations.add_turn(conversation, user_query, answer)
+    yield sse_event({"conversation_id": conversation.pk}, event="done")
+
+
+@method_decorator(csrf_exempt, name='dispatch')
+class ChatbotStreamView(ChatbotBaseView):
+    """
+    Streams the chatbot's answer as Server-Sent Events while Gemini generates
+    it. Accepts the same JSON body as ChatbotQueryView.
+    """
+
+    async def post(self, request, *args, **kwargs):
         try:
-            final_response = model.generate_content(prompt)
-            return Response({"response": final_response.text})
-        except Exception as e:
-            print(f"ERROR during final Gemini API call: {e}")
-            return Response({"error": "An error occurred while generating the AI response."}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
\ No newline at end of file
+            conversation, user_query, history_transcript = await self.start_turn(request)
+            answer, prompt = await prepare_answer(user_query, history_transcript)
+        except ChatbotError as e:
+            return JsonResponse({"error": e.message}, status=e.status_code)
+
+        response = StreamingHttpResponse(
+            stream_answer(conversation, user_query, history_transcript, answer, prompt),
+            content_type='text/event-stream',
+        )
+        response['Cache-Control'] = 'no-cache'
+        response['X-Accel-Buffering'] = 'no'  # Stop nginx from buffering the stream
+        return response
@@ -10,5 +10,13 @@ class Event(models.Model):
     location = models.CharField(max_length=200)
     organizer = models.ForeignKey(User, on_delete=models.CASCADE, related_name='organized_events')
 
+    class Meta:
+        indexes = [
+            # Events are listed in start order
+            models.Index(fields=['start_time'], name='event_start_time_idx'),
+            # Finds upcoming (not yet ended) events without scanning the past
+            models.Index(fields=['end_time'], name='event_end_time_idx'),
+        ]
+
     def __str__(self):
         return self.title
\ No newline at end of file
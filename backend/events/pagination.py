@@ -0,0 +1,18 @@
+# backend/events/pagination.py
+from rest_framework.pagination import CursorPagination
+
+
+class EventCursorPagination(CursorPagination):
+    """
+    Cursor pagination for the events list. Upcoming events come soonest
+    first; past events (?when=past) most recent first.
+    """
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    ordering = ('start_time', 'id')
+
+    def get_ordering(self, request, queryset, view):
+        if request.query_params.get('when') == 'past':
+            return ('-start_time', '-id')
+        return self.ordering
@@ -0,0 +1,12 @@
+# backend/events/signals.py
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from backend import response_cache
+from .models import Event
+
+
+# Keeps the cached events list (backend/response_cache.py) current
+@receiver(post_save, sender=Event)
+@receiver(post_delete, sender=Event)
+def invalidate_events_responses(sender, instance, **kwargs):
+    response_cache.invalidate('events')
@@ -1,3 +1,83 @@
+from datetime import timedelta
 from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+from users.models import User
+from .models import Event
 
-# Create your tests here.
+
+class EventListTests(TestCase):
+    url = '/api/events/'
+
+    def setUp(self):
+        self.organizer = User.objects.create_user('organizer', role='alumni', is_approved=True)
+        self.other = User.objects.create_user('other', role='alumni', is_approved=True)
+        self.client = APIClient()
+        self.client.force_authenticate(self.other)
+
+    def add_event(self, days_from_now, organizer=None):
+        start = timezone.now() + timedelta(days=days_from_now)
+        return Event.objects.create(
+            title=f'Meetup {days_from_now}', description='', location='Mohali',
+            start_time=start, end_time=start + timedelta(hours=2), organizer=organizer or self.organizer,
+        )
+
+    def titles(self, query=''):
+        return [event['title'] for event in self.client.get(self.url + query).data['results']]
+
+    def test_upcoming_by_default_soonest_first(self):
+        self.add_event(-3)
+        self.add_event(5)
+        self.add_event(1)
+        self.assertEqual(self.titles(), ['Meetup 1', 'Meetup 5'])
+
+    def test_past_most_recent_first(self):
+        self.add_event(-30)
+        self.add_event(-3)
+        self.add_event(2)
+        self.assertEqual(self.titles('?when=past'), ['Meetup -3', 'Meetup -30'])
+
+    def test_date_range_and_organizer_filters(self):
+        self.add_event(3)
+        self.add_event(10, organizer=self.other)
+        self.add_event(40)
+        after = (timezone.now() + timedelta(days=2)).date().isoformat()
+        before = (timezone.now() + timedelta(days=20)).date().isoformat()
+        self.assertEqual(self.titles(f'?start_after={after}&start_before={before}'), ['Meetup 3', 'Meetup 10'])
+        self.assertEqual(self.titles(f'?organizer={self.other.pk}'), ['Meetup 10'])
+        self.assertEqual(self.client.get(self.url + '?organizer=me').status_code, 400)
+
+    def test_constant_queries_and_cursor_pages(self):
+        for day in range(1, 26):
+            self.add_event(day, organizer=User.objects.create_user(f'organizer{day}'))
+        with self.assertNumQueries(1):
+            first = self.client.get(self.url).data
+        second = self.client.get(first['next']).data
+        self.assertEqual(len(first['results']), 20)
+        self.assertEqual(len(second['results']), 5)
+        self.assertEqual(first['results'][0]['organizer_username'], 'organizer1')
+
+    def test_cached_until_an_event_or_organizer_changes(self):
+        event = self.add_event(1)
+        self.assertEqual(self.titles(), ['Meetup 1'])
+        with self.assertNumQueries(0):
+            self.assertEqual(self.titles(), ['Meetup 1'])
+
+        event.title = 'Renamed'
+        event.save()
+        self.assertEqual(self.titles(), ['Renamed'])
+        self.organizer.username = 'host'
+        self.organizer.save()
+        self.assertEqual(self.client.get(self.url).data['results'][0]['organizer_username'], 'host')
+
+    def test_if_none_match(self):
+        self.add_event(1)
+        etag = self.client.get(self.url)['ETag']
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b'')
+
+        self.add_event(2)
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
@@ -2,20 +2,70 @@ from django.shortcuts import render
 
 # Create your views here.
 # backend/events/views.py
+from datetime import datetime, time
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
 from rest_framework import generics
+from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import IsAuthenticated
+from backend.response_cache import CachedResponseMixin
 from .models import Event
+from .pagination import EventCursorPagination
 from .serializers import EventSerializer
 from .permissions import IsOrganizerOrReadOnly, CanCreateEventsPermission
 
-class EventListCreateView(generics.ListCreateAPIView):
+class EventListCreateView(CachedResponseMixin, generics.ListCreateAPIView):
     """
-    Allows authenticated users to see a list of all events.
+    Allows authenticated users to see a paginated list of events.
     Allows authenticated users to create a new event.
+    Supported query parameters:
+    - when: 'upcoming' (default, events that have not ended), 'past' or 'all'
+    - start_after / start_before: ISO dates or datetimes bounding start_time
+    - organizer: user id of the organizer
+    GET responses are cached until an event (or an organizer's username) changes.
     """
-    queryset = Event.objects.all().order_by('start_time') # Show upcoming events first
     serializer_class = EventSerializer
     permission_classes = [IsAuthenticated, CanCreateEventsPermission]
+    pagination_class = EventCursorPagination
+    cache_scopes = ('events',)
+
+    def get_queryset(self):
+        params = self.request.query_params
+        # The organizer's username is serialized, so join it up front
+        queryset = Event.objects.select_related('organizer')
+
+        when = params.get('when', 'upcoming')
+        if when == 'upcoming':
+            queryset = queryset.filter(end_time__gte=timezone.now())
+        elif when == 'past':
+            queryset = queryset.filter(end_time__lt=timezone.now())
+        elif when != 'all':
+            raise ValidationError({'when': "Must be 'upcoming', 'past' or 'all'."})
+
+        for param, lookup in (('start_after', 'start_time__gte'), ('start_before', 'start_time__lte')):
+            value = params.get(param)
+            if value:
+                queryset = queryset.filter(**{lookup: self.parse_moment(param, value)})
+
+        organizer = params.get('organizer')
+        if organizer:
+            if not organizer.isdigit():
+                raise ValidationError({'organizer': 'Must be a user id.'})
+            queryset = queryset.filter(organizer_id=organizer)
+        return queryset
+
+    @staticmethod
+    def parse_moment(param, value):
+        moment = parse_datetime(value)
+        if moment is None:
+            day = parse_date(value)
+            if day is None:
+                raise ValidationError({param: 'Must be a date (YYYY-MM-DD) or an ISO datetime.'})
+            moment = datetime.combine(day, time.min)
+        if timezone.is_naive(moment):
+            moment = timezone.make_aware(moment)
+        return moment
+
     # When a new event is created, automatically set the organizer to the current user
     def perform_create(self, serializer):
         serializer.save(organizer=self.request.user)
@@ -25,7 +75,7 @@ class EventDetailView(generics.RetrieveUpdateDestroyAPIView):
     Handles retrieving (GET), updating (PUT/PATCH), and deleting (DELETE)
     a single event instance.
     """
-    queryset = Event.objects.all()
+    queryset = Event.objects.select_related('organizer')
     serializer_class = EventSerializer
     permission_classes = [IsAuthenticated, IsOrganizerOrReadOnly]
     # In a real app, we would add a custom permission here to ensure
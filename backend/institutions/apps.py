@@ -4,3 +4,8 @@ from django.apps import AppConfig
 class InstitutionsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'institutions'
+
+    # Keep the analytics counters in sync with user changes, and the cached
+    # institutions list with institution changes
+    def ready(self):
+        from . import signals
@@ -0,0 +1,70 @@
+# backend/institutions/counters.py
+"""
+Helpers for the denormalized UserCounter table.
+"""
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F
+from .models import UserCounter
+
+
+def adjust(role, is_approved, delta, institution_id=None):
+    """
+    Adds `delta` to the global counter for (role, is_approved) and, when an
+    institution is given, to that institution's counter as well.
+    """
+    _adjust_row('global', None, role, is_approved, delta)
+    if institution_id is not None:
+        adjust_institution(institution_id, role, is_approved, delta)
+
+
+def adjust_institution(institution_id, role, is_approved, delta):
+    """
+    Adds `delta` to one institution's counter only.
+    """
+    _adjust_row('institution', institution_id, role, is_approved, delta)
+
+
+def _adjust_row(scope, institution_id, role, is_approved, delta):
+    lookup = {'scope': scope, 'institution_id': institution_id, 'role': role, 'is_approved': is_approved}
+    if UserCounter.objects.filter(**lookup).update(count=F('count') + delta):
+        return
+    try:
+        with transaction.atomic():
+            UserCounter.objects.create(count=delta, **lookup)
+    except IntegrityError:
+        # Another request created the row first
+        UserCounter.objects.filter(**lookup).update(count=F('count') + delta)
+
+
+def rebuild():
+    """
+    Recomputes every counter from the users table with two GROUP BY queries.
+    Use after bulk operations that bypass model signals. Inactive users are
+    not counted.
+    """
+    from users.models import User
+
+    active = User.objects.filter(is_active=True)
+    counters = [
+        UserCounter(scope='global', role=row['role'], is_approved=row['is_approved'], count=row['total'])
+        for row in active.values('role', 'is_approved').annotate(total=Count('pk')).order_by()
+    ]
+    counters += [
+        UserCounter(
+            scope='institution', institution_id=row['profile__institution'],
+            role=row['role'], is_approved=row['is_approved'], count=row['total'],
+        )
+        for row in active.filter(profile__institution__isnull=False)
+        .values('profile__institution', 'role', 'is_approved').annotate(total=Count('pk')).order_by()
+    ]
+    with transaction.atomic():
+        UserCounter.objects.all().delete()
+        UserCounter.objects.bulk_create(counters)
+
+
+def read(scope, institution_id=None):
+    """
+    Returns {(role, is_approved): count} for one scope in a single query.
+    """
+    rows = UserCounter.objects.filter(scope=scope, institution_id=institution_id)
+    return {(role, is_approved): count for role, is_approved, count in rows.values_list('role', 'is_approved', 'count')}
@@ -0,0 +1,11 @@
+# backend/institutions/management/commands/rebuild_user_counters.py
+from django.core.management.base import BaseCommand
+from institutions import counters
+
+
+class Command(BaseCommand):
+    help = "Recomputes the denormalized analytics counters from the users table."
+
+    def handle(self, *args, **options):
+        counters.rebuild()
+        self.stdout.write(self.style.SUCCESS("User counters rebuilt."))
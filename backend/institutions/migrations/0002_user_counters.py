@@ -0,0 +1,54 @@
+# Generated by Django 5.2.18 on 2026-10-18 14:55
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def build_counters(apps, schema_editor):
+    """
+    Fills the counters from the existing active users.
+    """
+    User = apps.get_model('users', 'User')
+    UserCounter = apps.get_model('institutions', 'UserCounter')
+
+    active = User.objects.filter(is_active=True)
+    counters = [
+        UserCounter(scope='global', role=row['role'], is_approved=row['is_approved'], count=row['total'])
+        for row in active.values('role', 'is_approved').annotate(total=Count('pk')).order_by()
+    ]
+    counters += [
+        UserCounter(
+            scope='institution', institution_id=row['profile__institution'],
+            role=row['role'], is_approved=row['is_approved'], count=row['total'],
+        )
+        for row in active.filter(profile__institution__isnull=False)
+        .values('profile__institution', 'role', 'is_approved').annotate(total=Count('pk')).order_by()
+    ]
+    UserCounter.objects.bulk_create(counters)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('institutions', '0001_initial'),
+        ('users', '0010_profile_directory_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('scope', models.CharField(choices=[('global', 'Whole platform'), ('institution', 'Single institution')], max_length=12)),
+                ('role', models.CharField(max_length=20)),
+                ('is_approved', models.BooleanField()),
+                ('count', models.BigIntegerField(default=0)),
+                ('institution', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='user_counters', to='institutions.institution')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(condition=models.Q(('scope', 'global')), fields=('role', 'is_approved'), name='unique_global_user_counter'), models.UniqueConstraint(condition=models.Q(('scope', 'institution')), fields=('institution', 'role', 'is_approved'), name='unique_institution_user_counter')],
+            },
+        ),
+        migrations.RunPython(build_counters, migrations.RunPython.noop),
+    ]
@@ -16,4 +16,38 @@ class Institution(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
 
     def __str__(self):
-        return self.name
\ No newline at end of file
+        return self.name
+
+class UserCounter(models.Model):
+    """
+    Denormalized user counts for the analytics dashboards, one row per
+    (scope, institution, role, approval state). Maintained by the signals in
+    `institutions.signals`, so reading the stats never has to COUNT users.
+    """
+    SCOPE_CHOICES = (
+        ('global', 'Whole platform'),
+        ('institution', 'Single institution'),
+    )
+
+    scope = models.CharField(max_length=12, choices=SCOPE_CHOICES)
+    institution = models.ForeignKey(Institution, on_delete=models.CASCADE, null=True, blank=True, related_name='user_counters')
+    role = models.CharField(max_length=20)
+    is_approved = models.BooleanField()
+    count = models.BigIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['role', 'is_approved'], condition=models.Q(scope='global'),
+                name='unique_global_user_counter',
+            ),
+            models.UniqueConstraint(
+                fields=['institution', 'role', 'is_approved'], condition=models.Q(scope='institution'),
+                name='unique_institution_user_counter',
+            ),
+        ]
+
+    def __str__(self):
+        where = 'platform' if self.scope == 'global' else f'institution {self.institution_id}'
+        state = 'approved' if self.is_approved else 'pending'
+        return f"{self.count} {state} {self.role} ({where})"
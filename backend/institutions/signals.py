@@ -0,0 +1,77 @@
+# backend/institutions/signals.py
+from django.db.models.signals import post_init, post_save, pre_delete, post_delete
+from django.dispatch import receiver
+from backend import response_cache
+from users.models import User, Profile
+from .models import Institution
+from . import counters
+
+# These signals keep UserCounter in step with every User/Profile change.
+# post_init remembers the state an instance was loaded with, so a save only
+# touches the counters when role, approval, activity or institution actually
+# changed. Inactive (declined or disabled) users are not counted.
+
+# Stands in for a field that was deferred when the instance was loaded
+UNKNOWN = object()
+
+
+@receiver(post_init, sender=User)
+def remember_user_state(sender, instance, **kwargs):
+    # Read __dict__ directly so deferred fields are not fetched here
+    instance._counted_state = tuple(instance.__dict__.get(name, UNKNOWN) for name in ('role', 'is_approved', 'is_active'))
+
+
+@receiver(post_init, sender=Profile)
+def remember_profile_institution(sender, instance, **kwargs):
+    instance._counted_institution_id = instance.__dict__.get('institution_id', UNKNOWN)
+
+
+def adjust_state(state, delta, institution_id=None):
+    role, is_approved, is_active = state
+    if is_active:
+        counters.adjust(role, is_approved, delta, institution_id)
+
+
+@receiver(post_save, sender=User)
+def count_user(sender, instance, created, **kwargs):
+    new_state = (instance.role, instance.is_approved, instance.is_active)
+    if created:
+        # The profile (and its institution) is counted when it gets saved
+        adjust_state(new_state, 1)
+    elif UNKNOWN not in instance._counted_state and new_state != instance._counted_state:
+        institution_id = Profile.objects.filter(user=instance).values_list('institution_id', flat=True).first()
+        adjust_state(instance._counted_state, -1, institution_id)
+        adjust_state(new_state, 1, institution_id)
+    instance._counted_state = new_state
+
+
+@receiver(post_save, sender=Profile)
+def count_profile_institution(sender, instance, **kwargs):
+    old_institution_id, new_institution_id = instance._counted_institution_id, instance.institution_id
+    if old_institution_id is not UNKNOWN and old_institution_id != new_institution_id and instance.user.is_active:
+        state = (instance.user.role, instance.user.is_approved)
+        if old_institution_id is not None:
+            counters.adjust_institution(old_institution_id, *state, -1)
+        if new_institution_id is not None:
+            counters.adjust_institution(new_institution_id, *state, 1)
+    instance._counted_institution_id = new_institution_id
+
+
+@receiver(pre_delete, sender=User)
+def remember_deleted_user_institution(sender, instance, **kwargs):
+    # The profile is deleted first by the cascade, so look it up now
+    instance._counted_institution_id = Profile.objects.filter(user=instance).values_list('institution_id', flat=True).first()
+
+
+@receiver(post_delete, sender=User)
+def uncount_user(sender, instance, **kwargs):
+    if UNKNOWN not in instance._counted_state:
+        adjust_state(instance._counted_state, -1, getattr(instance, '_counted_institution_id', None))
+
+
+# --- Response cache invalidation (backend/response_cache.py) ---
+
+@receiver(post_save, sender=Institution)
+@receiver(post_delete, sender=Institution)
+def invalidate_institution_responses(sender, instance, **kwargs):
+    response_cache.invalidate('institutions')
@@ -1,3 +1,165 @@
+import re
+from datetime import datetime, timezone
+from django.core import mail
 from django.test import TestCase
+from rest_framework.test import APIClient
+from users.models import User
+from . import counters
+from .models import Institution, UserCounter
 
-# Create your tests here.
+
+def create_institution(name='Test College', status='pending'):
+    return Institution.objects.create(
+        name=name, address='Ludhiana', contact_person='Principal',
+        contact_email=f'principal@{name.split()[0].lower()}.edu.in', contact_phone='1', status=status,
+    )
+
+
+def create_member(username, institution, role='alumni', is_approved=False):
+    user = User.objects.create_user(username, role=role, is_approved=is_approved)
+    user.profile.institution = institution
+    user.profile.save()
+    return user
+
+
+class ApproveInstitutionTests(TestCase):
+    def setUp(self):
+        self.institution = create_institution()
+        self.client = APIClient()
+        self.client.force_authenticate(User.objects.create_user('state', role='super_admin', is_approved=True))
+
+    def test_new_admin_sets_a_password_and_logs_in(self):
+        response = self.client.post(f'/api/institutions/{self.institution.pk}/approve/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(list(response.data), ['status'])
+        admin = User.objects.get(email='principal@test.edu.in')
+        self.assertFalse(admin.has_usable_password())
+
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].to, ['principal@test.edu.in'])
+        uid, token = re.search(r'/set-password\?uid=([\w-]+)&token=([\w-]+)', mail.outbox[0].body).groups()
+
+        client = APIClient()
+        response = client.post('/api/users/set-password/', {'uid': uid, 'token': token, 'password': 'Chosen-pass-42'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['username'], 'principal')
+        response = client.post('/api/token/', {'username': 'principal', 'password': 'Chosen-pass-42'})
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('access', response.data)
+
+        # The link only works once
+        response = client.post('/api/users/set-password/', {'uid': uid, 'token': token, 'password': 'Other-pass-42'})
+        self.assertEqual(response.status_code, 400)
+
+
+class UserCounterTests(TestCase):
+    def setUp(self):
+        self.institution = create_institution()
+
+    def counts(self, scope='institution'):
+        institution_id = self.institution.pk if scope == 'institution' else None
+        return {key: count for key, count in counters.read(scope, institution_id).items() if count}
+
+    def assertMatchesRebuild(self):
+        # The incrementally kept counters agree with a full recount
+        kept = (self.counts('global'), self.counts('institution'))
+        counters.rebuild()
+        self.assertEqual((self.counts('global'), self.counts('institution')), kept)
+
+    def test_registration_and_approval(self):
+        user = create_member('asha', self.institution)
+        self.assertEqual(self.counts(), {('alumni', False): 1})
+        self.assertEqual(self.counts('global'), {('alumni', False): 1})
+
+        user.is_approved = True
+        user.save()
+        self.assertEqual(self.counts(), {('alumni', True): 1})
+        self.assertEqual(self.counts('global'), {('alumni', True): 1})
+        self.assertMatchesRebuild()
+
+    def test_deactivation_and_deletion(self):
+        declined = create_member('asha', self.institution)
+        approved = create_member('ravi', self.institution, role='student', is_approved=True)
+
+        declined.is_active = False
+        declined.save()
+        self.assertEqual(self.counts(), {('student', True): 1})
+        self.assertMatchesRebuild()
+
+        approved.delete()
+        self.assertEqual(self.counts(), {})
+        self.assertEqual(self.counts('global'), {})
+
+        # Deleting an already inactive user changes nothing
+        declined.delete()
+        self.assertEqual(self.counts('global'), {})
+
+    def test_moving_institutions(self):
+        user = create_member('asha', self.institution, is_approved=True)
+        other = create_institution('Other College')
+        user.profile.institution = other
+        user.profile.save()
+        self.assertEqual(self.counts(), {})
+        self.assertEqual(counters.read('institution', other.pk), {('alumni', True): 1})
+        self.assertMatchesRebuild()
+
+    def test_unchanged_save_touches_no_counter(self):
+        user = create_member('asha', self.institution)
+        before = list(UserCounter.objects.values_list('id', 'count'))
+        User.objects.get(pk=user.pk).save()
+        self.assertEqual(list(UserCounter.objects.values_list('id', 'count')), before)
+
+
+class InstitutionsReportTests(TestCase):
+    url = '/api/institutions/analytics/institutions/'
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.college = create_institution('Test College', status='approved')
+        cls.empty = create_institution('Empty College', status='approved')
+        create_institution('Pending College')
+        joined = {
+            'alum': datetime(2026, 1, 15, tzinfo=timezone.utc),
+            'student': datetime(2026, 3, 2, tzinfo=timezone.utc),
+            'pending': datetime(2026, 3, 20, tzinfo=timezone.utc),
+            'declined': datetime(2026, 3, 21, tzinfo=timezone.utc),
+        }
+        create_member('alum', cls.college, is_approved=True)
+        create_member('student', cls.college, role='student', is_approved=True)
+        create_member('pending', cls.college)
+        declined = create_member('declined', cls.college)
+        declined.is_active = False
+        declined.save()
+        for username, date_joined in joined.items():
+            User.objects.filter(username=username).update(date_joined=date_joined)
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(User.objects.create_user('state', role='super_admin', is_approved=True))
+
+    def report(self, query=''):
+        response = self.client.get(self.url + query)
+        self.assertEqual(response.status_code, 200)
+        return {entry['name']: entry for entry in response.data['institutions']}
+
+    def test_totals_per_approved_institution(self):
+        report = self.report()
+        self.assertEqual(list(report), ['Empty College', 'Test College'])
+        self.assertEqual(
+            report['Test College'],
+            {'id': self.college.pk, 'name': 'Test College', 'total_alumni': 1, 'total_students': 1, 'pending_approvals': 1},
+        )
+        self.assertEqual(report['Empty College']['total_alumni'], 0)
+
+    def test_monthly_buckets_within_a_date_range(self):
+        report = self.report('?bucket=month&joined_after=2026-02-01')
+        self.assertEqual(report['Test College']['periods'], [
+            {'period': '2026-03-01', 'total_alumni': 0, 'total_students': 1, 'pending_approvals': 1},
+        ])
+        self.assertEqual(report['Test College']['total_alumni'], 0)
+        self.assertEqual(report['Empty College']['periods'], [])
+
+    def test_invalid_parameters(self):
+        for query in ('?bucket=decade', '?joined_before=March'):
+            with self.subTest(query=query):
+                self.assertEqual(self.client.get(self.url + query).status_code, 400)
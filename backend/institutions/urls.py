@@ -7,7 +7,9 @@ from .views import (
     PlatformAnalyticsView ,
     ApprovedInstitutionsListView, # <-- Import new view
     InstitutionDetailView,
-    InstitutionAnalyticsView
+    InstitutionAnalyticsView,
+    InstitutionAnalyticsExportView,
+    InstitutionsReportView
 )
 
 urlpatterns = [
@@ -16,6 +18,8 @@ urlpatterns = [
     path('approved/', ApprovedInstitutionsListView.as_view(), name='approved-institutions'),
     path('analytics/', PlatformAnalyticsView.as_view(), name='platform-analytics'),
     path('my-institution/analytics/', InstitutionAnalyticsView.as_view(), name='institution-analytics'),
+    path('my-institution/analytics/export/', InstitutionAnalyticsExportView.as_view(), name='institution-analytics-export'),
+    path('analytics/institutions/', InstitutionsReportView.as_view(), name='institutions-report'),
     
     # --- UPDATED URLS ---
     path('<int:pk>/', InstitutionDetailView.as_view(), name='institution-detail'),
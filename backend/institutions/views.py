@@ -1,11 +1,21 @@
+import logging
+from itertools import groupby
 from rest_framework import generics, status
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny, IsAuthenticated
+from backend.response_cache import CachedResponseMixin
 from .models import Institution
 from .serializers import InstitutionApplicationSerializer, InstitutionSerializer
+from . import counters
 from users.models import User
-from django.utils.crypto import get_random_string
+from users.export import stream_csv
+from users.invitations import send_invitation
+from django.db.models import Count, Q
+from django.db.models.functions import TruncDay, TruncMonth, TruncWeek, TruncYear
+from django.utils.dateparse import parse_date
+
+logger = logging.getLogger(__name__)
 
 class InstitutionApplicationView(generics.CreateAPIView):
     queryset = Institution.objects.all()
@@ -13,10 +23,11 @@ class InstitutionApplicationView(generics.CreateAPIView):
     permission_classes = [AllowAny]
 
 # --- THIS IS THE NEW VIEW TO LIST APPROVED COLLEGES ---
-class ApprovedInstitutionsListView(generics.ListAPIView):
+class ApprovedInstitutionsListView(CachedResponseMixin, generics.ListAPIView):
     queryset = Institution.objects.filter(status='approved').order_by('name')
     serializer_class = InstitutionSerializer
     permission_classes = [IsAuthenticated] # Should be IsSuperAdmin
+    cache_scopes = ('institutions',)
 
 # --- THIS IS THE NEW VIEW FOR EDITING AND DELETING ---
 class InstitutionDetailView(generics.RetrieveUpdateDestroyAPIView):
@@ -42,20 +53,26 @@ class ApproveInstitutionView(APIView):
         institution.save()
 
         admin_username = institution.contact_email.split('@')[0]
-         # Use Django's core utility to generate a secure 12-character password
-        admin_password = get_random_string(12)
         admin_user, created = User.objects.get_or_create(
             email=institution.contact_email,
             defaults={ 'username': admin_username, 'first_name': institution.contact_person, 'role': 'institution_admin', 'is_approved': True }
         )
-        if created:
-            admin_user.set_password(admin_password)
-            admin_user.save()
-            print(f"--- Institution Admin Created for {institution.name} ---")
-            print(f"Username: {admin_username}")
-            print(f"Password: {admin_password}")
-        
-        return Response({"status": f"{institution.name} approved and admin account created."}, status=status.HTTP_200_OK)
+        if not created:
+            return Response({"status": f"{institution.name} approved; its admin account already existed."}, status=status.HTTP_200_OK)
+
+        # The admin chooses their own password from an emailed link
+        admin_user.set_unusable_password()
+        admin_user.save()
+        try:
+            send_invitation(
+                admin_user, "Your Punjab Alumni Connect admin account",
+                f"{institution.name} has been approved on Punjab Alumni Connect, and an admin account was created for you.",
+            )
+        except OSError as e:
+            logger.warning("Could not email the admin invitation for %s: %s", institution.name, e)
+            return Response({"status": f"{institution.name} approved and admin account created, but the set-password email could not be sent."}, status=status.HTTP_200_OK)
+
+        return Response({"status": f"{institution.name} approved and admin account created. A set-password link was emailed to {admin_user.email}."}, status=status.HTTP_200_OK)
 
 class RejectInstitutionView(APIView):
     permission_classes = [IsAuthenticated]
@@ -71,13 +88,17 @@ class RejectInstitutionView(APIView):
         return Response({"status": f"{institution.name} has been rejected."}, status=status.HTTP_200_OK)
 
 class PlatformAnalyticsView(APIView):
+    """
+    Platform-wide statistics, read from the denormalized user counters.
+    """
     permission_classes = [IsAuthenticated]
 
     def get(self, request, *args, **kwargs):
+        user_counts = counters.read('global')
         stats = {
             'total_institutions': Institution.objects.filter(status='approved').count(),
-            'total_alumni': User.objects.filter(role='alumni', is_approved=True).count(),
-            'total_students': User.objects.filter(role='student', is_approved=True).count(),
+            'total_alumni': user_counts.get(('alumni', True), 0),
+            'total_students': user_counts.get(('student', True), 0),
         }
         return Response(stats)
     
@@ -97,10 +118,119 @@ class InstitutionAnalyticsView(APIView):
         except Institution.DoesNotExist:
              return Response({"error": "Admin not associated with any institution."}, status=status.HTTP_403_FORBIDDEN)
         
+        # One indexed read of this institution's counters
+        user_counts = counters.read('institution', institution.pk)
         stats = {
             'institution_name': institution.name,
-            'total_alumni': User.objects.filter(profile__institution=institution, role='alumni', is_approved=True).count(),
-            'total_students': User.objects.filter(profile__institution=institution, role='student', is_approved=True).count(),
-            'pending_approvals': User.objects.filter(profile__institution=institution, is_approved=False).count(),
+            'total_alumni': user_counts.get(('alumni', True), 0),
+            'total_students': user_counts.get(('student', True), 0),
+            'pending_approvals': sum(count for (role, is_approved), count in user_counts.items() if not is_approved),
         }
-        return Response(stats)
\ No newline at end of file
+        return Response(stats)
+
+
+class InstitutionAnalyticsExportView(APIView):
+    """
+    Streams the Institution Admin's statistics as CSV: alumni, students and
+    pending approvals per month joined, from one GROUP BY query.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, *args, **kwargs):
+        try:
+            institution = Institution.objects.get(contact_email=request.user.email)
+        except Institution.DoesNotExist:
+            return Response({"error": "Admin not associated with any institution."}, status=status.HTTP_403_FORBIDDEN)
+
+        rows = (
+            User.objects.filter(profile__institution=institution, is_active=True)
+            .annotate(period=TruncMonth('date_joined'))
+            .values('period', 'role', 'is_approved')
+            .annotate(total=Count('pk'))
+            .order_by('period')
+        )
+        header = ['month', 'total_alumni', 'total_students', 'pending_approvals']
+        return stream_csv(f'institution-{institution.pk}-stats.csv', header, self.monthly_rows(rows))
+
+    @staticmethod
+    def monthly_rows(rows):
+        # The query is ordered by month, so each month is complete before the next starts
+        for period, group in groupby(rows, key=lambda row: row['period']):
+            stats = {'total_alumni': 0, 'total_students': 0, 'pending_approvals': 0}
+            for row in group:
+                InstitutionsReportView.add_counts(stats, row['role'], row['is_approved'], row['total'])
+            yield [period.strftime('%Y-%m'), stats['total_alumni'], stats['total_students'], stats['pending_approvals']]
+
+
+class InstitutionsReportView(APIView):
+    """
+    Alumni, student and pending counts for every approved institution, built
+    from one GROUP BY (institution, role, is_approved) query.
+    Optional query parameters:
+    - bucket: 'day', 'week', 'month' or 'year' to also split the counts by
+      when the users joined.
+    - joined_after / joined_before: ISO dates limiting date_joined.
+    """
+    permission_classes = [IsAuthenticated] # Should be IsSuperAdmin
+
+    BUCKETS = {'day': TruncDay, 'week': TruncWeek, 'month': TruncMonth, 'year': TruncYear}
+
+    def get(self, request, *args, **kwargs):
+        bucket = request.query_params.get('bucket')
+        if bucket and bucket not in self.BUCKETS:
+            return Response({"error": f"bucket must be one of: {', '.join(self.BUCKETS)}."}, status=status.HTTP_400_BAD_REQUEST)
+
+        # Institutions without users still appear, through the LEFT JOIN;
+        # inactive users are left out, as in the counters
+        user_filter = Q(profile__user__is_active=True)
+        for param, lookup in (('joined_after', 'gte'), ('joined_before', 'lte')):
+            value = request.query_params.get(param)
+            if value:
+                day = parse_date(value)
+                if day is None:
+                    return Response({"error": f"{param} must be a date (YYYY-MM-DD)."}, status=status.HTTP_400_BAD_REQUEST)
+                user_filter &= Q(**{f'profile__user__date_joined__date__{lookup}': day})
+
+        group_by = ['id', 'name', 'profile__user__role', 'profile__user__is_approved']
+        rows = Institution.objects.filter(status='approved')
+        if bucket:
+            rows = rows.annotate(period=self.BUCKETS[bucket]('profile__user__date_joined'))
+            group_by.append('period')
+        rows = (
+            rows.values(*group_by)
+            .annotate(total=Count('profile__user', filter=user_filter))
+            .order_by('name', 'id')
+        )
+
+        report = {}
+        for row in rows:
+            entry = report.setdefault(row['id'], {
+                'id': row['id'], 'name': row['name'],
+                'total_alumni': 0, 'total_students': 0, 'pending_approvals': 0,
+            })
+            if bucket:
+                if row['period'] is None or not row['total']:
+                    continue
+                periods = entry.setdefault('periods', {})
+                key = row['period'].date().isoformat()
+                target = periods.setdefault(key, {'period': key, 'total_alumni': 0, 'total_students': 0, 'pending_approvals': 0})
+            else:
+                target = None
+            for stats in filter(None, (entry, target)):
+                self.add_counts(stats, row['profile__user__role'], row['profile__user__is_approved'], row['total'])
+
+        institutions = list(report.values())
+        for entry in institutions:
+            if bucket:
+                entry['periods'] = sorted(entry.get('periods', {}).values(), key=lambda period: period['period'])
+        return Response({'bucket': bucket, 'institutions': institutions})
+
+    @staticmethod
+    def add_counts(stats, role, is_approved, total):
+        # Same definitions as InstitutionAnalyticsView
+        if is_approved is False:
+            stats['pending_approvals'] += total
+        elif role == 'alumni':
+            stats['total_alumni'] += total
+        elif role == 'student':
+            stats['total_students'] += total
@@ -1,5 +1,6 @@
 # backend/jobs/models.py
 from django.db import models
+from django.db.models.functions import Upper
 from users.models import User
 
 class Job(models.Model):
@@ -17,5 +18,14 @@ class Job(models.Model):
     posted_by = models.ForeignKey(User, on_delete=models.CASCADE, related_name='posted_jobs')
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            # The job board lists the newest postings first
+            models.Index(fields=['-created_at'], name='job_created_at_idx'),
+            # The location and company filters match case-insensitively
+            models.Index(Upper('location'), name='job_location_upper_idx'),
+            models.Index(Upper('company'), name='job_company_upper_idx'),
+        ]
+
     def __str__(self):
         return f"{self.title} at {self.company}"
\ No newline at end of file
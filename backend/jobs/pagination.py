@@ -0,0 +1,13 @@
+# backend/jobs/pagination.py
+from rest_framework.pagination import CursorPagination
+
+
+class JobCursorPagination(CursorPagination):
+    """
+    Keyset pagination for the job board, newest postings first. The cursor
+    encodes the last created_at seen, so deep pages cost the same as the first.
+    """
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    ordering = ('-created_at', '-id')
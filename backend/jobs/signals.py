@@ -0,0 +1,12 @@
+# backend/jobs/signals.py
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from backend import response_cache
+from .models import Job
+
+
+# Keeps the cached jobs list (backend/response_cache.py) current
+@receiver(post_save, sender=Job)
+@receiver(post_delete, sender=Job)
+def invalidate_jobs_responses(sender, instance, **kwargs):
+    response_cache.invalidate('jobs')
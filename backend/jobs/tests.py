@@ -1,3 +1,55 @@
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+from users.models import User
+from .models import Job
 
-# Create your tests here.
+
+class JobListTests(TestCase):
+    url = '/api/jobs/'
+
+    def setUp(self):
+        self.poster = User.objects.create_user('poster', role='alumni', is_approved=True)
+        self.client = APIClient()
+        self.client.force_authenticate(self.poster)
+
+    def add_job(self, title, company='Infosys', location='Mohali', job_type='Full-Time', description='Great team.'):
+        return Job.objects.create(
+            title=title, company=company, location=location, job_type=job_type,
+            description=description, posted_by=self.poster,
+        )
+
+    def titles(self, query=''):
+        response = self.client.get(self.url + query)
+        self.assertEqual(response.status_code, 200)
+        return [job['title'] for job in response.data['results']]
+
+    def test_keyword_search_matches_every_term(self):
+        self.add_job('Backend Developer', description='Django and PostgreSQL.')
+        self.add_job('Frontend Developer', description='React.')
+        self.add_job('Data Analyst', description='SQL dashboards with Django.')
+        self.assertEqual(self.titles('?search=develop django'), ['Backend Developer'])
+        self.assertEqual(self.titles('?search=django'), ['Data Analyst', 'Backend Developer'])
+
+    def test_filters(self):
+        self.add_job('Intern', job_type='Internship', location='Ludhiana')
+        self.add_job('Engineer', company='TCS')
+        self.assertEqual(self.titles('?job_type=Internship'), ['Intern'])
+        self.assertEqual(self.titles('?location=ludhiana'), ['Intern'])
+        self.assertEqual(self.titles('?company=tcs'), ['Engineer'])
+        self.assertEqual(self.titles('?company=TCS&location=MOHALI'), ['Engineer'])
+        with CaptureQueriesContext(connection) as queries:
+            self.titles('?location=Ludhiana&company=infosys')
+        self.assertIn('UPPER("jobs_job"."location") =', queries[-1]['sql'])
+        self.assertEqual(self.client.get(self.url + '?job_type=Gig').status_code, 400)
+
+    def test_newest_first_in_one_query_with_cursor_pages(self):
+        for i in range(25):
+            self.add_job(f'Job {i}')
+        with self.assertNumQueries(1):
+            first = self.client.get(self.url).data
+        second = self.client.get(first['next']).data
+        self.assertEqual(first['results'][0]['title'], 'Job 24')
+        self.assertEqual(first['results'][0]['posted_by_username'], 'poster')
+        self.assertEqual([job['title'] for job in second['results']], [f'Job {i}' for i in range(4, -1, -1)])
@@ -1,13 +1,52 @@
 # backend/jobs/views.py
+from django.db.models.functions import Upper
 from rest_framework import generics
+from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import IsAuthenticated
+from backend.response_cache import CachedResponseMixin
+from chatbot.search import matching_object_ids
 from .models import Job
+from .pagination import JobCursorPagination
 from .serializers import JobSerializer
 
-class JobListCreateView(generics.ListCreateAPIView):
-    queryset = Job.objects.all().order_by('-created_at')
+class JobListCreateView(CachedResponseMixin, generics.ListCreateAPIView):
+    """
+    Lists job postings, newest first, with keyset pagination.
+    Supported query parameters:
+    - search: keywords matched against title, company, location and
+      description through the full-text index; every keyword must match
+    - job_type: one of Job.JOB_TYPE_CHOICES
+    - location, company: case-insensitive exact match
+    GET responses are cached until a job (or a poster's username) changes.
+    """
     serializer_class = JobSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = JobCursorPagination
+    cache_scopes = ('jobs',)
+
+    def get_queryset(self):
+        params = self.request.query_params
+        # The poster's username is serialized, so join it up front
+        queryset = Job.objects.select_related('posted_by')
+
+        job_type = params.get('job_type')
+        if job_type:
+            if job_type not in dict(Job.JOB_TYPE_CHOICES):
+                raise ValidationError({'job_type': f"Must be one of: {', '.join(dict(Job.JOB_TYPE_CHOICES))}."})
+            queryset = queryset.filter(job_type=job_type)
+
+        # Compared as UPPER(column), so they use the Upper() indexes
+        for param in ('location', 'company'):
+            value = params.get(param, '').strip()
+            if value:
+                queryset = queryset.alias(**{f'{param}_upper': Upper(param)}).filter(**{f'{param}_upper': value.upper()})
+
+        search = params.get('search', '').strip()
+        if search:
+            matching_ids = matching_object_ids('job', search)
+            if matching_ids is not None:
+                queryset = queryset.filter(pk__in=matching_ids)
+        return queryset
 
     def perform_create(self, serializer):
         serializer.save(posted_by=self.request.user)
@@ -17,7 +56,7 @@ class JobDetailView(generics.RetrieveUpdateDestroyAPIView):
     """
     Handles GET, PUT, PATCH, and DELETE requests for a single job.
     """
-    queryset = Job.objects.all()
+    queryset = Job.objects.select_related('posted_by')
     serializer_class = JobSerializer
     permission_classes = [IsAuthenticated]
     # In a real app, we'd add a permission to ensure only the poster can edit/delete.
\ No newline at end of file
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-18 15:10
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mentorship', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='mentorshiprequest',
+            index=models.Index(fields=['mentor', 'status', '-created_at'], name='mentorship_mentor_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='mentorshiprequest',
+            index=models.Index(fields=['requester', 'status'], name='mentorship_requester_idx'),
+        ),
+    ]
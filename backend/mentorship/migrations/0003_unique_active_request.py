@@ -0,0 +1,38 @@
+# Generated by Django 5.2.18 on 2026-10-18 15:10
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def decline_duplicate_requests(apps, schema_editor):
+    """
+    Leaves one active request per (requester, mentor) pair, preferring an
+    accepted one and then the newest, so the constraint can be added.
+    """
+    MentorshipRequest = apps.get_model('mentorship', 'MentorshipRequest')
+    active = MentorshipRequest.objects.filter(status__in=['pending', 'accepted'])
+    duplicated = (
+        active.values('requester_id', 'mentor_id')
+        .annotate(total=models.Count('id')).filter(total__gt=1)
+    )
+    for pair in duplicated:
+        requests = active.filter(requester_id=pair['requester_id'], mentor_id=pair['mentor_id'])
+        # 'accepted' sorts before 'pending'
+        keep = requests.order_by('status', '-created_at', '-id').values_list('id', flat=True).first()
+        requests.exclude(id=keep).update(status='declined')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mentorship', '0002_hot_query_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(decline_duplicate_requests, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='mentorshiprequest',
+            constraint=models.UniqueConstraint(condition=models.Q(('status__in', ['pending', 'accepted'])), fields=('requester', 'mentor'), name='unique_active_mentorship'),
+        ),
+    ]
@@ -1,6 +1,9 @@
 from django.db import models
 from users.models import User
 
+# A student can hold only one request in these states with each mentor
+ACTIVE_STATUSES = ['pending', 'accepted']
+
 class MentorshipRequest(models.Model):
     STATUS_CHOICES = (
         ('pending', 'Pending'),
@@ -14,6 +17,21 @@ class MentorshipRequest(models.Model):
     status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='pending')
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            # A mentor's incoming requests by status, newest first
+            models.Index(fields=['mentor', 'status', '-created_at'], name='mentorship_mentor_idx'),
+            # A student's sent requests by status
+            models.Index(fields=['requester', 'status'], name='mentorship_requester_idx'),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=['requester', 'mentor'],
+                condition=models.Q(status__in=ACTIVE_STATUSES),
+                name='unique_active_mentorship',
+            ),
+        ]
+
     def __str__(self):
         return f"Request from {self.requester.username} to {self.mentor.username}"
 
@@ -1,11 +1,12 @@
 from rest_framework import serializers
 from .models import MentorshipRequest, ConnectionInfo
-from users.serializers import UserSerializer
+from users.serializers import UserCardSerializer
 
 class MentorshipRequestSerializer(serializers.ModelSerializer):
     # This serializer is now correct and handles both reading and writing.
-    requester = UserSerializer(read_only=True)
-    mentor = UserSerializer(read_only=True)
+    # Nested users are lightweight cards; the views join their profiles up front.
+    requester = UserCardSerializer(read_only=True)
+    mentor = UserCardSerializer(read_only=True)
     mentor_id = serializers.IntegerField(write_only=True)
 
     class Meta:
@@ -1,3 +1,104 @@
 from django.test import TestCase
+from rest_framework.test import APIClient
+from users.models import User
+from .models import MentorshipRequest, ConnectionInfo
 
-# Create your tests here.
+
+class MentorshipListQueryCountTests(TestCase):
+    """
+    Listing requests and connections must cost a constant number of
+    queries, however many rows are returned.
+    """
+
+    def setUp(self):
+        self.mentor = User.objects.create_user('mentor', role='alumni', is_approved=True)
+        self.student = User.objects.create_user('student', role='student', is_approved=True)
+        self.client = APIClient()
+
+    def add_requests(self, count, status='pending'):
+        for i in range(count):
+            requester = User.objects.create_user(f'requester{MentorshipRequest.objects.count()}', role='student')
+            request = MentorshipRequest.objects.create(requester=requester, mentor=self.mentor, initial_message='Hi', status=status)
+            if status == 'accepted':
+                ConnectionInfo.objects.create(request=request, shared_contact_info='mentor@example.com')
+
+    def assert_constant_queries(self, user, url, status='pending'):
+        self.client.force_authenticate(user)
+        self.add_requests(2, status)
+        with self.assertNumQueries(1):
+            small = self.client.get(url)
+        self.add_requests(10, status)
+        with self.assertNumQueries(1):
+            large = self.client.get(url)
+        self.assertEqual(len(small.data), 2)
+        self.assertEqual(len(large.data), 12)
+
+    def test_incoming_requests(self):
+        self.assert_constant_queries(self.mentor, '/api/mentorship/requests/?view=incoming')
+
+    def test_connections(self):
+        self.assert_constant_queries(self.mentor, '/api/mentorship/connections/', status='accepted')
+
+    def test_nested_users_are_cards(self):
+        self.add_requests(1)
+        self.client.force_authenticate(self.mentor)
+        response = self.client.get('/api/mentorship/requests/?view=incoming')
+        requester = response.data[0]['requester']
+        self.assertNotIn('email', requester)
+        self.assertIn('skills', requester['profile'])
+
+
+class ActiveRequestConstraintTests(TestCase):
+    url = '/api/mentorship/requests/'
+
+    def setUp(self):
+        self.mentor = User.objects.create_user('mentor', role='alumni', is_approved=True)
+        self.student = User.objects.create_user('student', role='student', is_approved=True)
+        self.client = APIClient()
+        self.client.force_authenticate(self.student)
+
+    def send_request(self):
+        return self.client.post(self.url, {'mentor_id': self.mentor.pk, 'initial_message': 'Hi'}, format='json')
+
+    def test_second_active_request_is_rejected(self):
+        self.assertEqual(self.send_request().status_code, 201)
+        self.assertEqual(self.send_request().status_code, 400)
+        self.assertEqual(MentorshipRequest.objects.count(), 1)
+
+    def test_new_request_allowed_after_decline(self):
+        self.send_request()
+        MentorshipRequest.objects.update(status='declined')
+        self.assertEqual(self.send_request().status_code, 201)
+
+
+class RespondToRequestTests(TestCase):
+    def setUp(self):
+        self.mentor = User.objects.create_user('mentor', role='alumni', is_approved=True)
+        self.student = User.objects.create_user('student', role='student', is_approved=True)
+        self.client = APIClient()
+        self.client.force_authenticate(self.mentor)
+
+    def respond(self, mentorship_request, new_status):
+        return self.client.post(f'/api/mentorship/requests/{mentorship_request.pk}/respond/', {'status': new_status}, format='json')
+
+    def test_pending_request_is_accepted(self):
+        pending = MentorshipRequest.objects.create(requester=self.student, mentor=self.mentor, initial_message='Hi')
+        self.assertEqual(self.respond(pending, 'accepted').status_code, 200)
+        pending.refresh_from_db()
+        self.assertEqual(pending.status, 'accepted')
+        self.assertTrue(ConnectionInfo.objects.filter(request=pending).exists())
+
+    def test_answered_request_cannot_be_answered_again(self):
+        declined = MentorshipRequest.objects.create(requester=self.student, mentor=self.mentor, initial_message='Hi', status='declined')
+        active = MentorshipRequest.objects.create(requester=self.student, mentor=self.mentor, initial_message='Again')
+
+        # Accepting the old request would clash with the active one
+        self.assertEqual(self.respond(declined, 'accepted').status_code, 400)
+        self.assertEqual(self.respond(active, 'accepted').status_code, 200)
+        self.assertEqual(self.respond(active, 'declined').status_code, 400)
+
+        self.assertEqual(
+            dict(MentorshipRequest.objects.values_list('pk', 'status')),
+            {declined.pk: 'declined', active.pk: 'accepted'},
+        )
+        self.assertEqual(ConnectionInfo.objects.count(), 1)
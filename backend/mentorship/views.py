@@ -1,3 +1,4 @@
+from django.db import IntegrityError, transaction
 from django.db.models import Q
 from rest_framework import generics, status, serializers
 from rest_framework.views import APIView
@@ -31,7 +32,8 @@ class MentorshipRequestListCreateView(generics.ListCreateAPIView):
             # The 'incoming' view is a "To-Do" list, so it's always pending.
             queryset = user.received_requests.filter(status='pending')
         
-        return queryset.order_by('-created_at')
+        # Both nested user cards (and their profiles) come from the same query
+        return queryset.select_related('requester__profile', 'mentor__profile').order_by('-created_at')
 
     def perform_create(self, serializer):
         requester = self.request.user
@@ -41,16 +43,14 @@ class MentorshipRequestListCreateView(generics.ListCreateAPIView):
         except User.DoesNotExist:
             raise serializers.ValidationError("The selected mentor does not exist.")
 
-        # Prevent duplicate active requests
-        if MentorshipRequest.objects.filter(
-            Q(status='pending') | Q(status='accepted'),
-            requester=requester,
-            mentor=mentor
-        ).exists():
+        # Duplicate active requests are rejected by the unique_active_mentorship
+        # constraint, so two concurrent submissions cannot both get in
+        try:
+            with transaction.atomic():
+                serializer.save(requester=requester, mentor=mentor)
+        except IntegrityError:
             raise serializers.ValidationError("You already have an active or pending request with this mentor.")
 
-        serializer.save(requester=requester, mentor=mentor)
-
 
 class RespondToRequestView(APIView):
     """
@@ -71,17 +71,22 @@ class RespondToRequestView(APIView):
         if new_status not in ['accepted', 'declined']:
             return Response({"error": "Invalid status provided."}, status=status.HTTP_400_BAD_REQUEST)
 
-        mentorship_request.status = new_status
-        mentorship_request.save()
-
-        if new_status == 'accepted':
-            contact_info = request.data.get('shared_contact_info', 'Mentor has not provided contact info yet.')
-            message = request.data.get('shared_message', '')
-            ConnectionInfo.objects.create(
-                request=mentorship_request,
-                shared_contact_info=contact_info,
-                shared_message=message
-            )
+        # Only a pending request can be answered. Accepting an old declined
+        # one could clash with a newer active request (unique_active_mentorship),
+        # and the conditional update lets only one of two concurrent answers in.
+        with transaction.atomic():
+            answered = MentorshipRequest.objects.filter(pk=pk, status='pending').update(status=new_status)
+            if not answered:
+                return Response({"error": "This request has already been answered."}, status=status.HTTP_400_BAD_REQUEST)
+
+            if new_status == 'accepted':
+                contact_info = request.data.get('shared_contact_info', 'Mentor has not provided contact info yet.')
+                message = request.data.get('shared_message', '')
+                ConnectionInfo.objects.create(
+                    request=mentorship_request,
+                    shared_contact_info=contact_info,
+                    shared_message=message
+                )
 
         return Response({"status": f"Request {new_status}"}, status=status.HTTP_200_OK)
 
@@ -106,8 +111,8 @@ class ConnectionListView(generics.ListAPIView):
 
     def get_queryset(self):
         user = self.request.user
-        accepted_requests = MentorshipRequest.objects.filter(
-            Q(mentor=user) | Q(requester=user),
-            status='accepted'
-        )
-        return ConnectionInfo.objects.filter(request__in=accepted_requests)
\ No newline at end of file
+        # One joined query for the connection, its request and both users' profiles
+        return ConnectionInfo.objects.filter(
+            Q(request__mentor=user) | Q(request__requester=user),
+            request__status='accepted'
+        ).select_related('request__requester__profile', 'request__mentor__profile')
\ No newline at end of file
@@ -0,0 +1,111 @@
+# backend/users/authentication.py
+"""
+JWT authentication that does not load the user from the database on every
+request.
+
+Authentication makes one lookup in the 'auth' cache, which holds only the
+fields permission checks read (AUTH_USER_FIELDS, and AUTH_PROFILE_FIELDS of
+the profile), never the password hash, names or profile details.
+request.user is rebuilt from them with every other field deferred, so
+reading one costs a query. Views that save the user must load it from the
+database first, as MeView does, or they would write back stale cached
+values.
+
+On a miss the fields are loaded from the database, the user is checked to
+still be active, and they are cached for the alias TIMEOUT. The signals in
+users.signals drop a cached entry when the user or their profile is saved,
+and replace it with an INACTIVE marker when the account is deactivated or
+deleted, so its tokens stop working at once in this process and, at the
+latest, when the other workers' entries expire.
+"""
+from django.core.cache import caches
+from django.db import DEFAULT_DB_ALIAS
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from .models import Profile, User
+
+CACHE_ALIAS = 'auth'
+
+# Cached in place of a user whose tokens must be refused
+INACTIVE = 'inactive'
+
+# Attribute names of the cached fields. The email identifies the
+# institution an institution admin manages; updated_at is the version stamp
+# for conditional GETs of the user's details.
+AUTH_USER_FIELDS = ('id', 'email', 'role', 'is_approved', 'is_active', 'is_staff', 'is_superuser', 'updated_at')
+AUTH_PROFILE_FIELDS = ('id', 'user_id', 'institution_id', 'updated_at')
+
+
+def user_key(user_id):
+    return f'user:{user_id}'
+
+
+def forget_users(user_ids):
+    caches[CACHE_ALIAS].delete_many([user_key(pk) for pk in user_ids])
+
+
+def deny_users(user_ids):
+    # Kept until every access token issued before now has expired
+    timeout = api_settings.ACCESS_TOKEN_LIFETIME.total_seconds()
+    caches[CACHE_ALIAS].set_many({user_key(pk): INACTIVE for pk in user_ids}, timeout)
+
+
+def load_auth_fields(user_id):
+    """
+    Returns (user values, profile values or None) in the order of the
+    AUTH_*_FIELDS, or None if there is no such user.
+    """
+    names = [*AUTH_USER_FIELDS, *(f'profile__{name}' for name in AUTH_PROFILE_FIELDS)]
+    row = User.objects.filter(pk=user_id).values_list(*names).first()
+    if row is None:
+        return None
+    user_values, profile_values = row[:len(AUTH_USER_FIELDS)], row[len(AUTH_USER_FIELDS):]
+    return list(user_values), list(profile_values) if profile_values[0] is not None else None
+
+
+def from_fields(model, names, values):
+    """
+    Builds a model instance with only the given fields loaded.
+    """
+    loaded = dict(zip(names, values))
+    # from_db expects the fields in model order
+    ordered = [field.attname for field in model._meta.concrete_fields if field.attname in loaded]
+    return model.from_db(DEFAULT_DB_ALIAS, ordered, [loaded[name] for name in ordered])
+
+
+def build_user(user_values, profile_values):
+    """
+    Builds a User, and its profile, from cached fields. The other fields
+    are deferred.
+    """
+    user = from_fields(User, AUTH_USER_FIELDS, user_values)
+    profile = None
+    if profile_values is not None:
+        profile = from_fields(Profile, AUTH_PROFILE_FIELDS, profile_values)
+        Profile.user.field.set_cached_value(profile, user)
+    # Caching None makes user.profile raise DoesNotExist without a query
+    User.profile.related.set_cached_value(user, profile)
+    return user
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+
+    def get_user(self, validated_token):
+        try:
+            user_id = User._meta.pk.to_python(validated_token[api_settings.USER_ID_CLAIM])
+        except KeyError:
+            raise InvalidToken("Token contained no recognizable user identification")
+
+        cache = caches[CACHE_ALIAS]
+        fields = cache.get(user_key(user_id))
+        if fields == INACTIVE:
+            raise AuthenticationFailed("User not found or inactive.", code='user_inactive')
+        if fields is None:
+            fields = load_auth_fields(user_id)
+            is_active = fields is not None and fields[0][AUTH_USER_FIELDS.index('is_active')]
+            if not is_active:
+                deny_users([user_id])
+                raise AuthenticationFailed("User not found or inactive.", code='user_inactive')
+            cache.set(user_key(user_id), fields)
+        return build_user(*fields)
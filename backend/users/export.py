@@ -0,0 +1,74 @@
+# backend/users/export.py
+"""
+Streaming CSV downloads. Rows are written one at a time as the response is
+sent, so an export of any size uses constant memory and the download starts
+before the last row has been read from the database.
+"""
+import csv
+from django.http import StreamingHttpResponse
+
+# Rows fetched from the database per round trip while exporting
+EXPORT_CHUNK_SIZE = 2000
+
+# Spreadsheet apps run cells starting with these as formulas
+FORMULA_PREFIXES = ('=', '+', '-', '@')
+
+ROSTER_COLUMNS = [
+    ('id', lambda user: user.pk),
+    ('username', lambda user: user.username),
+    ('email', lambda user: user.email),
+    ('first_name', lambda user: user.first_name),
+    ('last_name', lambda user: user.last_name),
+    ('role', lambda user: user.role),
+    ('is_approved', lambda user: user.is_approved),
+    ('date_joined', lambda user: user.date_joined.isoformat()),
+    ('headline', lambda user: user.profile.headline),
+    ('company', lambda user: user.profile.company),
+    ('department', lambda user: user.profile.department),
+    ('location', lambda user: user.profile.location),
+    ('graduation_year', lambda user: user.profile.graduation_year),
+    ('enrollment_number', lambda user: user.profile.enrollment_number),
+    ('skills', lambda user: user.profile.skills),
+]
+
+
+class Echo:
+    """
+    A file-like object whose write() hands the formatted line back, so
+    csv.writer can format rows without buffering them.
+    """
+    def write(self, value):
+        return value
+
+
+def safe_cell(value):
+    if value is None:
+        return ''
+    if isinstance(value, str) and value.startswith(FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+def stream_csv(filename, header, rows):
+    """
+    Returns a response that streams `header` and then every row of the
+    `rows` iterable as CSV.
+    """
+    writer = csv.writer(Echo())
+
+    def lines():
+        yield writer.writerow(header)
+        for row in rows:
+            yield writer.writerow([safe_cell(value) for value in row])
+
+    response = StreamingHttpResponse(lines(), content_type='text/csv; charset=utf-8')
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return response
+
+
+def roster_rows(users):
+    """
+    Yields one CSV row per user. `users` should use select_related('profile').
+    """
+    for user in users.iterator(chunk_size=EXPORT_CHUNK_SIZE):
+        yield [value(user) for _, value in ROSTER_COLUMNS]
@@ -0,0 +1,213 @@
+# backend/users/importer.py
+"""
+Bulk import of alumni records from CSV or XLSX files.
+
+Rows are read lazily and processed in batches: each batch is validated,
+checked against existing accounts with one query, then inserted with
+bulk_create (users, then their profiles) in one transaction. bulk_create
+bypasses the model signals, so the skill index, analytics counters and
+chatbot search index are updated per batch here instead.
+
+Imported accounts are approved, since the institution vouches for them,
+and get an unusable password: hashing one per row is what makes the
+register endpoint too slow for this. Their owners claim them by registering
+with the same email, which sends them a set-password link (RegisterView).
+"""
+import csv
+import io
+import zipfile
+from collections import Counter
+from dataclasses import dataclass, field
+from django.contrib.auth.hashers import make_password
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+from institutions import counters
+from chatbot.search import store_alumni_documents
+from .models import User, Profile, index_new_profiles
+
+USER_COLUMNS = ['username', 'email', 'first_name', 'last_name', 'role']
+PROFILE_COLUMNS = ['headline', 'about', 'location', 'skills', 'department', 'graduation_year', 'enrollment_number', 'company']
+IMPORT_ROLES = ('alumni', 'student')
+
+# How many row errors are returned; the import itself carries on past them
+MAX_REPORTED_ERRORS = 1000
+
+
+class ImportFormatError(Exception):
+    """
+    The file as a whole cannot be read (unknown format, missing columns).
+    """
+
+
+def read_rows(file, filename):
+    """
+    Yields one {column: value} dict per data row of a CSV or XLSX file.
+    Column names are matched case-insensitively.
+    """
+    if filename.lower().endswith('.xlsx'):
+        rows = _read_xlsx(file)
+    elif filename.lower().endswith('.csv'):
+        rows = _read_csv(file)
+    else:
+        raise ImportFormatError("Upload a .csv or .xlsx file.")
+
+    header = [str(name or '').strip().lower() for name in next(rows, [])]
+    missing = {'email'} - set(header)
+    if missing:
+        raise ImportFormatError(f"Missing required column(s): {', '.join(sorted(missing))}.")
+    for values in rows:
+        if any(value not in (None, '') for value in values):
+            yield dict(zip(header, values))
+
+
+def _read_csv(file):
+    text = io.TextIOWrapper(file, encoding='utf-8-sig', newline='')
+    try:
+        yield from csv.reader(text)
+    except UnicodeDecodeError:
+        raise ImportFormatError("The CSV file must be UTF-8 encoded.")
+    finally:
+        text.detach()  # Leave the caller's file open
+
+
+def _read_xlsx(file):
+    # openpyxl is only needed for Excel uploads, so it is imported on demand
+    try:
+        from openpyxl import load_workbook
+    except ImportError:
+        raise ImportFormatError("Excel import needs the openpyxl package; upload a CSV instead.")
+    try:
+        workbook = load_workbook(file, read_only=True, data_only=True)
+    except (zipfile.BadZipFile, KeyError, ValueError):
+        raise ImportFormatError("The file is not a valid .xlsx workbook.")
+    try:
+        yield from workbook.active.iter_rows(values_only=True)
+    finally:
+        workbook.close()
+
+
+@dataclass
+class ImportResult:
+    created: int = 0
+    failed: int = 0
+    errors: list = field(default_factory=list)
+
+    def add_error(self, row_number, messages):
+        self.failed += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({'row': row_number, 'errors': messages})
+
+
+class AlumniImporter:
+    """
+    Imports rows into `institution`. Row numbers in the result count the
+    header as row 1, as a spreadsheet shows them.
+    """
+
+    def __init__(self, institution, batch_size=1000):
+        self.institution = institution
+        self.batch_size = batch_size
+        self.password = make_password(None)
+        self.fields = {name: User._meta.get_field(name) for name in USER_COLUMNS}
+        self.fields.update({name: Profile._meta.get_field(name) for name in PROFILE_COLUMNS})
+
+    def run(self, rows):
+        result = ImportResult()
+        seen = set()  # Usernames and emails already used earlier in the file
+        batch = []
+        for row_number, row in enumerate(rows, start=2):
+            batch.append((row_number, row))
+            if len(batch) >= self.batch_size:
+                self.import_batch(batch, seen, result)
+                batch = []
+        if batch:
+            self.import_batch(batch, seen, result)
+        result.errors.sort(key=lambda error: error['row'])
+        return result
+
+    def clean_row(self, row):
+        """
+        Returns the validated values of one row, keyed by column, or raises
+        ValidationError with a {column: [messages]} dict.
+        """
+        values, errors = {}, {}
+        for name, model_field in self.fields.items():
+            raw = row.get(name)
+            raw = '' if raw is None else str(raw).strip()
+            if name == 'graduation_year' and raw.endswith('.0'):
+                raw = raw[:-2]  # Spreadsheets store years as floats
+            if name == 'username':
+                raw = raw or row_email(row)
+            if name == 'role':
+                raw = raw.lower() or 'alumni'
+            if not raw and model_field.null:
+                values[name] = None
+                continue
+            try:
+                values[name] = model_field.clean(raw, None)
+            except ValidationError as e:
+                errors[name] = e.messages
+        if values.get('role') not in IMPORT_ROLES and 'role' not in errors:
+            errors['role'] = [f"Must be one of: {', '.join(IMPORT_ROLES)}."]
+        if not values.get('email') and 'email' not in errors:
+            errors['email'] = ["This field is required."]
+        if errors:
+            raise ValidationError(errors)
+        values['email'] = values['email'].lower()
+        return values
+
+    def import_batch(self, batch, seen, result):
+        cleaned = []
+        for row_number, row in batch:
+            try:
+                cleaned.append((row_number, self.clean_row(row)))
+            except ValidationError as e:
+                result.add_error(row_number, e.message_dict)
+
+        # One query finds the rows that clash with existing accounts
+        usernames = {values['username'] for _, values in cleaned}
+        emails = {values['email'] for _, values in cleaned}
+        taken = set()
+        for username, email in User.objects.filter(Q(username__in=usernames) | Q(email__in=emails)).values_list('username', 'email'):
+            taken.update([username, email.lower()])
+
+        users, profiles, row_numbers = [], [], []
+        for row_number, values in cleaned:
+            clashes = [name for name in ('username', 'email') if values[name] in taken or values[name] in seen]
+            if clashes:
+                result.add_error(row_number, {name: ["An account with this value already exists."] for name in clashes})
+                continue
+            seen.update([values['username'], values['email']])
+            user = User(password=self.password, is_approved=True, **{name: values[name] for name in USER_COLUMNS})
+            users.append(user)
+            profiles.append(Profile(
+                user=user, institution=self.institution, college=self.institution.name,
+                **{name: values[name] for name in PROFILE_COLUMNS},
+            ))
+            row_numbers.append(row_number)
+
+        try:
+            with transaction.atomic():
+                User.objects.bulk_create(users)
+                Profile.objects.bulk_create(profiles)
+                self.update_derived_data(users, profiles)
+        except IntegrityError:
+            # An account was registered with one of these names mid-import
+            for row_number in row_numbers:
+                result.add_error(row_number, {'username': ["Conflicts with an account created during the import."]})
+            return
+        result.created += len(users)
+
+    def update_derived_data(self, users, profiles):
+        """
+        Does what the skipped post_save signals would have done.
+        """
+        index_new_profiles(profiles)
+        for role, total in Counter(user.role for user in users).items():
+            counters.adjust(role, True, total, self.institution.pk)
+        store_alumni_documents(user for user in users if user.role == 'alumni')
+
+
+def row_email(row):
+    return str(row.get('email') or '').strip().lower()
@@ -0,0 +1,60 @@
+# backend/users/invitations.py
+"""
+Set-password links for accounts that are created without a usable password,
+such as the admin account made when an institution is approved and the
+accounts of imported alumni.
+
+The link carries Django's password reset token, so it is valid for
+PASSWORD_RESET_TIMEOUT seconds and stops working once the password is set.
+"""
+from django.conf import settings
+from django.contrib.auth.hashers import UNUSABLE_PASSWORD_PREFIX
+from django.contrib.auth.tokens import default_token_generator
+from django.core.mail import send_mail
+from django.utils.encoding import force_bytes
+from django.utils.http import urlsafe_base64_decode, urlsafe_base64_encode
+from .models import User
+
+
+def set_password_link(user):
+    uid = urlsafe_base64_encode(force_bytes(user.pk))
+    token = default_token_generator.make_token(user)
+    return f"{settings.FRONTEND_URL}/set-password?uid={uid}&token={token}"
+
+
+def send_invitation(user, subject, intro):
+    """
+    Emails the user their username and a link to choose a password.
+    Raises OSError (including smtplib.SMTPException) if sending fails.
+    """
+    message = (
+        f"{intro}\n\n"
+        f"Username: {user.username}\n"
+        f"Choose your password here: {set_password_link(user)}\n"
+    )
+    send_mail(subject, message, None, [user.email])
+
+
+def unclaimed_account(email):
+    """
+    Returns the active account with this email that was created for its
+    owner and never had a password set, or None.
+    """
+    if not isinstance(email, str) or not email.strip():
+        return None
+    return User.objects.filter(
+        email__iexact=email.strip(), is_active=True, last_login__isnull=True,
+        password__startswith=UNUSABLE_PASSWORD_PREFIX,
+    ).first()
+
+
+def user_for_token(uid, token):
+    """
+    Returns the user a set-password link was made for, or None if the link
+    is malformed, expired or already used.
+    """
+    try:
+        user = User.objects.get(pk=urlsafe_base64_decode(uid).decode())
+    except (TypeError, ValueError, OverflowError, User.DoesNotExist):
+        return None
+    return user if default_token_generator.check_token(user, token) else None
@@ -0,0 +1,34 @@
+# backend/users/management/commands/import_alumni.py
+import time
+from django.core.management.base import BaseCommand, CommandError
+from institutions.models import Institution
+from users.importer import AlumniImporter, ImportFormatError, read_rows
+
+
+class Command(BaseCommand):
+    help = "Bulk-imports alumni records from a CSV or XLSX file into an institution."
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help="The .csv or .xlsx file to import.")
+        parser.add_argument('--institution', type=int, required=True, help="Id of the institution to link the accounts to.")
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        try:
+            institution = Institution.objects.get(pk=options['institution'])
+        except Institution.DoesNotExist:
+            raise CommandError(f"Institution {options['institution']} does not exist.")
+
+        started = time.monotonic()
+        try:
+            with open(options['path'], 'rb') as file:
+                result = AlumniImporter(institution, options['batch_size']).run(read_rows(file, options['path']))
+        except (OSError, ImportFormatError) as e:
+            raise CommandError(str(e))
+
+        for error in result.errors:
+            self.stderr.write(f"Row {error['row']}: {error['errors']}")
+        self.stdout.write(self.style.SUCCESS(
+            f"Imported {result.created} accounts into {institution.name} in {time.monotonic() - started:.1f}s; "
+            f"{result.failed} rows failed."
+        ))
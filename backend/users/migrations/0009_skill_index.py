@@ -0,0 +1,60 @@
+# Generated by Django 5.2.18 on 2026-10-18 14:47
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def build_skill_index(apps, schema_editor):
+    """
+    Backfills the skill -> user index from every existing profile.
+    """
+    Profile = apps.get_model('users', 'Profile')
+    Skill = apps.get_model('users', 'Skill')
+    UserSkill = apps.get_model('users', 'UserSkill')
+
+    user_skills = {}
+    for user_id, raw_skills in Profile.objects.exclude(skills='').values_list('user_id', 'skills').iterator():
+        names = {skill.strip().lower()[:100] for skill in raw_skills.split(',')}
+        names.discard('')
+        if names:
+            user_skills[user_id] = names
+
+    all_names = set().union(*user_skills.values())
+    Skill.objects.bulk_create([Skill(name=name) for name in all_names], ignore_conflicts=True)
+    skill_ids = dict(Skill.objects.values_list('name', 'id'))
+
+    UserSkill.objects.bulk_create(
+        [UserSkill(user_id=user_id, skill_id=skill_ids[name]) for user_id, names in user_skills.items() for name in names],
+        batch_size=1000,
+        ignore_conflicts=True,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0008_profile_institution'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Skill',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, unique=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='UserSkill',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('skill', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='user_links', to='users.skill')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='skill_links', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('skill', 'user'), name='unique_user_skill')],
+            },
+        ),
+        migrations.RunPython(build_skill_index, migrations.RunPython.noop),
+    ]
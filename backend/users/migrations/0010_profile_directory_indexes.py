@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-18 14:47
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('institutions', '0001_initial'),
+        ('users', '0009_skill_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='profile',
+            index=models.Index(django.db.models.functions.text.Upper('company'), name='profile_company_upper_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='profile',
+            index=models.Index(django.db.models.functions.text.Upper('department'), name='profile_department_upper_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='profile',
+            index=models.Index(django.db.models.functions.text.Upper('location'), name='profile_location_upper_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='profile',
+            index=models.Index(fields=['graduation_year'], name='profile_grad_year_idx'),
+        ),
+    ]
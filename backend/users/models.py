@@ -1,5 +1,7 @@
 # backend/users/models.py
+import hashlib
 from django.db import models
+from django.db.models.functions import Upper
 from django.contrib.auth.models import AbstractUser
 from institutions.models import Institution
 
@@ -16,12 +18,31 @@ class User(AbstractUser):
     # Add the custom role field
     role = models.CharField(max_length=20, choices=ROLE_CHOICES, default='student')
     is_approved = models.BooleanField(default=False)
+    # Version stamp for conditional GETs; set on every save
+    updated_at = models.DateTimeField(auto_now=True)
     
     # You can add other fields here later, like:
     # institution = models.ForeignKey('institutions.Institution', on_delete=models.SET_NULL, null=True, blank=True)
-    
+
+    class Meta(AbstractUser.Meta):
+        indexes = [
+            # Role/approval counts and pending-user lists
+            models.Index(fields=['role', 'is_approved'], name='user_role_approved_idx'),
+        ]
+
     def __str__(self):
         return self.username
+
+    def details_etag(self):
+        """
+        ETag for the serialized user and profile (MeView, UserDetailView).
+        Both stamps change on every save, so equal stamps mean an unchanged
+        response. Load the profile with select_related('profile').
+        """
+        profile = getattr(self, 'profile', None)  # Not every user has one
+        profile_stamp = profile.updated_at.timestamp() if profile else None
+        stamps = f'{self.pk}:{self.updated_at.timestamp()}:{profile_stamp}'
+        return '"%s"' % hashlib.md5(stamps.encode(), usedforsecurity=False).hexdigest()
     
 # --- ADD THE NEW PROFILE MODEL BELOW ---
 
@@ -42,5 +63,110 @@ class Profile(models.Model):
     graduation_year = models.IntegerField(blank=True, null=True)
     enrollment_number = models.CharField(max_length=50, blank=True, null=True) # For both roll no and enrollment
     company = models.CharField(max_length=100, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        # These back the alumni directory filters. The text columns are
+        # matched case-insensitively, so they are indexed on UPPER(column).
+        indexes = [
+            models.Index(Upper('company'), name='profile_company_upper_idx'),
+            models.Index(Upper('department'), name='profile_department_upper_idx'),
+            models.Index(Upper('location'), name='profile_location_upper_idx'),
+            models.Index(fields=['graduation_year'], name='profile_grad_year_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.user.username}'s Profile"
+
+    def sync_skill_index(self):
+        """
+        Rebuilds this user's rows in the skill -> user inverted index so it
+        matches the comma-separated `skills` text.
+        """
+        names = normalize_skills(self.skills)
+        Skill.objects.bulk_create([Skill(name=name) for name in names], ignore_conflicts=True)
+        skills = list(Skill.objects.filter(name__in=names))
+
+        UserSkill.objects.filter(user_id=self.user_id).exclude(skill__in=skills).delete()
+        UserSkill.objects.bulk_create(
+            [UserSkill(skill=skill, user_id=self.user_id) for skill in skills],
+            ignore_conflicts=True,
+        )
+
+
+def normalize_skills(raw_skills):
+    """
+    Splits a comma-separated skills string into a set of clean, lowercase names.
+    """
+    if not raw_skills:
+        return set()
+    names = (skill.strip().lower()[:Skill.NAME_MAX_LENGTH] for skill in raw_skills.split(','))
+    return {name for name in names if name}
+
+
+def rebuild_skill_index(batch_size=1000):
+    """
+    Rebuilds the whole skill -> user index from every profile. Use after bulk
+    loads that bypass the Profile post_save signal.
+    """
+    UserSkill.objects.all().delete()
+    skill_ids = dict(Skill.objects.values_list('name', 'id'))
+    batch = []
+    profiles = Profile.objects.exclude(skills='').values_list('user_id', 'skills')
+    for user_id, raw_skills in profiles.iterator(chunk_size=batch_size):
+        names = normalize_skills(raw_skills)
+        missing = [Skill(name=name) for name in names if name not in skill_ids]
+        if missing:
+            Skill.objects.bulk_create(missing, ignore_conflicts=True)
+            skill_ids.update(Skill.objects.filter(name__in=names).values_list('name', 'id'))
+        batch.extend(UserSkill(user_id=user_id, skill_id=skill_ids[name]) for name in names)
+        if len(batch) >= batch_size:
+            UserSkill.objects.bulk_create(batch, ignore_conflicts=True)
+            batch = []
+    UserSkill.objects.bulk_create(batch, ignore_conflicts=True)
+
+
+def index_new_profiles(profiles):
+    """
+    Adds freshly bulk-created profiles to the skill -> user index in a few
+    queries, without the per-profile work of the post_save signal.
+    """
+    user_skills = {profile.user_id: normalize_skills(profile.skills) for profile in profiles}
+    names = set().union(*user_skills.values())
+    Skill.objects.bulk_create([Skill(name=name) for name in names], ignore_conflicts=True)
+    skill_ids = dict(Skill.objects.filter(name__in=names).values_list('name', 'id'))
+    UserSkill.objects.bulk_create(
+        [UserSkill(user_id=user_id, skill_id=skill_ids[name]) for user_id, names in user_skills.items() for name in names],
+        ignore_conflicts=True,
+    )
+
+
+class Skill(models.Model):
+    """
+    A single normalized skill name, shared by every user who lists it.
+    """
+    NAME_MAX_LENGTH = 100
+
+    name = models.CharField(max_length=NAME_MAX_LENGTH, unique=True)
+
+    def __str__(self):
+        return self.name
+
+
+class UserSkill(models.Model):
+    """
+    One row of the skill -> user inverted index. Kept in sync from
+    `Profile.skills` by the post_save signal, so recommendations can be
+    ranked with a single indexed query.
+    """
+    skill = models.ForeignKey(Skill, on_delete=models.CASCADE, related_name='user_links')
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='skill_links')
+
+    class Meta:
+        constraints = [
+            # Also serves as the (skill, user) lookup index.
+            models.UniqueConstraint(fields=['skill', 'user'], name='unique_user_skill'),
+        ]
+
     def __str__(self):
-        return f"{self.user.username}'s Profile"
\ No newline at end of file
+        return f"{self.user_id} -> {self.skill_id}"
\ No newline at end of file
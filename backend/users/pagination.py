@@ -0,0 +1,13 @@
+# backend/users/pagination.py
+from rest_framework.pagination import CursorPagination
+
+
+class AlumniCursorPagination(CursorPagination):
+    """
+    Cursor pagination for the alumni directory. Newest members come first and
+    the cursor stays stable while new alumni are being approved.
+    """
+    page_size = 24
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    ordering = '-id'
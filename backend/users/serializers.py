@@ -1,4 +1,7 @@
+from django.contrib.auth.password_validation import validate_password
+from django.core.exceptions import ValidationError as DjangoValidationError
 from rest_framework import serializers
+from .invitations import user_for_token
 from .models import User, Profile
 
 class ProfileSerializer(serializers.ModelSerializer):
@@ -58,4 +61,46 @@ class UserSerializer(serializers.ModelSerializer):
             setattr(profile, attr, value)
         
         profile.save()
-        return instance
\ No newline at end of file
+        return instance
+
+
+class SetPasswordSerializer(serializers.Serializer):
+    """
+    Checks a set-password link (see users.invitations) and the new password.
+    The user the link was made for is returned as validated_data['user'].
+    """
+    uid = serializers.CharField()
+    token = serializers.CharField()
+    password = serializers.CharField(write_only=True)
+
+    def validate(self, attrs):
+        user = user_for_token(attrs['uid'], attrs['token'])
+        if user is None:
+            raise serializers.ValidationError({'token': "This link is invalid or has expired."})
+        try:
+            validate_password(attrs['password'], user)
+        except DjangoValidationError as e:
+            raise serializers.ValidationError({'password': list(e.messages)})
+        attrs['user'] = user
+        return attrs
+
+
+class ProfileCardSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Profile
+        fields = ['headline', 'company', 'department', 'graduation_year', 'skills']
+
+
+class UserCardSerializer(serializers.ModelSerializer):
+    """
+    A lightweight, read-only view of a user for embedding in other objects
+    (mentorship requests, connections). Querysets using it should
+    select_related('<user field>__profile') so it costs no extra queries.
+    """
+    profile = ProfileCardSerializer(read_only=True)
+
+    class Meta:
+        model = User
+        fields = ['id', 'username', 'first_name', 'last_name', 'role', 'profile']
+        read_only_fields = fields
+
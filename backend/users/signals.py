@@ -1,6 +1,8 @@
 # backend/users/signals.py
-from django.db.models.signals import post_save
+from django.db.models.signals import post_init, post_save, post_delete
 from django.dispatch import receiver
+from backend import response_cache
+from .authentication import deny_users, forget_users
 from .models import User, Profile
 
 # This is the function that will run every time a User object is created
@@ -12,4 +14,60 @@ def create_user_profile(sender, instance, created, **kwargs):
     """
     if created:
         # If the User instance was just created, create a Profile for it
-        Profile.objects.create(user=instance)
\ No newline at end of file
+        Profile.objects.create(user=instance)
+
+@receiver(post_save, sender=Profile)
+def sync_profile_skills(sender, instance, **kwargs):
+    """
+    Keeps the skill -> user inverted index in step with the profile's
+    comma-separated skills every time the profile is saved.
+    """
+    instance.sync_skill_index()
+
+
+# --- Response cache invalidation (backend/response_cache.py) ---
+
+@receiver(post_init, sender=User)
+def remember_username(sender, instance, **kwargs):
+    # Read __dict__ directly so a deferred username is not fetched here
+    instance._loaded_username = instance.__dict__.get('username')
+
+
+@receiver(post_save, sender=User)
+def invalidate_user_responses(sender, instance, created, **kwargs):
+    response_cache.invalidate(response_cache.user_scope(instance.pk))
+    # The events and jobs lists show the organizer's and poster's username
+    if not created and instance.username != instance._loaded_username:
+        response_cache.invalidate('events', 'jobs')
+    instance._loaded_username = instance.username
+
+
+@receiver(post_delete, sender=User)
+def invalidate_deleted_user_responses(sender, instance, **kwargs):
+    # Deleting a user also deletes the events and jobs they posted
+    response_cache.invalidate(response_cache.user_scope(instance.pk), 'events', 'jobs')
+
+
+@receiver(post_save, sender=Profile)
+def invalidate_profile_responses(sender, instance, **kwargs):
+    response_cache.invalidate(response_cache.user_scope(instance.user_id))
+
+
+# --- Auth cache (users/authentication.py) ---
+
+@receiver(post_save, sender=User)
+def refresh_cached_user(sender, instance, **kwargs):
+    if instance.is_active:
+        forget_users([instance.pk])
+    else:
+        deny_users([instance.pk])
+
+
+@receiver(post_delete, sender=User)
+def deny_deleted_user(sender, instance, **kwargs):
+    deny_users([instance.pk])
+
+
+@receiver(post_save, sender=Profile)
+def refresh_cached_profile_user(sender, instance, **kwargs):
+    forget_users([instance.user_id])
@@ -1,3 +1,450 @@
-from django.test import TestCase
+import re
+from django.core import mail
+from django.core.cache import caches
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient, APIRequestFactory
+from rest_framework_simplejwt.tokens import RefreshToken
+from chatbot.models import SearchDocument
+from institutions import counters
+from institutions.models import Institution
+from .authentication import CachedJWTAuthentication
+from .invitations import unclaimed_account
+from .models import User, Profile, UserSkill
 
-# Create your tests here.
+
+class InstitutionTestCase(TestCase):
+    """
+    Provides `institution`, an approved institution, to every test.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.institution = Institution.objects.create(
+            name='Test College', address='Ludhiana', contact_person='Principal',
+            contact_email='admin@college.edu.in', contact_phone='1', status='approved',
+        )
+
+
+class InstitutionBulkReviewTests(InstitutionTestCase):
+    url = '/api/users/institution-pending/review/'
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.other_institution = Institution.objects.create(
+            name='Other College', address='Patiala', contact_person='Principal',
+            contact_email='other@college.edu.in', contact_phone='2', status='approved',
+        )
+
+    def setUp(self):
+        self.admin = User.objects.create_user('admin', email='admin@college.edu.in', role='institution_admin', is_approved=True)
+        self.alumni = self.make_pending('alumnus', 'alumni', self.institution)
+        self.student = self.make_pending('student', 'student', self.institution)
+        self.outsider = self.make_pending('outsider', 'student', self.other_institution)
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def make_pending(self, username, role, institution):
+        user = User.objects.create_user(username, role=role, first_name=username.title())
+        Profile.objects.filter(user=user).update(institution=institution, company='Infosys')
+        return user
+
+    def test_approve_ids_reports_each_id(self):
+        response = self.client.post(self.url, {'action': 'approve', 'ids': [self.alumni.pk, self.outsider.pk]}, format='json')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['results'], [
+            {'id': self.alumni.pk, 'status': 'approved'},
+            {'id': self.outsider.pk, 'status': 'not_found'},
+        ])
+        self.assertTrue(User.objects.get(pk=self.alumni.pk).is_approved)
+        self.assertFalse(User.objects.get(pk=self.outsider.pk).is_approved)
+
+    def test_approve_keeps_counters_and_search_index_in_sync(self):
+        counters.rebuild()
+        self.client.post(self.url, {'action': 'approve', 'filter': {}}, format='json')
+
+        self.assertEqual(counters.read('institution', self.institution.pk), {
+            ('alumni', False): 0, ('alumni', True): 1, ('student', False): 0, ('student', True): 1,
+        })
+        self.assertTrue(SearchDocument.objects.filter(kind='alumni', object_id=self.alumni.pk).exists())
+
+    def test_approval_refreshes_cached_user_details(self):
+        url = f'/api/users/{self.alumni.pk}/'
+        self.assertFalse(self.client.get(url).data['is_approved'])
+        self.client.post(self.url, {'action': 'approve', 'ids': [self.alumni.pk]}, format='json')
+        self.assertTrue(self.client.get(url).data['is_approved'])
+        with self.assertNumQueries(0):
+            self.client.get(url)
+
+        Profile.objects.get(user=self.alumni).save()  # Through the signals this time
+        with self.assertNumQueries(1):
+            self.client.get(url)
+
+    def test_decline_by_filter_deactivates_matching_users(self):
+        counters.rebuild()
+        response = self.client.post(self.url, {'action': 'decline', 'filter': {'role': 'student'}}, format='json')
+
+        self.assertEqual(response.data['processed'], 1)
+        self.assertFalse(User.objects.get(pk=self.student.pk).is_active)
+        pending = self.client.get('/api/users/institution-pending/').data
+        self.assertEqual([user['id'] for user in pending], [self.alumni.pk])
+        # Declined users no longer count as pending, here or after a rebuild
+        analytics = self.client.get('/api/institutions/my-institution/analytics/').data
+        self.assertEqual(analytics['pending_approvals'], 1)
+        counts = counters.read('institution', self.institution.pk)
+        counters.rebuild()
+        self.assertEqual(counters.read('institution', self.institution.pk), {key: n for key, n in counts.items() if n})
+
+    def test_rejects_invalid_filter_values(self):
+        response = self.client.post(self.url, {'action': 'approve', 'filter': {'graduation_year': 'abc'}}, format='json')
+        self.assertEqual(response.status_code, 400)
+
+    def test_requires_an_institution(self):
+        self.client.force_authenticate(self.student)
+        response = self.client.post(self.url, {'action': 'approve', 'filter': {}}, format='json')
+        self.assertEqual(response.status_code, 403)
+
+
+class AlumniImportTests(InstitutionTestCase):
+    url = '/api/users/institution-import/'
+
+    def setUp(self):
+        self.admin = User.objects.create_user('admin', email='admin@college.edu.in', role='institution_admin', is_approved=True)
+        User.objects.create_user('taken', email='taken@example.com')
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def upload(self, content, name='alumni.csv'):
+        return self.client.post(self.url, {'file': SimpleUploadedFile(name, content.encode())}, format='multipart')
+
+    def test_imports_valid_rows_and_reports_the_rest(self):
+        response = self.upload(
+            "Email,First_Name,Company,Skills,Graduation_Year\n"
+            "asha@example.com,Asha,Infosys,\"Python, SQL\",2019\n"
+            "taken@example.com,Dup,TCS,,2018\n"
+            "not-an-email,Bad,TCS,,2018\n"
+            "ravi@example.com,Ravi,TCS,,nineteen\n"
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual((response.data['created'], response.data['failed']), (1, 3))
+        self.assertEqual([error['row'] for error in response.data['errors']], [3, 4, 5])
+        self.assertIn('graduation_year', response.data['errors'][2]['errors'])
+
+        user = User.objects.get(username='asha@example.com')
+        self.assertTrue(user.is_approved)
+        self.assertFalse(user.has_usable_password())
+        self.assertEqual(user.profile.institution, self.institution)
+        self.assertEqual(UserSkill.objects.filter(user=user).count(), 2)
+        self.assertEqual(counters.read('institution', self.institution.pk), {('alumni', True): 1})
+        self.assertTrue(SearchDocument.objects.filter(kind='alumni', object_id=user.pk).exists())
+
+    def test_duplicate_rows_within_the_file(self):
+        response = self.upload("email\nsame@example.com\nSAME@example.com\n")
+        self.assertEqual((response.data['created'], response.data['failed']), (1, 1))
+
+    def test_rejects_unknown_formats_and_missing_columns(self):
+        self.assertEqual(self.upload("name\nAsha\n").status_code, 400)
+        self.assertEqual(self.upload("email\n", name='alumni.txt').status_code, 400)
+
+
+
+class ClaimImportedAccountTests(InstitutionTestCase):
+    url = '/api/users/register/'
+
+    def setUp(self):
+        admin = User.objects.create_user('admin', email='admin@college.edu.in', role='institution_admin', is_approved=True)
+        client = APIClient()
+        client.force_authenticate(admin)
+        client.post('/api/users/institution-import/', {'file': SimpleUploadedFile('alumni.csv', b"email,company\nasha@example.com,Infosys\n")}, format='multipart')
+        self.imported = User.objects.get(email='asha@example.com')
+        self.client = APIClient()
+
+    def register(self, username, email):
+        return self.client.post(self.url, {
+            'username': username, 'email': email, 'password': 'Chosen-pass-42', 'role': 'alumni', 'profile': {},
+        }, format='json')
+
+    def test_registering_claims_the_imported_account(self):
+        response = self.register('asha', 'Asha@Example.com')
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(User.objects.filter(email__iexact='asha@example.com').count(), 1)
+        self.assertEqual(mail.outbox[0].to, ['asha@example.com'])
+
+        uid, token = re.search(r'/set-password\?uid=([\w-]+)&token=([\w-]+)', mail.outbox[0].body).groups()
+        response = self.client.post('/api/users/set-password/', {'uid': uid, 'token': token, 'password': 'Chosen-pass-42'})
+        self.assertEqual(response.data['username'], 'asha@example.com')
+        response = self.client.post('/api/token/', {'username': 'asha@example.com', 'password': 'Chosen-pass-42'})
+        self.assertEqual(response.status_code, 200)
+
+        # The imported profile is kept, and a claimed account is not offered again
+        self.assertEqual(User.objects.get(pk=self.imported.pk).profile.company, 'Infosys')
+        self.assertIsNone(unclaimed_account('asha@example.com'))
+
+    def test_other_emails_register_normally(self):
+        self.assertEqual(self.register('ravi', 'ravi@example.com').status_code, 201)
+        self.assertEqual(mail.outbox, [])
+
+
+class SkillIndexTests(TestCase):
+    def skills_of(self, user):
+        return set(UserSkill.objects.filter(user=user).values_list('skill__name', flat=True))
+
+    def set_skills(self, user, skills):
+        user.profile.skills = skills
+        user.profile.save()
+
+    def test_index_follows_profile_edits(self):
+        user = User.objects.create_user('asha', role='alumni', is_approved=True)
+        self.set_skills(user, 'Python, SQL ,python,, Django')
+        self.assertEqual(self.skills_of(user), {'python', 'sql', 'django'})
+
+        self.set_skills(user, 'SQL, React')
+        self.assertEqual(self.skills_of(user), {'sql', 'react'})
+
+        self.set_skills(user, '')
+        self.assertEqual(self.skills_of(user), set())
+
+
+class MentorRecommendationTests(TestCase):
+    url = '/api/users/mentors/recommend/'
+
+    def add_user(self, username, skills, role='alumni', is_approved=True):
+        user = User.objects.create_user(username, role=role, is_approved=is_approved)
+        user.profile.skills = skills
+        user.profile.save()
+        return user
+
+    def test_mentors_are_ranked_by_shared_skills(self):
+        student = self.add_user('student', 'python, sql, django, react', role='student')
+        one = self.add_user('one', 'python, java')
+        three = self.add_user('three', 'python, sql, django')
+        two_a = self.add_user('two_a', 'sql, react, go')
+        two_b = self.add_user('two_b', 'python, sql')  # Ties with two_a, which is older
+        self.add_user('pending', 'python, sql, django, react', is_approved=False)
+        self.add_user('classmate', 'python, sql, django, react', role='student')
+        self.add_user('none', 'cobol')
+
+        client = APIClient()
+        client.force_authenticate(student)
+        with self.assertNumQueries(1):
+            response = client.get(self.url)
+        self.assertEqual(
+            [(match['mentor']['id'], match['score']) for match in response.data],
+            [(three.pk, 3), (two_a.pk, 2), (two_b.pk, 2)],
+        )
+        self.assertNotIn(one.pk, [match['mentor']['id'] for match in response.data])
+
+    def test_no_skills_no_matches(self):
+        client = APIClient()
+        client.force_authenticate(self.add_user('student', '', role='student'))
+        self.add_user('mentor', 'python')
+        self.assertEqual(client.get(self.url).data, [])
+
+
+class AlumniListTests(InstitutionTestCase):
+    url = '/api/users/alumni/'
+
+    def setUp(self):
+        self.viewer = User.objects.create_user('viewer', role='student', is_approved=True)
+        self.client = APIClient()
+        self.client.force_authenticate(self.viewer)
+
+    def add_alumnus(self, username, is_approved=True, **profile):
+        user = User.objects.create_user(username, role='alumni', is_approved=is_approved)
+        for field, value in profile.items():
+            setattr(user.profile, field, value)
+        user.profile.save()
+        return user
+
+    def usernames(self, query=''):
+        response = self.client.get(self.url + query)
+        self.assertEqual(response.status_code, 200)
+        return [user['username'] for user in response.data['results']]
+
+    def test_filters(self):
+        self.add_alumnus(
+            'asha', company='Infosys', department='CSE', location='Mohali', graduation_year=2019,
+            institution=self.institution, skills='Python, SQL',
+        )
+        self.add_alumnus('ravi', company='TCS', department='ECE', location='Ludhiana', graduation_year=2020, skills='Python')
+        self.add_alumnus('pending', company='Infosys', is_approved=False)
+
+        self.assertEqual(self.usernames(), ['ravi', 'asha'])
+        for query, expected in (
+            ('?company=infosys', ['asha']),
+            ('?department=cse', ['asha']),
+            ('?location=LUDHIANA', ['ravi']),
+            ('?graduation_year=2020', ['ravi']),
+            (f'?institution={self.institution.pk}', ['asha']),
+            ('?skills=python', ['ravi', 'asha']),
+            ('?skills=python,%20SQL', ['asha']),
+            ('?search=tcs', ['ravi']),
+            ('?search=ash', ['asha']),
+            ('?company=infosys&graduation_year=2020', []),
+        ):
+            with self.subTest(query=query):
+                self.assertEqual(self.usernames(query), expected)
+
+    def test_text_filters_compare_upper_columns(self):
+        # So the Upper() expression indexes on Profile can be used
+        with CaptureQueriesContext(connection) as queries:
+            self.usernames('?company=infosys&location=mohali')
+        sql = queries[-1]['sql']
+        self.assertIn('UPPER("users_profile"."company") =', sql)
+        self.assertIn('UPPER("users_profile"."location") =', sql)
+
+    def test_numeric_filters_must_be_numbers(self):
+        for query in ('?graduation_year=2019a', '?institution=one'):
+            with self.subTest(query=query):
+                self.assertEqual(self.client.get(self.url + query).status_code, 400)
+
+    def test_cursor_pages_are_stable(self):
+        for i in range(5):
+            self.add_alumnus(f'alum{i}')
+        first = self.client.get(self.url + '?page_size=2').data
+        self.assertEqual([user['username'] for user in first['results']], ['alum4', 'alum3'])
+
+        # Alumni approved after the first page do not shift the next ones
+        self.add_alumnus('newcomer')
+        second = self.client.get(first['next']).data
+        third = self.client.get(second['next']).data
+        self.assertEqual([user['username'] for user in second['results']], ['alum2', 'alum1'])
+        self.assertEqual([user['username'] for user in third['results']], ['alum0'])
+        self.assertIsNone(third['next'])
+
+
+class RosterExportTests(InstitutionTestCase):
+    url = '/api/users/institution-export/'
+
+    def setUp(self):
+        self.admin = User.objects.create_user('admin', email='admin@college.edu.in', role='institution_admin', is_approved=True)
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def add_alumni(self, count):
+        for i in range(User.objects.count(), User.objects.count() + count):
+            user = User.objects.create_user(f'alumnus{i}', role='alumni', is_approved=True)
+            Profile.objects.filter(user=user).update(institution=self.institution, company='=HYPERLINK("x")')
+
+    def test_streams_every_alumnus_in_constant_queries(self):
+        self.add_alumni(3)
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url)
+            lines = b''.join(response.streaming_content).decode().splitlines()
+        self.assertEqual(response['Content-Type'], 'text/csv; charset=utf-8')
+        self.assertEqual(len(lines), 4)
+        self.assertTrue(lines[0].startswith('id,username,email'))
+        # Cells that spreadsheets would run as formulas are escaped
+        self.assertIn('"\'=HYPERLINK(""x"")"', lines[1])
+
+        self.add_alumni(20)
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url)
+            self.assertEqual(len(b''.join(response.streaming_content).splitlines()), 24)
+
+
+@override_settings(PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'])  # Fast logins
+class TokenAuthenticationTests(InstitutionTestCase):
+    def setUp(self):
+        caches['auth'].clear()
+        self.user = User.objects.create_user('alumnus', password='pass12345', role='alumni', is_approved=True)
+        Profile.objects.filter(user=self.user).update(institution=self.institution)
+        self.client = APIClient()
+
+    def login(self):
+        tokens = self.client.post('/api/token/', {'username': 'alumnus', 'password': 'pass12345'}).data
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {tokens['access']}")
+        return tokens
+
+    def test_cache_holds_only_the_auth_fields(self):
+        access = self.login()['access']
+        request = APIRequestFactory().get('/', HTTP_AUTHORIZATION=f'Bearer {access}')
+        with self.assertNumQueries(1):
+            user, _ = CachedJWTAuthentication().authenticate(request)
+        with self.assertNumQueries(0):
+            cached, _ = CachedJWTAuthentication().authenticate(request)
+            self.assertEqual((cached.pk, cached.role, cached.is_approved), (self.user.pk, 'alumni', True))
+            self.assertEqual(cached.profile.institution_id, self.institution.pk)
+        self.assertNotIn(self.user.password, str(caches['auth'].get(f'user:{self.user.pk}')))
+        with self.assertNumQueries(1):
+            self.assertEqual(cached.username, 'alumnus')  # Deferred
+
+    def test_user_without_profile(self):
+        access = self.login()['access']
+        Profile.objects.filter(user=self.user).delete()
+        caches['auth'].clear()
+        user, _ = CachedJWTAuthentication().authenticate(APIRequestFactory().get('/', HTTP_AUTHORIZATION=f'Bearer {access}'))
+        with self.assertNumQueries(0):
+            self.assertFalse(hasattr(user, 'profile'))
+
+    def test_inactive_user_is_refused_on_a_cache_miss(self):
+        # As in another process, which never saw the deactivation signal
+        self.login()
+        User.objects.filter(pk=self.user.pk).update(is_active=False)
+        caches['auth'].clear()
+        self.assertEqual(self.client.get('/api/users/alumni/').status_code, 401)
+
+    def test_cached_user_is_dropped_when_saved(self):
+        self.login()
+        self.client.get('/api/users/me/')
+        self.user.first_name = 'Renamed'
+        self.user.save()
+        self.assertIsNone(caches['auth'].get(f'user:{self.user.pk}'))
+        self.assertEqual(self.client.get('/api/users/me/').data['first_name'], 'Renamed')
+
+    def test_update_does_not_write_back_cached_fields(self):
+        User.objects.filter(pk=self.user.pk).update(is_approved=False)
+        counters.rebuild()
+        self.login()
+        self.client.get('/api/users/me/')  # Caches is_approved=False
+        # Approved elsewhere, without this process's cache hearing of it
+        User.objects.filter(pk=self.user.pk).update(is_approved=True)
+        counters.rebuild()
+
+        response = self.client.patch('/api/users/me/', {'first_name': 'Renamed'})
+        self.assertEqual(response.status_code, 200)
+        self.user.refresh_from_db()
+        self.assertEqual((self.user.first_name, self.user.is_approved), ('Renamed', True))
+        self.assertEqual(counters.read('institution', self.institution.pk)[('alumni', True)], 1)
+
+    def test_deactivated_user_is_refused(self):
+        self.login()
+        self.user.is_active = False
+        self.user.save()
+        self.assertEqual(self.client.get('/api/users/me/').status_code, 401)
+
+
+class MeViewTests(TestCase):
+    def setUp(self):
+        caches['auth'].clear()
+        self.user = User.objects.create_user('alumnus', role='alumni', is_approved=True)
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {RefreshToken.for_user(self.user).access_token}')
+
+    def test_conditional_get_of_own_details(self):
+        etag = self.client.get('/api/users/me/')['ETag']
+        with self.assertNumQueries(0):
+            response = self.client.get('/api/users/me/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        # The public profile page of the same user validates with the same tag
+        self.assertEqual(self.client.get(f'/api/users/{self.user.pk}/', HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        profile = Profile.objects.get(user=self.user)
+        profile.headline = 'Engineer'
+        profile.save()
+        response = self.client.get('/api/users/me/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['profile']['headline'], 'Engineer')
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_user_without_profile(self):
+        Profile.objects.filter(user=self.user).delete()
+        response = self.client.get('/api/users/me/')
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNone(response.data['profile'])
+        self.assertEqual(self.client.get('/api/users/me/', HTTP_IF_NONE_MATCH=response['ETag']).status_code, 304)
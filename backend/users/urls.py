@@ -1,14 +1,18 @@
 # backend/users/urls.py
 from django.urls import path
-from .views import RegisterView ,MeView ,AlumniListView ,UserDetailView, MentorRecommendationView,PendingUsersListView, ApproveUserView, InstitutionPendingUsersView
+from .views import RegisterView ,SetPasswordView ,MeView ,AlumniListView ,UserDetailView, MentorRecommendationView,PendingUsersListView, ApproveUserView, InstitutionPendingUsersView, InstitutionBulkReviewView, InstitutionAlumniImportView, InstitutionRosterExportView
 urlpatterns = [
     path('register/', RegisterView.as_view(), name='auth_register'),
+    path('set-password/', SetPasswordView.as_view(), name='set_password'),
     path('me/', MeView.as_view(), name='auth_me'),
     # --- ADD THIS NEW LINE ---
     path('alumni/', AlumniListView.as_view(), name='alumni_list'),
     path('mentors/recommend/', MentorRecommendationView.as_view(), name='mentor_recommend'),
     path('pending/', PendingUsersListView.as_view(), name='pending_users'), # <-- ADD THIS
     path('institution-pending/', InstitutionPendingUsersView.as_view(), name='institution_pending_users'),
+    path('institution-pending/review/', InstitutionBulkReviewView.as_view(), name='institution_bulk_review'),
+    path('institution-import/', InstitutionAlumniImportView.as_view(), name='institution_alumni_import'),
+    path('institution-export/', InstitutionRosterExportView.as_view(), name='institution_roster_export'),
     path('<int:pk>/approve/', ApproveUserView.as_view(), name='approve_user'),
     # --- ADD THIS NEW DYNAMIC LINE ---
     path('<int:pk>/', UserDetailView.as_view(), name='user_detail'),
@@ -2,103 +2,188 @@ from django.shortcuts import render
 
 # Create your views here.
 # backend/users/views.py
+import logging
 from rest_framework import generics , status
 from rest_framework.permissions import AllowAny ,IsAuthenticated
-from .models import User
-from .serializers import UserSerializer
+from collections import Counter
+from django.db import transaction
+from django.utils import timezone
+from django.db.models import Count, Q
+from django.db.models.functions import Upper
+from rest_framework.exceptions import ValidationError
+from .models import User, UserSkill, normalize_skills
+from .importer import AlumniImporter, ImportFormatError, read_rows
+from .export import ROSTER_COLUMNS, roster_rows, stream_csv
+from .pagination import AlumniCursorPagination
+from .authentication import deny_users, forget_users
+from .invitations import send_invitation, unclaimed_account
 from rest_framework.views import APIView # <-- Add this import
+from rest_framework.parsers import MultiPartParser
 from rest_framework.response import Response # <-- Add this import
-from .serializers import UserSerializer, RegisterSerializer
+from .serializers import UserSerializer, RegisterSerializer, SetPasswordSerializer
 from institutions.models import Institution
+from institutions import counters
+from chatbot.search import store_alumni_documents
+from backend import response_cache
+from backend.response_cache import CachedResponseMixin, conditional_response
+
+logger = logging.getLogger(__name__)
 
 # This view uses Django REST Framework's generic 'CreateAPIView'
 # which is designed specifically for creating new objects.
 class RegisterView(generics.CreateAPIView):
+    """
+    Self-registration. An email that belongs to an account imported by an
+    institution claims that account instead: its owner is emailed a link to
+    choose a password (202), and no second account is created.
+    """
     queryset = User.objects.all()
     # Anyone can access this view to register
     permission_classes = (AllowAny,)
     serializer_class = RegisterSerializer 
 
+    def create(self, request, *args, **kwargs):
+        email = request.data.get('email') if isinstance(request.data, dict) else None
+        account = unclaimed_account(email)
+        if account is None:
+            return super().create(request, *args, **kwargs)
+        try:
+            send_invitation(
+                account, "Claim your alumni account",
+                "Your institution has already created an account for you. Choose a password to start using it.",
+            )
+        except OSError as e:
+            logger.warning("Could not email the set-password link to user %s: %s", account.pk, e)
+            return Response({"error": "Could not send the email. Please try again later."}, status=status.HTTP_503_SERVICE_UNAVAILABLE)
+        return Response(
+            {"status": "Your institution has already created an account for this email. We have emailed you a link to choose its password."},
+            status=status.HTTP_202_ACCEPTED,
+        )
+
+class SetPasswordView(APIView):
+    """
+    Sets the password of an account from its emailed set-password link.
+    """
+    permission_classes = (AllowAny,)
+
+    def post(self, request, *args, **kwargs):
+        serializer = SetPasswordSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        user = serializer.validated_data['user']
+        user.set_password(serializer.validated_data['password'])
+        user.save()
+        return Response({"status": "Password set. You can now log in.", "username": user.username})
+
 class MeView(generics.RetrieveUpdateAPIView): # <-- CHANGE THIS
+    """
+    The logged-in user's details. GET answers a matching If-None-Match with
+    a 304 built from the user's version stamps, without serializing.
+    """
     permission_classes = (IsAuthenticated,)
     serializer_class = UserSerializer
 
     def get_object(self):
-        return self.request.user
-    
-    # --- ADD THIS METHOD TO INTERCEPT THE UPDATE REQUEST ---
-    def update(self, request, *args, **kwargs):
-        # This is our checkpoint. Let's see what data arrived.
-        print("====== BACKEND CHECKPOINT ======")
-        print("Request Body Received:", request.data)
-        print("==============================")
-        
-        # This line calls the original update logic after our print statement
-        return super().update(request, *args, **kwargs)
-    
+        # request.user only has the cached auth fields, which may be stale,
+        # so saving it could write old values back
+        return User.objects.select_related('profile').get(pk=self.request.user.pk)
+
+    def get(self, request, *args, **kwargs):
+        retrieve = super().get
+        return conditional_response(request, request.user.details_etag(), lambda: retrieve(request, *args, **kwargs))
+
 # --- ADD THIS NEW VIEW ---
 class AlumniListView(generics.ListAPIView):
     """
-    Returns a list of all users with the 'alumni' role.
+    Returns a cursor-paginated list of approved users with the 'alumni' role.
+    Supports server-side filtering through these query parameters:
+    company, department, location (case-insensitive exact match),
+    graduation_year, institution (id), skills (comma-separated, all must match)
+    and search (name, username or company).
     This endpoint is protected and requires authentication to access.
     """
     permission_classes = [IsAuthenticated]
     serializer_class = UserSerializer
+    pagination_class = AlumniCursorPagination
     
     def get_queryset(self):
-       # --- THIS IS THE CRITICAL FIX ---
-        # 1. Get all approved alumni
-        queryset = User.objects.filter(role='alumni', is_approved=True)
-        
-        # 2. Exclude the current user from that list
-        #    self.request.user.pk is the ID of the logged-in user.
-        queryset = queryset.exclude(pk=self.request.user.pk)
-        
-        return queryset
-        # --- END OF FIX ---
+        params = self.request.query_params
+
+        # 1. Get all approved alumni, except the current user
+        queryset = User.objects.filter(role='alumni', is_approved=True).exclude(pk=self.request.user.pk)
+
+        # 2. Apply the optional filters; each one maps to an indexed Profile column.
+        # The text filters compare UPPER(column) so they use the Upper() indexes
+        for field in ('company', 'department', 'location'):
+            value = params.get(field, '').strip()
+            if value:
+                queryset = queryset.alias(**{f'{field}_upper': Upper(f'profile__{field}')}).filter(**{f'{field}_upper': value.upper()})
+
+        for field in ('graduation_year', 'institution'):
+            value = params.get(field, '').strip()
+            if value:
+                if not value.isdigit():
+                    raise ValidationError({field: 'Must be a number.'})
+                queryset = queryset.filter(**{f'profile__{field}': int(value)})
 
-class UserDetailView(generics.RetrieveAPIView):
+        # 3. Every requested skill must be present, using the skill index
+        for skill in normalize_skills(params.get('skills', '')):
+            queryset = queryset.filter(skill_links__skill__name=skill)
+
+        search = params.get('search', '').strip()
+        if search:
+            queryset = queryset.filter(
+                Q(first_name__icontains=search)
+                | Q(last_name__icontains=search)
+                | Q(username__icontains=search)
+                | Q(profile__company__icontains=search)
+            )
+
+        # The nested ProfileSerializer reads the profile, so join it up front
+        return queryset.select_related('profile')
+
+class UserDetailView(CachedResponseMixin, generics.RetrieveAPIView):
     """
     Returns the details for a single user, identified by their primary key (ID).
+    The response is cached until the user or their profile changes.
     """
     permission_classes = [IsAuthenticated]
     serializer_class = UserSerializer
-    queryset = User.objects.all() # The view will look for a user within this set
+    queryset = User.objects.select_related('profile') # The view will look for a user within this set
+
+    def get_cache_scopes(self):
+        return (response_cache.user_scope(self.kwargs['pk']),)
+
+    def get_object(self):
+        self.object = super().get_object()
+        return self.object
+
+    def get_response_etag(self, data):
+        # Same ETag as MeView gives the same user
+        return self.object.details_etag()
 
 class MentorRecommendationView(APIView):
     permission_classes = [IsAuthenticated]
 
     def get(self, request, *args, **kwargs):
         current_user = request.user
-        
-        # We can't recommend mentors if the user has no profile or skills
-        if not hasattr(current_user, 'profile') or not current_user.profile.skills:
-            return Response([]) # Return an empty list
-
-        # 1. Get the current user's skills
-        user_skills = set([skill.strip().lower() for skill in current_user.profile.skills.split(',')])
-        if not user_skills:
-            return Response([])
-
-        # 2. Find all potential mentors (alumni who are open to mentoring)
-        potential_mentors = User.objects.filter(
-            role='alumni', is_approved=True
-        ).exclude(pk=current_user.pk).prefetch_related('profile') # Exclude the user themselves
-
-        # 3. Calculate a match score for each mentor
-        matches = []
-        for mentor in potential_mentors:
-            if hasattr(mentor, 'profile') and mentor.profile.skills:
-                mentor_skills = set([skill.strip().lower() for skill in mentor.profile.skills.split(',')])
-                common_skills = user_skills.intersection(mentor_skills)
-                
-                if common_skills:
-                    match_score = len(common_skills)
-                    matches.append({'mentor': UserSerializer(mentor).data, 'score': match_score})
-        
-        # 4. Sort by the best score and return the top 3
-        sorted_matches = sorted(matches, key=lambda x: x['score'], reverse=True)
-        return Response(sorted_matches[:3])
+
+        # 1. The current user's skills, straight from the inverted index
+        user_skill_ids = UserSkill.objects.filter(user=current_user).values('skill_id')
+
+        # 2. Rank approved alumni by how many of those skills they share.
+        #    The filter and the Count use the same join, so the score is the
+        #    number of overlapping skills and it all runs as one query.
+        mentors = (
+            User.objects.filter(role='alumni', is_approved=True, skill_links__skill_id__in=user_skill_ids)
+            .exclude(pk=current_user.pk)
+            .annotate(score=Count('skill_links'))
+            .select_related('profile')
+            .order_by('-score', 'pk')[:3]
+        )
+
+        # 3. Return the top 3 in the same shape as before
+        matches = [{'mentor': UserSerializer(mentor).data, 'score': mentor.score} for mentor in mentors]
+        return Response(matches)
     
 class PendingUsersListView(generics.ListAPIView):
     """
@@ -144,7 +229,131 @@ class InstitutionPendingUsersView(generics.ListAPIView):
             return User.objects.none()
 
         # Find all users who are not approved AND whose profile is linked to this institution
+        # (declined registrations are deactivated and stay out of the list)
         return User.objects.filter(
             profile__institution=institution,
-            is_approved=False
-        ).order_by('date_joined')
\ No newline at end of file
+            is_approved=False,
+            is_active=True,
+        ).order_by('date_joined')
+
+
+class InstitutionBulkReviewView(APIView):
+    """
+    Approves or declines many pending registrations of the Institution
+    Admin's college at once, with one UPDATE in one transaction.
+
+    Body: {"action": "approve" | "decline", "ids": [...]} or, instead of ids,
+    {"filter": {"role": ..., "department": ..., "graduation_year": ...}}
+    (an empty filter selects every pending user). Declined users are
+    deactivated rather than deleted. Returns the outcome for every user.
+    """
+    permission_classes = [IsAuthenticated]
+    MAX_IDS = 1000
+    FILTER_FIELDS = {'role': 'role', 'department': 'profile__department__iexact', 'graduation_year': 'profile__graduation_year'}
+    NUMERIC_FILTERS = ('graduation_year',)
+
+    def post(self, request, *args, **kwargs):
+        try:
+            institution = Institution.objects.get(contact_email=request.user.email)
+        except Institution.DoesNotExist:
+            return Response({'error': 'You do not manage an institution.'}, status=status.HTTP_403_FORBIDDEN)
+
+        action = request.data.get('action')
+        if action not in ('approve', 'decline'):
+            return Response({'error': "action must be 'approve' or 'decline'."}, status=status.HTTP_400_BAD_REQUEST)
+
+        pending = User.objects.filter(profile__institution=institution, is_approved=False, is_active=True)
+        ids = request.data.get('ids')
+        if ids is not None:
+            if not isinstance(ids, list) or not all(isinstance(pk, int) for pk in ids):
+                return Response({'error': 'ids must be a list of user ids.'}, status=status.HTTP_400_BAD_REQUEST)
+            if len(ids) > self.MAX_IDS:
+                return Response({'error': f'At most {self.MAX_IDS} ids per request.'}, status=status.HTTP_400_BAD_REQUEST)
+            pending = pending.filter(pk__in=ids)
+        else:
+            filters = request.data.get('filter')
+            if not isinstance(filters, dict) or set(filters) - set(self.FILTER_FIELDS):
+                return Response(
+                    {'error': f"Send ids or a filter on {', '.join(self.FILTER_FIELDS)}."},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            for key in self.NUMERIC_FILTERS:
+                if key in filters and not str(filters[key]).isdigit():
+                    return Response({'error': f'{key} must be a number.'}, status=status.HTTP_400_BAD_REQUEST)
+            pending = pending.filter(**{self.FILTER_FIELDS[key]: value for key, value in filters.items()})
+
+        with transaction.atomic():
+            # Lock the rows so a concurrent review cannot count them twice
+            reviewed = dict(pending.select_for_update(of=('self',)).values_list('pk', 'role'))
+            updates = {'is_approved': True} if action == 'approve' else {'is_active': False}
+            updates['updated_at'] = timezone.now()  # Not set by .update()
+            User.objects.filter(pk__in=reviewed).update(**updates)
+
+            # .update() skips the signals, so do what they would have
+            response_cache.invalidate(*map(response_cache.user_scope, reviewed))
+            # Declined users are deactivated, and inactive users are not counted
+            for role, total in Counter(reviewed.values()).items():
+                counters.adjust(role, False, -total, institution.pk)
+                if action == 'approve':
+                    counters.adjust(role, True, total, institution.pk)
+            if action == 'approve':
+                forget_users(reviewed)
+                store_alumni_documents(
+                    User.objects.filter(pk__in=reviewed, role='alumni').select_related('profile')
+                )
+            else:
+                deny_users(reviewed)
+
+        outcome = 'approved' if action == 'approve' else 'declined'
+        results = [{'id': pk, 'status': outcome} for pk in reviewed]
+        # Requested ids that were not pending users of this institution
+        results += [{'id': pk, 'status': 'not_found'} for pk in dict.fromkeys(ids or []) if pk not in reviewed]
+        return Response({'processed': len(reviewed), 'results': results}, status=status.HTTP_200_OK)
+
+
+class InstitutionAlumniImportView(APIView):
+    """
+    Lets an Institution Admin upload a CSV or XLSX file of alumni records.
+    The accounts are created in bulk, linked to the admin's institution,
+    and the response lists the rows that could not be imported.
+    """
+    permission_classes = [IsAuthenticated]
+    parser_classes = [MultiPartParser]
+
+    def post(self, request, *args, **kwargs):
+        try:
+            institution = Institution.objects.get(contact_email=request.user.email)
+        except Institution.DoesNotExist:
+            return Response({'error': 'You do not manage an institution.'}, status=status.HTTP_403_FORBIDDEN)
+
+        upload = request.FILES.get('file')
+        if upload is None:
+            return Response({'error': 'Attach the file as "file".'}, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            result = AlumniImporter(institution).run(read_rows(upload, upload.name))
+        except ImportFormatError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        return Response({'created': result.created, 'failed': result.failed, 'errors': result.errors})
+
+
+class InstitutionRosterExportView(APIView):
+    """
+    Streams the Institution Admin's full roster as a CSV download.
+    Optional query parameter: role ('alumni' by default, 'student' or 'all').
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, *args, **kwargs):
+        try:
+            institution = Institution.objects.get(contact_email=request.user.email)
+        except Institution.DoesNotExist:
+            return Response({'error': 'You do not manage an institution.'}, status=status.HTTP_403_FORBIDDEN)
+
+        role = request.query_params.get('role', 'alumni')
+        if role not in ('alumni', 'student', 'all'):
+            return Response({'error': "role must be 'alumni', 'student' or 'all'."}, status=status.HTTP_400_BAD_REQUEST)
+
+        users = User.objects.filter(profile__institution=institution).select_related('profile').order_by('pk')
+        if role != 'all':
+            users = users.filter(role=role)
+        return stream_csv(f'{role}-roster.csv', [name for name, _ in ROSTER_COLUMNS], roster_rows(users))
@@ -27,6 +27,7 @@ export default function ChatbotWidget() {
   const [messages, setMessages] = useState([{ type: 'bot', text: "Hello! As Alumni Assist, I can answer general questions. How can I help you today?" }]);
   const [input, setInput] = useState('');
   const [isLoading, setIsLoading] = useState(false);
+  const [conversationId, setConversationId] = useState(null); // Server-side session holding the history
   const messagesEndRef = useRef(null); // Ref for auto-scrolling
 
   // This effect will scroll to the bottom of the chat window whenever a new message is added
@@ -46,16 +47,20 @@ export default function ChatbotWidget() {
     setIsLoading(true);
 
     try {
-      // --- THIS IS THE KEY CHANGE ---
-      // We now send the new user query AND the entire conversation history.
-      const response = await api.post('/chatbot/query/', { 
-        query: input,
-        history: newMessages 
-      });
-      // --- END OF KEY CHANGE ---
-      
-      const botMessage = { type: 'bot', text: response.data.response };
-      setMessages(prev => [...prev, botMessage]);
+      // Stream the answer token by token; fall back to the plain endpoint if the
+      // stream fails before any text arrives (a network error, no stream support,
+      // or an expired token the api client can refresh). Other errors are shown.
+      // The server keeps the conversation history, so we only send the new query.
+      const streamed = await streamAnswer(input);
+      if (!streamed) {
+        const response = await api.post('/chatbot/query/', { 
+          query: input,
+          conversation_id: conversationId 
+        });
+        setConversationId(response.data.conversation_id);
+        const botMessage = { type: 'bot', text: response.data.response };
+        setMessages(prev => [...prev, botMessage]);
+      }
     } catch (error) {
       const errorMessage = { type: 'bot', text: "Sorry, I'm having trouble connecting. Please try again later." };
       setMessages(prev => [...prev, errorMessage]);
@@ -65,6 +70,66 @@ export default function ChatbotWidget() {
     }
   };
 
+  // Reads the Server-Sent Events stream and grows the bot's message as chunks arrive.
+  // Returns false if the answer could not be streamed and none of it was shown.
+  const streamAnswer = async (query) => {
+    let response;
+    try {
+      response = await fetch(`${api.defaults.baseURL}/chatbot/query/stream/`, {
+        method: 'POST',
+        headers: {
+          'Content-Type': 'application/json',
+          'Authorization': `Bearer ${localStorage.getItem('access_token')}`,
+        },
+        body: JSON.stringify({ query, conversation_id: conversationId }),
+      });
+    } catch (error) {
+      return false; // Network error
+    }
+    if (response.status === 401 || !response.body) return false;
+    if (!response.ok) {
+      const data = await response.json().catch(() => ({}));
+      throw new Error(data.error || `Chatbot request failed with status ${response.status}`);
+    }
+
+    let started = false;
+    const appendText = (text) => {
+      if (!started) {
+        started = true;
+        setIsLoading(false);
+        setMessages(prev => [...prev, { type: 'bot', text }]);
+      } else {
+        setMessages(prev => [...prev.slice(0, -1), { type: 'bot', text: prev[prev.length - 1].text + text }]);
+      }
+    };
+
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+    try {
+      while (true) {
+        const { done, value } = await reader.read();
+        if (done) break;
+        buffer += decoder.decode(value, { stream: true });
+        const events = buffer.split('\n\n');
+        buffer = events.pop(); // Keep any incomplete event for the next read
+        for (const rawEvent of events) {
+          const dataLine = rawEvent.split('\n').find(line => line.startsWith('data: '));
+          if (!dataLine) continue;
+          const payload = JSON.parse(dataLine.slice(6));
+          if (rawEvent.startsWith('event: error')) throw new Error(payload.error);
+          if (rawEvent.startsWith('event: done')) setConversationId(payload.conversation_id);
+          if (payload.text) appendText(payload.text);
+        }
+      }
+    } catch (error) {
+      // The server stores a turn only once it is answered, so a retry is safe
+      if (started) throw error;
+      return false;
+    }
+    return true;
+  };
+
   if (!isOpen) {
     return (
       <button 
@@ -0,0 +1,68 @@
+import { useState } from 'react';
+import DashboardLayout from '../../../components/layout/DashboardLayout';
+import Card from '../../../components/ui/Card';
+import Button from '../../../components/ui/Button';
+import Spinner from '../../../components/ui/Spinner';
+import api from '../../../lib/api';
+import { useNotification } from '../../../context/NotificationContext';
+
+export default function ImportAlumniPage() {
+  const [file, setFile] = useState(null);
+  const [uploading, setUploading] = useState(false);
+  const [result, setResult] = useState(null);
+  const { addNotification } = useNotification();
+
+  const handleUpload = async (e) => {
+    e.preventDefault();
+    if (!file) return;
+    setUploading(true);
+    setResult(null);
+    try {
+      const formData = new FormData();
+      formData.append('file', file);
+      const response = await api.post('/users/institution-import/', formData);
+      setResult(response.data);
+      addNotification(`${response.data.created} alumni imported.`, 'success');
+    } catch (error) {
+      addNotification(error.response?.data?.error || 'Import failed.', 'error');
+      console.error(error);
+    } finally {
+      setUploading(false);
+    }
+  };
+
+  return (
+    <DashboardLayout>
+      <h1 className="text-3xl font-bold mb-6">Import Alumni Records</h1>
+      <Card title="Upload a CSV or Excel file">
+        <p className="text-sm text-gray-600 mb-4">
+          Required column: <code>email</code>. Optional: username, first_name, last_name, role (alumni or student),
+          headline, about, location, skills, department, graduation_year, enrollment_number, company.
+        </p>
+        <form onSubmit={handleUpload} className="flex items-center space-x-4">
+          <input type="file" accept=".csv,.xlsx" onChange={(e) => setFile(e.target.files[0])} />
+          <Button type="submit">Import</Button>
+        </form>
+        {uploading && <Spinner />}
+      </Card>
+
+      {result && (
+        <div className="mt-8">
+          <Card title={`Imported ${result.created}, failed ${result.failed}`}>
+            {result.errors.length > 0 ? (
+              <ul className="space-y-1 text-sm">
+                {result.errors.map((error) => (
+                  <li key={error.row} className="text-red-600">
+                    Row {error.row}: {Object.entries(error.errors).map(([column, messages]) => `${column}: ${messages.join(' ')}`).join('; ')}
+                  </li>
+                ))}
+              </ul>
+            ) : (
+              <p className="text-gray-500">Every row was imported.</p>
+            )}
+          </Card>
+        </div>
+      )}
+    </DashboardLayout>
+  );
+}
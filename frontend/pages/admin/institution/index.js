@@ -33,6 +33,21 @@ export default function InstitutionAdminDashboard() {
     fetchData();
   }, []);
 
+  // The token travels in a header, so the CSV is fetched as a blob rather than linked to directly
+  const handleDownload = async (url, filename) => {
+    try {
+      const response = await api.get(url, { responseType: 'blob' });
+      const link = document.createElement('a');
+      link.href = URL.createObjectURL(response.data);
+      link.download = filename;
+      link.click();
+      URL.revokeObjectURL(link.href);
+    } catch (error) {
+      addNotification('Failed to download the export.', 'error');
+      console.error(error);
+    }
+  };
+
   if (loading || !stats) {
     return <DashboardLayout><Spinner /></DashboardLayout>;
   }
@@ -60,6 +75,9 @@ export default function InstitutionAdminDashboard() {
             {/* --- END OF FIX --- */}
             
             <Link href="/admin/institution/manage-admins" className="block bg-green-500 text-white p-4 rounded-lg hover:bg-green-600 transition-colors">Manage Department Admins</Link>
+            <Link href="/admin/institution/import-alumni" className="block bg-purple-500 text-white p-4 rounded-lg hover:bg-purple-600 transition-colors">Import Alumni Records</Link>
+            <button onClick={() => handleDownload('/users/institution-export/?role=alumni', 'alumni-roster.csv')} className="block bg-indigo-500 text-white p-4 rounded-lg hover:bg-indigo-600 transition-colors">Download Alumni Roster (CSV)</button>
+            <button onClick={() => handleDownload('/institutions/my-institution/analytics/export/', 'institution-stats.csv')} className="block bg-indigo-500 text-white p-4 rounded-lg hover:bg-indigo-600 transition-colors">Download Monthly Stats (CSV)</button>
             <div className="bg-gray-300 text-gray-600 p-4 rounded-lg cursor-not-allowed">Manage Departments (Coming Soon)</div>
             <div className="bg-gray-300 text-gray-600 p-4 rounded-lg cursor-not-allowed">Send Announcement (Coming Soon)</div>
           </div>
@@ -1,5 +1,4 @@
 import { useState, useEffect } from 'react';
-import { useRouter } from 'next/router'; // <-- Step 1: Import the router
 import DashboardLayout from '../../../components/layout/DashboardLayout';
 import Card from '../../../components/ui/Card';
 import Button from '../../../components/ui/Button';
@@ -10,8 +9,8 @@ import { useNotification } from '../../../context/NotificationContext';
 export default function InstitutionApprovalsPage() {
   const [pendingUsers, setPendingUsers] = useState([]);
   const [loading, setLoading] = useState(true);
+  const [selected, setSelected] = useState([]); // ids ticked for a bulk review
   const { addNotification } = useNotification();
-  const router = useRouter(); // <-- Step 2: Initialize the router
 
   const fetchPendingUsers = async () => {
     try {
@@ -29,19 +28,24 @@ export default function InstitutionApprovalsPage() {
     fetchPendingUsers();
   }, []);
 
-  const handleApprove = async (userId) => {
+  const toggleSelected = (userId) => {
+    setSelected(current => current.includes(userId) ? current.filter(id => id !== userId) : [...current, userId]);
+  };
+
+  // Approves or declines many users in one request; with no ids, every pending user
+  const handleReview = async (action, ids = null) => {
     try {
-      await api.post(`/users/${userId}/approve/`);
-      addNotification('User approved successfully!', 'success');
-      
-      // --- Step 3: THIS IS THE CRITICAL FIX ---
-      // After successfully approving, navigate the admin back to their main dashboard.
-      // This will cause the dashboard to re-fetch its data.
-      router.push('/admin/institution/');
-      // --- END OF FIX ---
+      const body = ids ? { action, ids } : { action, filter: {} };
+      const response = await api.post('/users/institution-pending/review/', body);
+      const processed = response.data.results.filter(r => r.status !== 'not_found').map(r => r.id);
+      addNotification(`${processed.length} user(s) ${action === 'approve' ? 'approved' : 'declined'}.`, 'success');
 
+      // Drop the reviewed users from the list instead of reloading the page
+      setPendingUsers(current => ids ? current.filter(user => !processed.includes(user.id)) : []);
+      setSelected(current => current.filter(id => !processed.includes(id)));
     } catch (error) {
-      addNotification('Failed to approve user.', 'error');
+      addNotification(`Failed to ${action} users.`, 'error');
+      console.error(error);
     }
   };
 
@@ -55,17 +59,28 @@ export default function InstitutionApprovalsPage() {
       <Card title={`Pending Applications (${pendingUsers.length})`}>
         {pendingUsers.length > 0 ? (
           <div className="space-y-4">
+            <div className="flex flex-wrap items-center gap-2">
+              {selected.length > 0 && (
+                <>
+                  <Button variant="primary" onClick={() => handleReview('approve', selected)}>Approve selected ({selected.length})</Button>
+                  <Button variant="danger" onClick={() => handleReview('decline', selected)}>Decline selected</Button>
+                </>
+              )}
+              <Button variant="secondary" onClick={() => handleReview('approve')}>Approve all</Button>
+            </div>
             {pendingUsers.map((user) => (
               <div key={user.id} className="flex flex-col sm:flex-row items-start sm:items-center justify-between p-3 bg-gray-50 rounded-md border">
-                <div className="mb-2 sm:mb-0">
-                  <p className="font-bold text-gray-800">{user.first_name || user.username}</p>
-                  <p className="text-sm text-gray-600">{user.email}</p>
-
-                  <p className="text-sm text-gray-500">Department: {user.profile?.department || 'N/A'}</p>
-                </div>
+                <label className="flex items-start space-x-3 mb-2 sm:mb-0">
+                  <input type="checkbox" className="mt-1" checked={selected.includes(user.id)} onChange={() => toggleSelected(user.id)} />
+                  <div>
+                    <p className="font-bold text-gray-800">{user.first_name || user.username}</p>
+                    <p className="text-sm text-gray-600">{user.email}</p>
+                    <p className="text-sm text-gray-500">Department: {user.profile?.department || 'N/A'}</p>
+                  </div>
+                </label>
                 <div className="flex items-center space-x-2 self-end sm:self-center">
-                  <Button variant="primary" onClick={() => handleApprove(user.id)}>Approve</Button>
-                  <Button variant="danger">Decline</Button>
+                  <Button variant="primary" onClick={() => handleReview('approve', [user.id])}>Approve</Button>
+                  <Button variant="danger" onClick={() => handleReview('decline', [user.id])}>Decline</Button>
                 </div>
               </div>
             ))}
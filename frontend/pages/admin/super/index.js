@@ -49,8 +49,9 @@ export default function SuperAdminDashboard() {
 
   const handleApprove = async (institutionId) => {
     try {
-      await api.post(`/institutions/${institutionId}/approve/`);
-      addNotification('Institution approved successfully!', 'success');
+      const response = await api.post(`/institutions/${institutionId}/approve/`);
+      // Says whether the new admin was emailed their set-password link
+      addNotification(response.data.status, 'success');
       // Manually remove from list for instant UI feedback
       setPending(current => current.filter(inst => inst.id !== institutionId));
       // Refresh analytics data
@@ -16,7 +16,9 @@ const AlumniCard = ({ alumnus }) => (
 
 export default function AlumniDirectory() {
   const [alumni, setAlumni] = useState([]);
+  const [nextPage, setNextPage] = useState(null); // Cursor URL for the next page
   const [loading, setLoading] = useState(true);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [error, setError] = useState('');
 
   useEffect(() => {
@@ -25,7 +27,8 @@ export default function AlumniDirectory() {
       try {
         // Use our API client to make a GET request to the new endpoint
         const response = await api.get('/users/alumni/');
-        setAlumni(response.data); // Store the list of alumni in our state
+        setAlumni(response.data.results); // Store the first page of alumni in our state
+        setNextPage(response.data.next);
       } catch (err) {
         setError('Failed to load alumni data. Please try again later.');
         console.error(err);
@@ -36,6 +39,22 @@ export default function AlumniDirectory() {
     fetchAlumni();
   }, []); // The empty array ensures this effect runs only once
 
+  // The directory is paginated on the server, so fetch the next page on demand
+  const loadMore = async () => {
+    if (!nextPage) return;
+    setLoadingMore(true);
+    try {
+      const response = await api.get(nextPage);
+      setAlumni(prev => [...prev, ...response.data.results]);
+      setNextPage(response.data.next);
+    } catch (err) {
+      setError('Failed to load more alumni. Please try again later.');
+      console.error(err);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const renderContent = () => {
     if (loading) {
       return <Spinner />;
@@ -50,14 +69,27 @@ export default function AlumniDirectory() {
     }
 
     return (
-      <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-6">
-        {alumni.map(person => (
-          // Link to the dynamic profile page using the user's ID
-          <Link key={person.id} href={`/alumni/${person.id}`}>
-            <AlumniCard alumnus={person} />
-          </Link>
-        ))}
-      </div>
+      <>
+        <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-6">
+          {alumni.map(person => (
+            // Link to the dynamic profile page using the user's ID
+            <Link key={person.id} href={`/alumni/${person.id}`}>
+              <AlumniCard alumnus={person} />
+            </Link>
+          ))}
+        </div>
+        {nextPage && (
+          <div className="flex justify-center mt-8">
+            <button
+              onClick={loadMore}
+              disabled={loadingMore}
+              className="px-6 py-2 bg-blue-600 text-white rounded-md hover:bg-blue-700 disabled:opacity-50"
+            >
+              {loadingMore ? 'Loading...' : 'Load more'}
+            </button>
+          </div>
+        )}
+      </>
     );
   };
 
@@ -14,6 +14,9 @@ export default function EventsPage() {
   const { user } = useAuth(); // Get the currently logged-in user
   
   const [events, setEvents] = useState([]);
+  const [when, setWhen] = useState('upcoming'); // 'upcoming' or 'past', filtered on the server
+  const [nextPage, setNextPage] = useState(null); // Cursor URL for the next page
+  const [loadingMore, setLoadingMore] = useState(false);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState('');
   
@@ -27,8 +30,9 @@ export default function EventsPage() {
     setLoading(true);
     setError('');
     try {
-      const response = await api.get('/events/');
-      setEvents(response.data);
+      const response = await api.get('/events/', { params: { when } });
+      setEvents(response.data.results);
+      setNextPage(response.data.next);
     } catch (err) {
       setError('Failed to load events. Please try again later.');
       console.error(err);
@@ -42,7 +46,23 @@ export default function EventsPage() {
     if (user) {
       fetchEvents();
     }
-  }, [user]); // This dependency ensures the effect re-runs when the user is available
+  }, [user, when]); // Re-runs when the user is available or the tab changes
+
+  // The list is paginated on the server, so fetch the next page on demand
+  const loadMore = async () => {
+    if (!nextPage) return;
+    setLoadingMore(true);
+    try {
+      const response = await api.get(nextPage);
+      setEvents(prev => [...prev, ...response.data.results]);
+      setNextPage(response.data.next);
+    } catch (err) {
+      setError('Failed to load more events. Please try again later.');
+      console.error(err);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
 
   const handleSaveEvent = async (eventData) => {
     try {
@@ -95,20 +115,33 @@ export default function EventsPage() {
     if (loading || !user) return <Spinner />;
     
     if (error && events.length === 0) return <p className="text-red-500 text-center">{error}</p>;
-    if (events.length === 0) return <p className="text-gray-500 text-center">No upcoming events.</p>;
+    if (events.length === 0) return <p className="text-gray-500 text-center">No {when} events.</p>;
     
     return (
-      <div className="space-y-6">
-        {events.map(event => (
-          <EventCard 
-            key={event.id} 
-            event={event} 
-            user={user} // Pass the complete user object down as a prop
-            onEdit={() => handleOpenEditModal(event)}
-            onDelete={() => handleOpenDeleteModal(event)}
-          />
-        ))}
-      </div>
+      <>
+        <div className="space-y-6">
+          {events.map(event => (
+            <EventCard 
+              key={event.id} 
+              event={event} 
+              user={user} // Pass the complete user object down as a prop
+              onEdit={() => handleOpenEditModal(event)}
+              onDelete={() => handleOpenDeleteModal(event)}
+            />
+          ))}
+        </div>
+        {nextPage && (
+          <div className="flex justify-center mt-8">
+            <button
+              onClick={loadMore}
+              disabled={loadingMore}
+              className="px-6 py-2 bg-blue-600 text-white rounded-md hover:bg-blue-700 disabled:opacity-50"
+            >
+              {loadingMore ? 'Loading...' : 'Load more'}
+            </button>
+          </div>
+        )}
+      </>
     );
   };
 
@@ -116,8 +149,19 @@ export default function EventsPage() {
     <DashboardLayout>
       <div className="flex justify-between items-center mb-6">
         <div>
-          <h1 className="text-3xl font-bold text-gray-800">Upcoming Events</h1>
+          <h1 className="text-3xl font-bold text-gray-800">{when === 'past' ? 'Past Events' : 'Upcoming Events'}</h1>
           <p className="text-gray-600">Discover workshops, meetups, and networking opportunities.</p>
+          <div className="flex space-x-2 mt-3">
+            {['upcoming', 'past'].map(tab => (
+              <button
+                key={tab}
+                onClick={() => setWhen(tab)}
+                className={`px-3 py-1 rounded-md text-sm font-medium capitalize ${when === tab ? 'bg-blue-600 text-white' : 'bg-gray-200 text-gray-700 hover:bg-gray-300'}`}
+              >
+                {tab}
+              </button>
+            ))}
+          </div>
         </div>
         {/* Button is now role-aware */}
         {user && user.role !== 'student' && (
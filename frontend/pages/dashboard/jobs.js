@@ -11,6 +11,9 @@ import EditJobModal from '../../components/dashboard/EditJobModal';
 
 export default function JobsPage() {
   const [jobs, setJobs] = useState([]);
+  const [filters, setFilters] = useState({ search: '', job_type: '', location: '', company: '' });
+  const [nextPage, setNextPage] = useState(null); // Cursor URL for the next page
+  const [loadingMore, setLoadingMore] = useState(false);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState('');
   
@@ -27,8 +30,11 @@ export default function JobsPage() {
     setLoading(true);
     setError('');
     try {
-      const response = await api.get('/jobs/');
-      setJobs(response.data);
+      // Only send the filters that are filled in; the server does the searching
+      const params = Object.fromEntries(Object.entries(filters).filter(([, value]) => value.trim()));
+      const response = await api.get('/jobs/', { params });
+      setJobs(response.data.results);
+      setNextPage(response.data.next);
     } catch (err) {
       setError('Failed to load job postings.');
       console.error(err);
@@ -41,6 +47,31 @@ export default function JobsPage() {
     fetchJobs();
   }, []);
 
+  const handleFilterChange = (e) => {
+    setFilters(prev => ({ ...prev, [e.target.name]: e.target.value }));
+  };
+
+  const handleSearch = (e) => {
+    e.preventDefault();
+    fetchJobs();
+  };
+
+  // The list is paginated on the server, so fetch the next page on demand
+  const loadMore = async () => {
+    if (!nextPage) return;
+    setLoadingMore(true);
+    try {
+      const response = await api.get(nextPage);
+      setJobs(prev => [...prev, ...response.data.results]);
+      setNextPage(response.data.next);
+    } catch (err) {
+      setError('Failed to load more jobs.');
+      console.error(err);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const handleSaveJob = async (jobData) => {
     try {
       await api.post('/jobs/', jobData);
@@ -100,20 +131,33 @@ export default function JobsPage() {
   const renderContent = () => {
     if (loading) return <Spinner />;
     if (error && jobs.length === 0) return <p className="text-red-500 text-center">{error}</p>;
-    if (jobs.length === 0) return <p className="text-gray-500 text-center">No jobs posted.</p>;
+    if (jobs.length === 0) return <p className="text-gray-500 text-center">No jobs found.</p>;
 
     return (
-      <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-6">
-        {jobs.map(job => (
-          <JobCard 
-            key={job.id} 
-            job={job} 
-            onEdit={() => handleOpenEditModal(job)}
-            // Pass the delete handler down to the card
-            onDelete={() => handleOpenDeleteModal(job)}
-          />
-        ))}
-      </div>
+      <>
+        <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-6">
+          {jobs.map(job => (
+            <JobCard 
+              key={job.id} 
+              job={job} 
+              onEdit={() => handleOpenEditModal(job)}
+              // Pass the delete handler down to the card
+              onDelete={() => handleOpenDeleteModal(job)}
+            />
+          ))}
+        </div>
+        {nextPage && (
+          <div className="flex justify-center mt-8">
+            <button
+              onClick={loadMore}
+              disabled={loadingMore}
+              className="px-6 py-2 bg-blue-600 text-white rounded-md hover:bg-blue-700 disabled:opacity-50"
+            >
+              {loadingMore ? 'Loading...' : 'Load more'}
+            </button>
+          </div>
+        )}
+      </>
     );
   };
   
@@ -129,6 +173,21 @@ export default function JobsPage() {
         )}
       </div>
       
+      <form onSubmit={handleSearch} className="grid grid-cols-1 md:grid-cols-5 gap-3 mb-6">
+        <input name="search" value={filters.search} onChange={handleFilterChange} placeholder="Search title, company, skills..." className="md:col-span-2 p-2 border rounded-lg" />
+        <select name="job_type" value={filters.job_type} onChange={handleFilterChange} className="p-2 border rounded-lg">
+          <option value="">All types</option>
+          <option value="Full-Time">Full-Time</option>
+          <option value="Internship">Internship</option>
+          <option value="Part-Time">Part-Time</option>
+        </select>
+        <input name="location" value={filters.location} onChange={handleFilterChange} placeholder="Location" className="p-2 border rounded-lg" />
+        <div className="flex space-x-2">
+          <input name="company" value={filters.company} onChange={handleFilterChange} placeholder="Company" className="w-full p-2 border rounded-lg" />
+          <Button type="submit">Search</Button>
+        </div>
+      </form>
+
       {error && <p className="bg-red-100 text-red-700 p-3 rounded-lg mb-4">{error}</p>}
       
       {renderContent()}
@@ -51,8 +51,11 @@ export default function RegisterPage() {
     setError('');
     setSuccess('');
     try {
-      await api.post('/users/register/', formData);
-      setSuccess('Registration successful! Your application is now pending admin approval.');
+      const response = await api.post('/users/register/', formData);
+      // 202: the email belongs to an account the institution imported
+      setSuccess(response.status === 202
+        ? response.data.status
+        : 'Registration successful! Your application is now pending admin approval.');
     } catch (err) {
       const errorData = err.response?.data;
       if (errorData) {
@@ -0,0 +1,79 @@
+import { useState } from 'react';
+import { useRouter } from 'next/router';
+import Link from 'next/link';
+import api from '../lib/api';
+
+const Input = (props) => (
+  <input
+    {...props}
+    className="w-full px-4 py-2 border rounded-lg focus:outline-none focus:ring-2 focus:ring-blue-500 mt-1"
+    required
+  />
+);
+
+// Opened from the emailed link (?uid=...&token=...) sent to new accounts
+export default function SetPasswordPage() {
+  const router = useRouter();
+  const { uid, token } = router.query;
+  const [password, setPassword] = useState('');
+  const [confirm, setConfirm] = useState('');
+  const [error, setError] = useState('');
+  const [success, setSuccess] = useState('');
+  const [loading, setLoading] = useState(false);
+
+  const handleSubmit = async (e) => {
+    e.preventDefault();
+    setError('');
+    if (password !== confirm) {
+      setError('The passwords do not match.');
+      return;
+    }
+    setLoading(true);
+    try {
+      const response = await api.post('/users/set-password/', { uid, token, password });
+      setSuccess(`Your password has been set. You can now log in as ${response.data.username}.`);
+    } catch (err) {
+      const errorData = err.response?.data;
+      setError(errorData ? Object.values(errorData).flat().join(' ') : 'Could not set the password. Please try again.');
+      console.error(err);
+    } finally {
+      setLoading(false);
+    }
+  };
+
+  return (
+    <div className="min-h-screen bg-gray-100 flex items-center justify-center py-12">
+      <div className="bg-white p-8 rounded-lg shadow-md w-full max-w-md">
+        <h2 className="text-2xl font-bold text-center mb-6">Choose Your Password</h2>
+
+        {error && <p className="text-red-500 bg-red-100 p-3 rounded-lg text-center mb-4">{error}</p>}
+        {success && <p className="text-green-700 bg-green-100 p-3 rounded-lg text-center mb-4">{success}</p>}
+
+        {!success && (
+          <form onSubmit={handleSubmit} className="space-y-4">
+            <div>
+              <label htmlFor="password" className="block text-sm font-medium text-gray-700">New Password</label>
+              <Input id="password" type="password" value={password} onChange={(e) => setPassword(e.target.value)} disabled={loading} />
+            </div>
+            <div>
+              <label htmlFor="confirm" className="block text-sm font-medium text-gray-700">Confirm Password</label>
+              <Input id="confirm" type="password" value={confirm} onChange={(e) => setConfirm(e.target.value)} disabled={loading} />
+            </div>
+            <button
+              type="submit"
+              className="w-full py-2 bg-blue-600 text-white font-semibold rounded-lg hover:bg-blue-700 mt-6 transition-colors disabled:bg-gray-400"
+              disabled={loading || !uid || !token}
+            >
+              {loading ? 'Saving...' : 'Set Password'}
+            </button>
+          </form>
+        )}
+        <p className="text-center mt-4 text-sm">
+          <Link href="/login" className="text-blue-600 hover:underline">
+            Go to login
+          </Link>
+        </p>
+      </div>
+    </div>
+  );
+}